@@ -0,0 +1,188 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: An action based interface to the GameState so games can be played from code. Each action is a tuple
+# whose first item is the action type, legal_actions lists every action the current player can take, apply plays an
+# action and is_terminal checks whether the game is over
+
+from game_state import *
+
+# Action types, the items after the action type are:
+#   build_settlement, build_city - the vertex to build on
+#   build_road - the edge to build on
+#   move_robber - the tile to move the robber to
+#   bank_trade - the resource traded in and the resource received
+#   roll_dice - nothing, the dice are rolled by the GameState, or the total to use instead, to replay a recorded game
+BUILD_SETTLEMENT = "build_settlement"
+BUILD_ROAD = "build_road"
+BUILD_CITY = "build_city"
+ROLL_DICE = "roll_dice"
+MOVE_ROBBER = "move_robber"
+BANK_TRADE = "bank_trade"
+END_TURN = "end_turn"
+
+
+def new_game(player_names, seed=None, tile_types=None, tile_numbers=None):
+    """
+    Takes a list of player names in turn order and the seed of the game, which decides the board and the dice rolls
+    A board made beforehand, such as one from a BoardGenerator, is used instead of shuffling one by passing the type
+    and number token of every tile
+    Returns a GameState with the board set up, ready for the first setup settlement
+    """
+    state = GameState(seed)
+    state.create_board(tile_types, tile_numbers)
+    for player_name in player_names:
+        state.add_player(player_name)
+    return state
+
+
+def legal_actions(state):
+    """
+    Returns the list of every action the current player is allowed to take
+    """
+    phase = state.get_phase()
+    player_index = state.get_current_player()
+    board = state.get_board()
+
+    if phase == SETUP_SETTLEMENT_PHASE:
+        return [(BUILD_SETTLEMENT, vertex)
+                for vertex in mask_to_list(state.get_buildable_settlement_mask(player_index, setup=True))]
+
+    if phase == SETUP_ROAD_PHASE:
+        return [(BUILD_ROAD, edge) for edge in board.get_vertex_edges(state.get_last_settlement())
+                if state.get_edge_owner(edge) is None]
+
+    if phase == ROLL_PHASE:
+        return [(ROLL_DICE,)]
+
+    if phase == ROBBER_PHASE:
+        return [(MOVE_ROBBER, tile) for tile in range(board.get_number_of_tiles())
+                if tile != state.get_robber_tile()]
+
+    if phase == BUILD_PHASE:
+        actions = []
+
+        # checking the resources first, then reading the vertices and edges the GameState keeps for each player
+        if state.can_afford(player_index, SETTLEMENT_COST):
+            for vertex in mask_to_list(state.get_buildable_settlement_mask(player_index)):
+                actions.append((BUILD_SETTLEMENT, vertex))
+        if state.can_afford(player_index, CITY_COST):
+            for vertex in mask_to_list(state.get_settlement_mask(player_index)):
+                actions.append((BUILD_CITY, vertex))
+        if state.can_afford(player_index, ROAD_COST):
+            for edge in mask_to_list(state.get_buildable_road_mask(player_index)):
+                actions.append((BUILD_ROAD, edge))
+
+        for give in RESOURCE_TYPES:
+            if state.can_bank_trade(player_index, give):
+                for receive in RESOURCE_TYPES:
+                    if receive != give:
+                        actions.append((BANK_TRADE, give, receive))
+
+        actions.append((END_TURN,))
+        return actions
+
+    return []
+
+
+def has_valid_arguments(state, action):
+    """
+    Checks that the items after the action type are in range for the board, a vertex, edge or tile number the board
+    does not have or a resource that does not exist could otherwise change the state part way before failing
+    """
+    action_type = action[0]
+    if action_type == ROLL_DICE or action_type == END_TURN:
+        return True
+    board = state.get_board()
+    if action_type in (BUILD_SETTLEMENT, BUILD_CITY):
+        count = board.get_number_of_vertices()
+    elif action_type == BUILD_ROAD:
+        count = board.get_number_of_edges()
+    elif action_type == MOVE_ROBBER:
+        count = board.get_number_of_tiles()
+    elif action_type == BANK_TRADE:
+        return len(action) == 3 and action[1] in RESOURCE_TYPES and action[2] in RESOURCE_TYPES
+    else:
+        return True
+    return len(action) == 2 and isinstance(action[1], int) and 0 <= action[1] < count
+
+
+def apply(state, action):
+    """
+    Plays the action for the current player and moves the game on to its next phase
+    Returns True if the action was played, False if the action is not allowed, in which case the state is unchanged
+    """
+    phase = state.get_phase()
+    player_index = state.get_current_player()
+    if not action or not has_valid_arguments(state, action):
+        return False
+    action_type = action[0]
+
+    if phase == SETUP_SETTLEMENT_PHASE:
+        if action_type != BUILD_SETTLEMENT or not state.build_settlement(player_index, action[1], setup=True):
+            return False
+        state.set_last_settlement(action[1])
+        state.set_phase(SETUP_ROAD_PHASE)
+        return True
+
+    if phase == SETUP_ROAD_PHASE:
+        # the second road of setup has to be attached to the settlement that was just placed
+        if action_type != BUILD_ROAD or \
+                state.get_last_settlement() not in state.get_board().get_edge_vertices(action[1]):
+            return False
+        if not state.build_road(player_index, action[1], setup=True):
+            return False
+        state.advance_setup()
+        return True
+
+    if phase == ROLL_PHASE:
+        if action_type != ROLL_DICE:
+            return False
+        if len(action) > 1:
+            dice_roll = action[1]
+            if dice_roll < 2 or dice_roll > 12:
+                return False
+        else:
+            dice_roll = state.roll_dice()
+        state.set_last_roll(dice_roll)
+        if dice_roll == 7:
+            state.set_phase(ROBBER_PHASE)
+        else:
+            state.collect_resources(dice_roll)
+            state.set_phase(BUILD_PHASE)
+        return True
+
+    if phase == ROBBER_PHASE:
+        if action_type != MOVE_ROBBER or not state.move_robber(action[1]):
+            return False
+        state.set_phase(BUILD_PHASE)
+        return True
+
+    if phase == BUILD_PHASE:
+        if action_type == END_TURN:
+            state.end_turn()
+            return True
+
+        if action_type == BUILD_SETTLEMENT:
+            built = state.build_settlement(player_index, action[1])
+        elif action_type == BUILD_CITY:
+            built = state.build_city(player_index, action[1])
+        elif action_type == BUILD_ROAD:
+            built = state.build_road(player_index, action[1])
+        elif action_type == BANK_TRADE:
+            built = state.bank_trade(player_index, action[1], action[2])
+        else:
+            built = False
+
+        # the game ends as soon as the current player reaches the winning number of victory points
+        if built and state.get_winner() is not None:
+            state.set_phase(GAME_OVER_PHASE)
+        return built
+
+    return False
+
+
+def is_terminal(state):
+    """
+    Returns True if a player has won the game
+    """
+    return state.get_phase() == GAME_OVER_PHASE
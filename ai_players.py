@@ -0,0 +1,358 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Computer players for the catan project. Each computer player looks at a GameState and returns the
+# action it wants to play next, using the action interface in actions.py, so they can play in the GUI, in tournaments
+# or against each other without a display.
+# MCTSPlayer searches with Monte Carlo tree search: https://en.wikipedia.org/wiki/Monte_Carlo_tree_search
+# The search plays on a flat list search game from SearchRules, descending the tree and playing out straight from its
+# placement masks without the checks in apply, about 10,000 playouts a second from an empty board during setup and
+# about 20,000 a second once the game is under way on one core
+
+import inspect
+import math
+import random
+import time
+from actions import *
+from search_state import *
+
+# Settlements and cities are worth more than the resources used to build them, so when a playout is cut off each
+# resource card in a player's hand counts as this many victory points
+RESOURCE_CARD_VALUE = 0.1
+
+# A playout is cut off long before the game ends, so the buildings each player has collecting resources are also
+# scored, as this many victory points for each resource card they are expected to collect per dice roll
+PRODUCTION_VALUE = 2.0
+
+
+class RandomPlayer:
+    """
+    A computer player that plays a random legal action every time
+    Random is the random number generator used to choose the actions
+    If evaluate openings is True the setup settlements are placed on the best scoring vertex from choose_opening
+    instead of a random one
+    """
+    def __init__(self, seed=None, evaluate_openings=False):
+        self._random = random.Random(seed)
+        self._evaluate_openings = evaluate_openings
+
+    def choose_action(self, state):
+        """
+        Takes the GameState and returns one of the legal actions of the current player
+        """
+        if self._evaluate_openings and state.get_phase() == SETUP_SETTLEMENT_PHASE:
+            # imported here so NumPy is only needed by players that evaluate their openings
+            from opening_evaluator import choose_opening
+            return BUILD_SETTLEMENT, choose_opening(state)
+        return self._random.choice(legal_actions(state))
+
+
+class MCTSNode:
+    """
+    A node of the search tree, reached by playing a sequence of actions from the root
+    The dice make the game random, so a node stands for every state reached by its sequence of actions, and the legal
+    actions are worked out again from the state every time the node is visited
+    Player is the index of the player who played the action leading to this node
+    Children maps each action that has been tried to the node it leads to
+    Visits counts the playouts through this node and total reward adds up the player's reward from each of them
+    Mean reward and spread, 1 / sqrt(visits), are kept up to date with every reward so select child scores each child
+    with one multiplication
+    Tried actions is the last tuple of actions select child found a child for every one of
+    """
+    __slots__ = ("_player", "_children", "_visits", "_total_reward", "_mean_reward", "_spread", "_tried_actions")
+
+    def __init__(self, player):
+        self._player = player
+        self._children = {}
+        self._visits = 0
+        self._total_reward = 0.0
+        self._mean_reward = 0.0
+        self._spread = 0.0
+        self._tried_actions = None
+
+    def get_player(self):
+        return self._player
+
+    def get_children(self):
+        return self._children
+
+    def get_visits(self):
+        return self._visits
+
+    def get_total_reward(self):
+        return self._total_reward
+
+    def add_reward(self, reward):
+        self._visits += 1
+        self._total_reward += reward
+        self._mean_reward = self._total_reward / self._visits
+        self._spread = self._visits ** -0.5
+
+    def select_child(self, actions, exploration):
+        """
+        Returns the legal action whose child has the highest UCT score and that child, or None if any of the actions
+        has not been tried yet
+        The exploration constant is multiplied by sqrt(log(visits)) once here, so each child is scored with one
+        multiplication and an addition
+        """
+        children = self._children
+        # with fewer children than actions some action must be untried, however many of the children are for
+        # actions that are not legal this time
+        if len(children) < len(actions):
+            return None
+        exploration_term = exploration * math.sqrt(math.log(max(self._visits, 1)))
+        best_action = None
+        best_child = None
+        best_score = -1.0
+        if actions is self._tried_actions and len(children) == len(actions):
+            # the same tuple of actions as last time, the node has a child for each of them and no others, so the
+            # children are scored without looking up each action
+            for action, child in children.items():
+                score = child._mean_reward + exploration_term * child._spread
+                if score > best_score:
+                    best_action = action
+                    best_child = child
+                    best_score = score
+            return best_action, best_child
+
+        try:
+            for action in actions:
+                child = children[action]
+                score = child._mean_reward + exploration_term * child._spread
+                if score > best_score:
+                    best_action = action
+                    best_child = child
+                    best_score = score
+        except KeyError:
+            return None
+        if isinstance(actions, tuple):
+            self._tried_actions = actions
+        return best_action, best_child
+
+
+class MCTSPlayer:
+    """
+    A computer player that chooses its actions with open loop UCT Monte Carlo tree search
+
+    Time budget is the number of seconds the player can think about each move and iterations is the number of
+    playouts, the search stops at whichever runs out first, either can be None but not both
+    Exploration is the UCT constant that trades off trying new actions against repeating good ones
+    Playout rounds is the number of rounds of turns after the move being chosen that each playout is played to before
+    the position is scored, counting the turns played on the way down the tree
+    Random is the random number generator used by the search, the playouts and their dice
+    Last iterations holds the number of playouts run for the most recent move
+    If evaluate openings is True the setup settlements are placed on the best scoring vertex from choose_opening
+    without searching, the short playouts can not tell how much a settlement will collect over a whole game
+    """
+    def __init__(self, time_budget=1.0, iterations=None, exploration=0.5, playout_rounds=2, seed=None,
+                 evaluate_openings=False):
+        if time_budget is None and iterations is None:
+            time_budget = 1.0
+        self._time_budget = time_budget
+        self._iterations = iterations
+        self._exploration = exploration
+        self._playout_rounds = playout_rounds
+        self._random = random.Random(seed)
+        self._evaluate_openings = evaluate_openings
+        self._last_iterations = 0
+
+    def get_last_iterations(self):
+        return self._last_iterations
+
+    def choose_action(self, state):
+        """
+        Takes the GameState and returns the action of the current player that was tried most often by the search
+        The search plays on a search game from SearchRules, so the GameState itself is never changed
+        """
+        if self._evaluate_openings and state.get_phase() == SETUP_SETTLEMENT_PHASE:
+            # imported here so NumPy is only needed by players that evaluate their openings
+            from opening_evaluator import choose_opening
+            self._last_iterations = 0
+            return BUILD_SETTLEMENT, choose_opening(state)
+
+        actions = legal_actions(state)
+        if len(actions) == 1:
+            self._last_iterations = 0
+            return actions[0]
+
+        rules = SearchRules(state)
+        game = rules.create_game(state)
+        root = MCTSNode(None)
+        if self._time_budget is not None:
+            deadline = time.perf_counter() + self._time_budget
+        iteration = 0
+
+        while self._iterations is None or iteration < self._iterations:
+            # checking the clock every few playouts, since each playout is very quick
+            if self._time_budget is not None and iteration % 16 == 0 and time.perf_counter() >= deadline:
+                break
+            self.search(root, rules, game[:])
+            iteration += 1
+
+        self._last_iterations = iteration
+        children = root.get_children()
+        return max(actions, key=lambda action: children[action].get_visits() if action in children else -1)
+
+    def search(self, root, rules, game):
+        """
+        Runs one playout from the root, game is a copy of the root's search game that is played forward
+        Selects actions with UCT until reaching an action that has not been tried, plays it, finishes the game with a
+        quick playout and adds the rewards to every node that was visited
+        Only the actions that are a choice get a node, so rolling the dice and other forced actions do not deepen the
+        tree
+        """
+        node = root
+        path = []
+        random_number = self._random.random
+        exploration = self._exploration
+        play = rules.play
+        play_until_choice = rules.play_until_choice
+
+        # the dice and the actions that are the only legal one are played without adding a node
+        actions = play_until_choice(game, random_number)
+        while actions:
+            selected = node.select_child(actions, exploration)
+            if selected is None:
+                # drawing actions until one has not been tried picks each untried action with the same chance,
+                # without listing them all
+                children = node.get_children()
+                action = actions[int(random_number() * len(actions))]
+                while action in children:
+                    action = actions[int(random_number() * len(actions))]
+                child = MCTSNode(game[CURRENT_PLAYER])
+                children[action] = child
+                play(game, action)
+                path.append(child)
+                break
+
+            action, node = selected
+            play(game, action)
+            path.append(node)
+            actions = play_until_choice(game, random_number)
+
+        rewards = self.playout(rules, game)
+        root.add_reward(0.0)
+        for visited in path:
+            visited.add_reward(rewards[visited.get_player()])
+
+    def playout(self, rules, game):
+        """
+        Plays the game forward until playout rounds rounds have been played since the search started, with a quick
+        default policy instead of searching all legal actions, then returns each player's reward
+        Every playout is scored the same number of turns ahead of the move being chosen, however deep in the tree it
+        started, so the rewards of shallow and deep nodes can be compared
+        The default policy finishes setup on random open vertices, rolls the dice, moves the robber to a random tile,
+        builds a city or settlement whenever it can afford one and otherwise sometimes builds a road
+        """
+        random_number = self._random.random
+        turns_left = self._playout_rounds * rules.get_number_of_players() - game[TURNS_PLAYED]
+
+        rules.finish_setup(game, random_number)
+
+        # the search may stop part way through a turn, which is finished before playing whole turns
+        if turns_left > 0 and game[PHASE] == ROBBER_PHASE:
+            self.playout_robber(rules, game)
+        if turns_left > 0 and game[PHASE] == BUILD_PHASE:
+            self.playout_builds(rules, game)
+            if game[PHASE] != GAME_OVER_PHASE:
+                rules.end_turn(game)
+                turns_left -= 1
+
+        if game[PHASE] == ROLL_PHASE:
+            roll_dice = rules.roll_dice
+            playout_builds = self.playout_builds
+            end_turn = rules.end_turn
+            for turn in range(turns_left):
+                roll_dice(game, DICE_TOTALS[int(random_number() * 36)])
+                if game[PHASE] == ROBBER_PHASE:
+                    self.playout_robber(rules, game)
+                playout_builds(rules, game)
+                if game[PHASE] == GAME_OVER_PHASE:
+                    break
+                end_turn(game)
+        return self.evaluate(rules, game)
+
+    def playout_robber(self, rules, game):
+        """
+        Moves the robber to a random tile other than the one it is on during a playout
+        """
+        tile = int(self._random.random() * (rules.get_number_of_tiles() - 1))
+        if tile >= game[ROBBER_TILE]:
+            tile += 1
+        rules.move_robber(game, tile)
+
+    def playout_builds(self, rules, game):
+        """
+        Builds for the current player during a playout, reading the vertices and edges the player can build on from
+        the search game's masks so the board is never searched
+        """
+        player_index = game[CURRENT_PLAYER]
+        start = PLAYERS_START + player_index * PLAYER_SIZE
+        options = rules.get_build_options(game, start)
+        if not options:
+            return
+        can_build_settlement, can_build_city, can_build_road, trade_resources = options
+
+        if can_build_city and game[start + SETTLEMENT_MASK]:
+            settlements = mask_to_list(game[start + SETTLEMENT_MASK])
+            rules.build_city(game, player_index, settlements[int(self._random.random() * len(settlements))])
+            return
+
+        if can_build_settlement:
+            # the lowest buildable vertex is read straight from the mask instead of listing every vertex
+            vertices = game[OPEN_MASK] & game[start + ROAD_END_MASK]
+            if vertices:
+                rules.build_settlement(game, player_index, (vertices & -vertices).bit_length() - 1)
+                return
+
+        if can_build_road and game[start + BUILDABLE_ROAD_MASK] and self._random.random() < 0.5:
+            edges = mask_to_list(game[start + BUILDABLE_ROAD_MASK])
+            rules.build_road(game, player_index, edges[int(self._random.random() * len(edges))])
+
+    def evaluate(self, rules, game):
+        """
+        Returns a list with the reward of each player for the search game, between 0 and 1
+        The winner of a finished game gets 1 and everyone else 0, otherwise each player's share of the total score,
+        where the score is their victory points plus RESOURCE_CARD_VALUE for each resource card they hold and
+        PRODUCTION_VALUE for each resource card they are expected to collect per roll
+        """
+        number_of_players = rules.get_number_of_players()
+        # only the player whose turn it is can build, so the game can only have been won by them
+        if game[PHASE] == GAME_OVER_PHASE:
+            rewards = [0.0] * number_of_players
+            rewards[game[CURRENT_PLAYER]] = 1.0
+            return rewards
+
+        scores = rules.get_production(game)
+        for player_index in range(number_of_players):
+            start = PLAYERS_START + player_index * PLAYER_SIZE
+            scores[player_index] = game[start + VICTORY_POINTS] + RESOURCE_CARD_VALUE * \
+                sum(game[start:start + NUMBER_OF_RESOURCES]) + PRODUCTION_VALUE * scores[player_index]
+
+        total = sum(scores)
+        if total == 0:
+            return [1.0 / number_of_players] * number_of_players
+        return [score / total for score in scores]
+
+
+# Names of the computer player types that can be chosen for a game
+AI_PLAYER_TYPES = {"random": RandomPlayer, "mcts": MCTSPlayer}
+
+
+def get_player_options(player_type):
+    """
+    Returns the names of the options a computer player type takes, the parameters of its constructor
+    """
+    parameters = inspect.signature(AI_PLAYER_TYPES[player_type].__init__).parameters
+    return [name for name in parameters if name != "self"]
+
+
+def create_ai_player(player_type, **options):
+    """
+    Takes the name of a computer player type and returns a new computer player of that type, the options are passed
+    to its constructor
+    Returns None if there is no computer player with that name
+    """
+    player_class = AI_PLAYER_TYPES.get(player_type)
+    if player_class is None:
+        return None
+    return player_class(**options)
@@ -0,0 +1,107 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Loads every image the game uses once and keeps it ready to draw, and caches the surfaces of rendered
+# text so the same words are not rendered again each time the board is redrawn.
+# Images are converted to the pixel format of the display when they are loaded, which makes drawing them much faster:
+# https://www.pygame.org/docs/ref/surface.html#pygame.Surface.convert
+
+import os
+from collections import OrderedDict
+import pygame
+from global_vars import *
+
+# Folder holding the images, found next to this file so the game can be started from any folder on any platform
+IMAGE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+
+# File types that are loaded, images with transparency are kept with their alpha channel
+IMAGE_EXTENSIONS = (".jpg", ".png")
+ALPHA_EXTENSIONS = (".png",)
+
+# Most rendered text surfaces kept at once, the least recently used one is dropped when the cache is full
+TEXT_CACHE_SIZE = 256
+
+
+class AssetManager:
+    """
+    Holds the images and rendered text of the game
+    Images maps the name of each image file, without its extension, to the converted surface
+    Text cache maps (text, font, colour) to the rendered surface, in order from the least to the most recently used
+    Cache size is the most surfaces the text cache holds, hits and misses count how often rendered text was found in
+    the cache or had to be rendered
+    """
+    def __init__(self, directory=IMAGE_DIRECTORY, text_cache_size=TEXT_CACHE_SIZE):
+        self._images = {}
+        self._text_cache = OrderedDict()
+        self._cache_size = text_cache_size
+        self._hits = 0
+        self._misses = 0
+        self.load_images(directory)
+
+    def load_images(self, directory):
+        """
+        Loads and converts every image in directory
+        """
+        for file_name in sorted(os.listdir(directory)):
+            name, extension = os.path.splitext(file_name)
+            if extension.lower() not in IMAGE_EXTENSIONS:
+                continue
+            image = pygame.image.load(os.path.join(directory, file_name))
+            if extension.lower() in ALPHA_EXTENSIONS:
+                self._images[name] = image.convert_alpha()
+            else:
+                self._images[name] = image.convert()
+
+    def get_image(self, name):
+        """
+        Returns the surface of the image whose file is called name, without the extension
+        Raises KeyError if there is no image with that name
+        """
+        image = self._images.get(name)
+        if image is None:
+            raise KeyError("no image named " + name + " in " + IMAGE_DIRECTORY)
+        return image
+
+    def get_image_names(self):
+        return list(self._images)
+
+    def render_text(self, text, font=GAME_FONT, colour=BLACK):
+        """
+        Returns the surface of text rendered with font in colour, taken from the cache when it has been rendered before
+        The surface is shared with every other caller, so it should only be drawn and never changed
+        """
+        key = (text, font, colour)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._text_cache.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        surface = font.render(text, True, colour)
+        self._text_cache[key] = surface
+        if len(self._text_cache) > self._cache_size:
+            self._text_cache.popitem(last=False)
+        return surface
+
+    def get_text_cache_size(self):
+        return len(self._text_cache)
+
+    def get_text_cache_hits(self):
+        return self._hits
+
+    def get_text_cache_misses(self):
+        return self._misses
+
+
+# The images are the same for the whole game, so they are only loaded once
+_assets = None
+
+
+def get_assets():
+    """
+    Returns the AssetManager of the game, loading every image the first time it is needed
+    """
+    global _assets
+    if _assets is None:
+        _assets = AssetManager()
+    return _assets
@@ -0,0 +1,223 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Simulates thousands of games in lockstep with NumPy arrays instead of Python loops over players.
+# Each game's board, robber, settlements and resources are rows of shared arrays and every dice roll pays out all
+# games at once. Requires NumPy.
+
+import numpy as np
+from game_state import RESOURCE_TYPES, TILE_TYPES, NUMBER_TOKENS, DESERT
+from board_topology import get_topology
+
+
+class BatchSimulator:
+    """
+    Holds the state of many games in NumPy arrays and advances every game one dice roll at a time
+
+    Tile resource is a (games, tiles) array of the index in RESOURCE_TYPES of each tile's resource, -1 for the desert
+    Tile number is a (games, tiles) array of the number token on each tile, 0 for the desert
+    Robber is a (games,) array of the tile the robber is on
+    Vertex owner is a (games, vertices) array of the player who built on each vertex, -1 if it is empty
+    Vertex level is a (games, vertices) array that is 1 for a settlement and 2 for a city, 0 if it is empty
+    Resources is a (games, players, resources) array of the number of each resource held by each player
+    Incidence is the (tiles, vertices) matrix that is 1 where a vertex is a corner of a tile, shared by every game
+    Tile payout is a (games, players, tiles) array of how many resources each player collects when a tile produces,
+    rebuilt from the incidence matrix whenever a settlement or city is built, and resource one hot is the
+    (games, tiles, resources) array that is 1 in the column of each tile's resource
+    """
+    def __init__(self, number_of_games, number_of_players=4, seed=None):
+        topology = get_topology()
+        self._number_of_games = number_of_games
+        self._number_of_players = number_of_players
+        self._rng = np.random.default_rng(seed)
+
+        number_of_tiles = topology.get_number_of_tiles()
+        number_of_vertices = topology.get_number_of_vertices()
+
+        self._incidence = np.zeros((number_of_tiles, number_of_vertices), dtype=np.int32)
+        for tile in range(number_of_tiles):
+            self._incidence[tile, topology.get_tile_vertices(tile)] = 1
+
+        self._adjacency = np.zeros((number_of_vertices, number_of_vertices), dtype=np.int32)
+        for vertex in range(number_of_vertices):
+            self._adjacency[vertex, topology.get_vertex_neighbours(vertex)] = 1
+
+        self._tile_resource = np.full((number_of_games, number_of_tiles), -1, dtype=np.int32)
+        self._tile_number = np.zeros((number_of_games, number_of_tiles), dtype=np.int32)
+        self._robber = np.zeros(number_of_games, dtype=np.int32)
+        self._vertex_owner = np.full((number_of_games, number_of_vertices), -1, dtype=np.int32)
+        self._vertex_level = np.zeros((number_of_games, number_of_vertices), dtype=np.int32)
+        self._resources = np.zeros((number_of_games, number_of_players, len(RESOURCE_TYPES)), dtype=np.int32)
+        self._tile_payout = None
+        self._resource_one_hot = None
+
+    def get_number_of_games(self):
+        return self._number_of_games
+
+    def get_tile_resource(self):
+        return self._tile_resource
+
+    def get_tile_number(self):
+        return self._tile_number
+
+    def get_robber(self):
+        return self._robber
+
+    def get_vertex_owner(self):
+        return self._vertex_owner
+
+    def get_vertex_level(self):
+        return self._vertex_level
+
+    def get_resources(self):
+        return self._resources
+
+    def get_victory_points(self):
+        """
+        Returns a (games, players) array of victory points, one for each settlement and two for each city
+        """
+        owner_one_hot = self._vertex_owner[:, :, None] == np.arange(self._number_of_players)
+        return (owner_one_hot * self._vertex_level[:, :, None]).sum(axis=1)
+
+    @classmethod
+    def from_states(cls, states, seed=None):
+        """
+        Takes a list of GameState objects with the same number of players and copies their boards, robbers,
+        buildings and resources into a new BatchSimulator
+        """
+        batch = cls(len(states), states[0].get_number_of_players(), seed)
+
+        for game, state in enumerate(states):
+            board = state.get_board()
+            for tile in range(board.get_number_of_tiles()):
+                tile_type = board.get_tile_type(tile)
+                if tile_type != DESERT:
+                    batch._tile_resource[game, tile] = RESOURCE_TYPES.index(tile_type)
+                    batch._tile_number[game, tile] = board.get_tile_number(tile)
+            batch._robber[game] = state.get_robber_tile()
+
+            for vertex in range(board.get_number_of_vertices()):
+                owner = state.get_vertex_owner(vertex)
+                if owner is not None:
+                    batch._vertex_owner[game, vertex] = owner
+                    batch._vertex_level[game, vertex] = 2 if state.is_city(vertex) else 1
+
+            # the state keeps its resources in one flat list with a row for each player, like the batch array
+            batch._resources[game] = np.array(state.get_resource_counts()).reshape(batch._resources.shape[1:])
+
+        return batch
+
+    def create_boards(self):
+        """
+        Shuffles a new board for every game, the same way Board.create_tiles does, with the robber on the desert
+        """
+        number_of_tiles = self._tile_number.shape[1]
+        type_ids = np.array([RESOURCE_TYPES.index(tile_type) for tile_type in TILE_TYPES], dtype=np.int32)
+        numbers = np.array(NUMBER_TOKENS, dtype=np.int32)
+
+        # a random permutation for each game is the argsort of a row of random numbers
+        positions = np.argsort(self._rng.random((self._number_of_games, number_of_tiles)), axis=1)
+        type_order = np.argsort(self._rng.random((self._number_of_games, len(type_ids))), axis=1)
+        number_order = np.argsort(self._rng.random((self._number_of_games, len(numbers))), axis=1)
+
+        self._tile_resource[:] = -1
+        self._tile_number[:] = 0
+        resource_positions = positions[:, :len(type_ids)]
+        np.put_along_axis(self._tile_resource, resource_positions, type_ids[type_order], axis=1)
+        np.put_along_axis(self._tile_number, resource_positions, numbers[number_order], axis=1)
+        self._robber[:] = positions[:, -1]
+        self._tile_payout = None
+        self._resource_one_hot = None
+
+    def set_boards(self, tile_resource, tile_number):
+        """
+        Sets the board of every game from (games, tiles) tile resource and tile number arrays, such as the fair boards
+        of a BoardGenerator, with the robber on the desert
+        """
+        self._tile_resource[:] = tile_resource
+        self._tile_number[:] = tile_number
+        self._robber[:] = np.argmin(self._tile_resource, axis=1)
+        self._tile_payout = None
+        self._resource_one_hot = None
+
+    def place_random_settlements(self, settlements_per_player=2):
+        """
+        Plays the setup settlements of every game at once, in the same snake order as the GameState, picking a random
+        vertex for each player that is not on or next to another settlement
+        Roads do not change which resources are collected, so they are not placed
+        """
+        order = list(range(self._number_of_players))
+        draft = []
+        for round_number in range(settlements_per_player):
+            draft += order if round_number % 2 == 0 else order[::-1]
+
+        games = np.arange(self._number_of_games)
+        for player_index in draft:
+            occupied = (self._vertex_owner >= 0).astype(np.int32)
+            blocked = (occupied + occupied @ self._adjacency) > 0
+            scores = self._rng.random(occupied.shape)
+            scores[blocked] = -1.0
+            vertex = np.argmax(scores, axis=1)
+            self._vertex_owner[games, vertex] = player_index
+            self._vertex_level[games, vertex] = 1
+
+        self._tile_payout = None
+
+    def update_tile_payout(self):
+        """
+        Rebuilds the (games, players, tiles) payout array from the incidence matrix and the buildings of each game
+        """
+        owner_one_hot = self._vertex_owner[:, :, None] == np.arange(self._number_of_players)
+        weighted = (owner_one_hot * self._vertex_level[:, :, None]).astype(np.int32)
+        self._tile_payout = np.einsum("tv,nvp->npt", self._incidence, weighted)
+        self._resource_one_hot = (self._tile_resource[:, :, None] == np.arange(len(RESOURCE_TYPES))).astype(np.int32)
+
+    def roll_dice(self):
+        """
+        Returns a (games,) array with the sum of two six-sided dice for every game
+        """
+        return self._rng.integers(1, 7, self._number_of_games) + self._rng.integers(1, 7, self._number_of_games)
+
+    def collect_resources(self, dice_rolls):
+        """
+        Takes a (games,) array of dice rolls and pays out every tile with the rolled number that does not have the
+        robber on it, returns the (games, players, resources) array of resources collected
+        """
+        if self._tile_payout is None:
+            self.update_tile_payout()
+
+        number_of_tiles = self._tile_number.shape[1]
+        producing = (self._tile_number == dice_rolls[:, None]) & \
+            (np.arange(number_of_tiles) != self._robber[:, None])
+
+        # scattering each producing tile's payout onto the column of its resource
+        produced = self._resource_one_hot * producing[:, :, None]
+        collected = np.matmul(self._tile_payout, produced)
+        self._resources += collected
+        return collected
+
+    def move_robbers(self, games):
+        """
+        Takes a boolean (games,) array and moves the robber of each selected game to a random different tile
+        """
+        number_of_tiles = self._tile_number.shape[1]
+        new_tile = self._rng.integers(0, number_of_tiles - 1, self._number_of_games)
+        new_tile = np.where(new_tile >= self._robber, new_tile + 1, new_tile)
+        self._robber = np.where(games, new_tile, self._robber).astype(np.int32)
+
+    def step(self):
+        """
+        Advances every game by one dice roll, games that roll a 7 move their robber and the rest collect resources
+        Returns the (games,) array of dice rolls
+        """
+        dice_rolls = self.roll_dice()
+        sevens = dice_rolls == 7
+        self.move_robbers(sevens)
+        self.collect_resources(dice_rolls)
+        return dice_rolls
+
+    def run(self, number_of_rolls):
+        """
+        Advances every game by number_of_rolls dice rolls
+        """
+        for roll_number in range(number_of_rolls):
+            self.step()
@@ -0,0 +1,263 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Generates fair boards in large batches with NumPy arrays. Boards are shuffled the same way as
+# BatchSimulator.create_boards, then every board that breaks a fairness rule is repaired by swapping a pair of tiles
+# picked from the tile adjacency table, instead of being shuffled again until it happens to be fair. Only boards that
+# still break a rule after MAX_REPAIR_ROUNDS repairs are shuffled again. Requires NumPy.
+#
+# The fairness rules, each can be turned off by passing None:
+#   separate red numbers - the 6 and 8 number tokens, the most rolled, are never on neighbouring tiles
+#   max resource pips - no resource has more than this many pips in total on its tiles, so no resource is rolled
+#       much more often than the others
+#   max same neighbours - no tile has more than this many neighbours of its own resource, so each resource is spread
+#       across the board
+
+import numpy as np
+from game_state import RESOURCE_TYPES, TILE_TYPES, NUMBER_TOKENS, DESERT
+from board_topology import get_topology
+
+# Number of ways two six-sided dice roll each total, indexed by the number token, 0 for the desert
+PIPS = np.array([0, 0, 1, 2, 3, 4, 5, 0, 5, 4, 3, 2, 1], dtype=np.int32)
+RED_NUMBERS = [6, 8]
+
+# Default fairness rules
+MAX_RESOURCE_PIPS = 15
+MAX_SAME_NEIGHBOURS = 1
+
+# Repairs tried on a board before it is shuffled again
+MAX_REPAIR_ROUNDS = 12
+
+
+class BoardGenerator:
+    """
+    Generates boards that keep the fairness rules
+
+    Separate red numbers is True if 6 and 8 can not be neighbours, max resource pips and max same neighbours are the
+    limits of the other rules, a rule is not checked if it is None
+    Adjacency is the (tiles, tiles) adjacency table from the BoardTopology, 1 where two tiles share a side, kept as
+    floats so counting the neighbours of every tile on every board is one matrix product
+    Boards are drawn from a NumPy generator made from seed, so the same seed generates the same boards
+    """
+    def __init__(self, seed=None, separate_red_numbers=True, max_resource_pips=MAX_RESOURCE_PIPS,
+                 max_same_neighbours=MAX_SAME_NEIGHBOURS):
+        total_pips = int(PIPS[NUMBER_TOKENS].sum())
+        if max_resource_pips is not None and max_resource_pips * len(RESOURCE_TYPES) < total_pips:
+            raise ValueError("max resource pips is too low for the pips on the board")
+
+        topology = get_topology()
+        number_of_tiles = topology.get_number_of_tiles()
+        self._separate_red_numbers = separate_red_numbers
+        self._max_resource_pips = max_resource_pips
+        self._max_same_neighbours = max_same_neighbours
+        self._rng = np.random.default_rng(seed)
+
+        self._adjacency = np.zeros((number_of_tiles, number_of_tiles), dtype=np.float32)
+        for tile in range(number_of_tiles):
+            self._adjacency[tile, topology.get_tile_neighbours(tile)] = 1.0
+
+    def shuffle(self, number_of_boards):
+        """
+        Returns the (boards, tiles) tile resource and tile number arrays of newly shuffled boards, the index in
+        RESOURCE_TYPES of each tile's resource, -1 for the desert, and the number token of each tile, 0 for the desert
+        """
+        number_of_tiles = self._adjacency.shape[0]
+        type_ids = np.array([RESOURCE_TYPES.index(tile_type) for tile_type in TILE_TYPES], dtype=np.int32)
+        numbers = np.array(NUMBER_TOKENS, dtype=np.int32)
+
+        # a random permutation for each board is the argsort of a row of random numbers
+        positions = np.argsort(self._rng.random((number_of_boards, number_of_tiles)), axis=1)
+        type_order = np.argsort(self._rng.random((number_of_boards, len(type_ids))), axis=1)
+        number_order = np.argsort(self._rng.random((number_of_boards, len(numbers))), axis=1)
+
+        tile_resource = np.full((number_of_boards, number_of_tiles), -1, dtype=np.int32)
+        tile_number = np.zeros((number_of_boards, number_of_tiles), dtype=np.int32)
+        resource_positions = positions[:, :len(type_ids)]
+        np.put_along_axis(tile_resource, resource_positions, type_ids[type_order], axis=1)
+        np.put_along_axis(tile_number, resource_positions, numbers[number_order], axis=1)
+        return tile_resource, tile_number
+
+    def count_neighbours(self, matches, excluded_tile=None):
+        """
+        Takes a (boards, tiles) boolean array and returns a (boards, tiles) array of how many neighbours of each tile
+        are True, looked up in the adjacency table, excluded tile is a (boards,) array of a tile on each board that is
+        not counted, or None to count every neighbour
+        """
+        counts = matches.astype(np.float32) @ self._adjacency
+        if excluded_tile is not None:
+            counts -= matches[np.arange(len(excluded_tile)), excluded_tile][:, None] * self._adjacency[excluded_tile]
+        return counts.astype(np.int32)
+
+    def find_red_conflicts(self, tile_number):
+        """
+        Returns a (boards, tiles) boolean array that is True for each 6 or 8 next to another 6 or 8
+        """
+        red = (tile_number == RED_NUMBERS[0]) | (tile_number == RED_NUMBERS[1])
+        return red & (self.count_neighbours(red) > 0)
+
+    def get_resource_pips(self, tile_resource, tile_number):
+        """
+        Returns a (boards, resources) array of the total pips on the tiles of each resource
+        """
+        number_of_boards = tile_resource.shape[0]
+        number_of_resources = len(RESOURCE_TYPES)
+        # the desert's pips are 0, so it can be counted with any resource
+        bins = np.arange(number_of_boards)[:, None] * number_of_resources + np.maximum(tile_resource, 0)
+        resource_pips = np.bincount(bins.ravel(), weights=PIPS[tile_number].ravel(),
+                                    minlength=number_of_boards * number_of_resources)
+        return resource_pips.reshape(number_of_boards, number_of_resources).astype(np.int32)
+
+    def get_same_neighbours(self, tile_resource):
+        """
+        Returns a (boards, tiles) array of how many neighbours of each tile have the same resource, 0 for the desert
+        """
+        same = np.zeros(tile_resource.shape, dtype=np.int32)
+        for resource in range(len(RESOURCE_TYPES)):
+            matches = tile_resource == resource
+            same += matches * self.count_neighbours(matches)
+        return same
+
+    def check_boards(self, tile_resource, tile_number):
+        """
+        Returns a (boards,) boolean array that is True for each board that keeps every fairness rule
+        """
+        fair = np.ones(tile_resource.shape[0], dtype=bool)
+        if self._separate_red_numbers:
+            fair &= ~self.find_red_conflicts(tile_number).any(axis=1)
+        if self._max_resource_pips is not None:
+            fair &= (self.get_resource_pips(tile_resource, tile_number) <= self._max_resource_pips).all(axis=1)
+        if self._max_same_neighbours is not None:
+            fair &= (self.get_same_neighbours(tile_resource) <= self._max_same_neighbours).all(axis=1)
+        return fair
+
+    def pick_tiles(self, candidates):
+        """
+        Takes a (boards, tiles) boolean array of candidate tiles and returns a random candidate of each board, and a
+        (boards,) boolean array that is False for the boards without any candidate
+        """
+        scores = np.where(candidates, self._rng.random(candidates.shape) + 1.0, 0.0)
+        return np.argmax(scores, axis=1), candidates.any(axis=1)
+
+    def repair_red_numbers(self, tile_resource, tile_number):
+        """
+        Moves a 6 or 8 that is next to another one onto a random tile that has no 6 or 8 around it, on every board
+        with a conflict, by swapping the number tokens of the two tiles
+        """
+        conflicts = self.find_red_conflicts(tile_number)
+        boards = np.flatnonzero(conflicts.any(axis=1))
+        if len(boards) == 0:
+            return
+        numbers = tile_number[boards]
+        red = (numbers == RED_NUMBERS[0]) | (numbers == RED_NUMBERS[1])
+        tile, found = self.pick_tiles(conflicts[boards])
+
+        # the red neighbours of each candidate, not counting the tile the number is moved away from
+        red_neighbours = self.count_neighbours(red, tile)
+        candidates = ~red & (tile_resource[boards] >= 0) & (red_neighbours == 0)
+        candidate, found = self.pick_tiles(candidates)
+        self.swap_tiles(tile_number, boards[found], tile[found], candidate[found])
+
+    def repair_resource_pips(self, tile_resource, tile_number):
+        """
+        On every board with a resource over the pip limit, swaps the resource of its most rolled tile with a tile of
+        another resource with fewer pips, chosen so that resource stays under the limit
+        """
+        resource_pips = self.get_resource_pips(tile_resource, tile_number)
+        boards = np.flatnonzero((resource_pips > self._max_resource_pips).any(axis=1))
+        if len(boards) == 0:
+            return
+        resources = tile_resource[boards]
+        pips = PIPS[tile_number[boards]]
+        resource_pips = resource_pips[boards]
+        rows = np.arange(len(boards))
+
+        over_resource = np.argmax(resource_pips, axis=1)
+        tile = np.argmax(np.where(resources == over_resource[:, None], pips, -1), axis=1)
+        tile_pips = pips[rows, tile]
+
+        # the other resource gains the difference in pips when the two tiles swap resources
+        other_pips = np.take_along_axis(resource_pips, np.maximum(resources, 0), axis=1)
+        candidates = (resources >= 0) & (resources != over_resource[:, None]) & (pips < tile_pips[:, None]) & \
+            (other_pips - pips + tile_pips[:, None] <= self._max_resource_pips)
+        candidate, found = self.pick_tiles(candidates)
+        self.swap_tiles(tile_resource, boards[found], tile[found], candidate[found])
+
+    def repair_same_neighbours(self, tile_resource):
+        """
+        On every board with a tile touching too many tiles of its own resource, swaps that tile's resource with a tile
+        of another resource where it would not break the rule
+        """
+        same = self.get_same_neighbours(tile_resource)
+        boards = np.flatnonzero((same > self._max_same_neighbours).any(axis=1))
+        if len(boards) == 0:
+            return
+        resources = tile_resource[boards]
+        rows = np.arange(len(boards))
+        tile, found = self.pick_tiles(same[boards] > self._max_same_neighbours)
+        moved_resource = resources[rows, tile]
+
+        # how many neighbours of each candidate have the moved resource, not counting the tile it is moved away from
+        moved_neighbours = self.count_neighbours(resources == moved_resource[:, None], tile)
+        candidates = (resources >= 0) & (resources != moved_resource[:, None]) & \
+            (moved_neighbours <= self._max_same_neighbours)
+        candidate, found = self.pick_tiles(candidates)
+        self.swap_tiles(tile_resource, boards[found], tile[found], candidate[found])
+
+    def swap_tiles(self, array, boards, tiles, other_tiles):
+        """
+        Swaps the values of two tiles in a (boards, tiles) array, on each of the given boards
+        """
+        values = array[boards, tiles]
+        array[boards, tiles] = array[boards, other_tiles]
+        array[boards, other_tiles] = values
+
+    def repair_boards(self, tile_resource, tile_number):
+        """
+        Repairs every board that breaks a fairness rule, one swap for each broken rule
+        """
+        if self._separate_red_numbers:
+            self.repair_red_numbers(tile_resource, tile_number)
+        if self._max_resource_pips is not None:
+            self.repair_resource_pips(tile_resource, tile_number)
+        if self._max_same_neighbours is not None:
+            self.repair_same_neighbours(tile_resource)
+
+    def generate(self, number_of_boards):
+        """
+        Returns the (boards, tiles) tile resource and tile number arrays of number_of_boards fair boards, the same
+        arrays as a BatchSimulator
+        """
+        tile_resource, tile_number = self.shuffle(number_of_boards)
+        unfair = np.flatnonzero(~self.check_boards(tile_resource, tile_number))
+        repair_round = 0
+        while len(unfair) > 0:
+            resources = tile_resource[unfair]
+            numbers = tile_number[unfair]
+            if repair_round == MAX_REPAIR_ROUNDS:
+                # the boards that could not be repaired are shuffled again and repaired from the start
+                resources, numbers = self.shuffle(len(unfair))
+                repair_round = 0
+            else:
+                self.repair_boards(resources, numbers)
+                repair_round += 1
+
+            tile_resource[unfair] = resources
+            tile_number[unfair] = numbers
+            unfair = unfair[~self.check_boards(resources, numbers)]
+        return tile_resource, tile_number
+
+    def create_tiles(self):
+        """
+        Returns the tile types and tile numbers of one fair board, as lists GameState.create_board takes
+        """
+        tile_resource, tile_number = self.generate(1)
+        return board_tiles(tile_resource[0], tile_number[0])
+
+
+def board_tiles(tile_resource, tile_number):
+    """
+    Takes one row of the tile resource and tile number arrays and returns the list of tile types and the list of
+    number tokens of the board, with DESERT and None for the desert, as GameState.create_board takes them
+    """
+    tile_types = [DESERT if resource < 0 else RESOURCE_TYPES[resource] for resource in tile_resource.tolist()]
+    tile_numbers = [number or None for number in tile_number.tolist()]
+    return tile_types, tile_numbers
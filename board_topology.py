@@ -0,0 +1,288 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: The fixed shape of the catan board, built from axial hex coordinates instead of screen pixels.
+# Tiles, vertices and edges are given integer ids and every adjacency between them is stored in a table, the tables
+# are computed once and shared by every game.
+# The tables can be saved to a cache file so other processes can load them instead of building them again.
+# Hex coordinates follow: https://www.redblobgames.com/grids/hexagons/
+
+import os
+import pickle
+
+# Number of rings of tiles around the center tile
+BOARD_RADIUS = 2
+
+# Every vertex of a pointy-top hex grid is either the top corner or the bottom corner of exactly one hex
+NORTH = "N"
+SOUTH = "S"
+
+# Changes whenever the tables or their order change, so old cache files are not loaded
+TOPOLOGY_CACHE_VERSION = 1
+
+# Names of the tables saved to the cache file
+TABLE_NAMES = ["tile_coords", "vertex_coords", "tile_vertices", "vertex_tiles", "tile_neighbours",
+               "vertex_neighbours", "vertex_edges", "edge_vertices"]
+
+
+def hex_corner_vertices(q, r):
+    """
+    Returns the 6 corners of the hex at axial coordinates (q, r), starting at the top corner and going clockwise
+    Each corner is written as the (q, r, NORTH or SOUTH) of the hex it is the top or bottom corner of
+    """
+    return [(q, r, NORTH), (q + 1, r - 1, SOUTH), (q, r + 1, NORTH),
+            (q, r, SOUTH), (q - 1, r + 1, NORTH), (q, r - 1, SOUTH)]
+
+
+class BoardTopology:
+    """
+    The tiles, vertices and edges of a hexagonal board of the given radius and the adjacency between them
+
+    Tile coords holds the axial (q, r) coordinates of each tile, in rows from top to bottom and left to right
+    Vertex coords holds the (q, r, NORTH or SOUTH) coordinates of each vertex, numbered in the order they are found
+    going around the corners of each tile
+    tile_vertices holds the 6 vertices around each tile, vertex_tiles holds the tiles touching each vertex and
+    tile_neighbours holds the tiles sharing a side with each tile
+    vertex_neighbours holds the vertices one road away from each vertex, vertex_edges holds the edges touching each
+    vertex, and edge_vertices holds the two vertices at the ends of each edge
+    The lookups map coordinates, or a pair of vertices, back to their ids
+    The masks hold the same adjacency as bitmasks, where bit n is set for vertex or edge n, so the GameState can test
+    a whole neighbourhood with one integer operation
+    """
+    def __init__(self, radius=BOARD_RADIUS, tables=None):
+        self._radius = radius
+        self._tile_coords = []
+        self._vertex_coords = []
+        self._tile_vertices = []
+        self._vertex_tiles = []
+        self._tile_neighbours = []
+        self._vertex_neighbours = []
+        self._vertex_edges = []
+        self._edge_vertices = []
+        self._tile_lookup = {}
+        self._vertex_lookup = {}
+        self._edge_lookup = {}
+        self._vertex_neighbour_masks = ()
+        self._vertex_edge_masks = ()
+
+        if tables is None:
+            self.create_tables()
+        else:
+            self.set_tables(tables)
+        self.create_masks()
+
+    def get_radius(self):
+        return self._radius
+
+    def get_number_of_tiles(self):
+        return len(self._tile_coords)
+
+    def get_number_of_vertices(self):
+        return len(self._vertex_coords)
+
+    def get_number_of_edges(self):
+        return len(self._edge_vertices)
+
+    def get_tile_coords(self, tile):
+        return self._tile_coords[tile]
+
+    def get_vertex_coords(self, vertex):
+        return self._vertex_coords[vertex]
+
+    def get_tile_vertices(self, tile):
+        return self._tile_vertices[tile]
+
+    def get_vertex_tiles(self, vertex):
+        return self._vertex_tiles[vertex]
+
+    def get_tile_neighbours(self, tile):
+        return self._tile_neighbours[tile]
+
+    def get_vertex_neighbours(self, vertex):
+        return self._vertex_neighbours[vertex]
+
+    def get_vertex_edges(self, vertex):
+        return self._vertex_edges[vertex]
+
+    def get_edge_vertices(self, edge):
+        return self._edge_vertices[edge]
+
+    def get_vertex_neighbour_mask(self, vertex):
+        return self._vertex_neighbour_masks[vertex]
+
+    def get_vertex_edge_mask(self, vertex):
+        return self._vertex_edge_masks[vertex]
+
+    def get_tile(self, q, r):
+        """
+        Returns the tile at axial coordinates (q, r), or None if it is off the board
+        """
+        return self._tile_lookup.get((q, r))
+
+    def get_vertex(self, q, r, corner):
+        """
+        Returns the vertex that is the corner (NORTH or SOUTH) of the hex at (q, r), or None if it is off the board
+        """
+        return self._vertex_lookup.get((q, r, corner))
+
+    def get_edge(self, vertex1, vertex2):
+        """
+        Returns the edge between the two vertices, or None if the vertices are not neighbours
+        """
+        return self._edge_lookup.get((min(vertex1, vertex2), max(vertex1, vertex2)))
+
+    def create_tables(self):
+        """
+        Creates the tiles of the board, then numbers the corners and sides of each tile, some tiles share corners and
+        sides so each one is only given one id
+        """
+        radius = self._radius
+        for r in range(-radius, radius + 1):
+            for q in range(max(-radius, -radius - r), min(radius, radius - r) + 1):
+                self._tile_lookup[(q, r)] = len(self._tile_coords)
+                self._tile_coords.append((q, r))
+
+        tile_vertices = []
+        vertex_tiles = []
+        vertex_neighbours = []
+        vertex_edges = []
+
+        for q, r in self._tile_coords:
+            corners = []
+            for corner in hex_corner_vertices(q, r):
+                if corner not in self._vertex_lookup:
+                    self._vertex_lookup[corner] = len(self._vertex_coords)
+                    self._vertex_coords.append(corner)
+                    vertex_tiles.append([])
+                    vertex_neighbours.append([])
+                    vertex_edges.append([])
+                vertex = self._vertex_lookup[corner]
+                vertex_tiles[vertex].append(self._tile_lookup[(q, r)])
+                corners.append(vertex)
+            tile_vertices.append(tuple(corners))
+
+            # each side of the hexagon joins two corners that are next to each other
+            for index in range(6):
+                vertex1 = corners[index]
+                vertex2 = corners[(index + 1) % 6]
+                key = (min(vertex1, vertex2), max(vertex1, vertex2))
+                if key not in self._edge_lookup:
+                    edge = len(self._edge_vertices)
+                    self._edge_lookup[key] = edge
+                    self._edge_vertices.append(key)
+                    vertex_neighbours[vertex1].append(vertex2)
+                    vertex_neighbours[vertex2].append(vertex1)
+                    vertex_edges[vertex1].append(edge)
+                    vertex_edges[vertex2].append(edge)
+
+        # the six axial directions to the tiles sharing a side
+        directions = [(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
+        for q, r in self._tile_coords:
+            neighbours = []
+            for dq, dr in directions:
+                neighbour = self._tile_lookup.get((q + dq, r + dr))
+                if neighbour is not None:
+                    neighbours.append(neighbour)
+            self._tile_neighbours.append(tuple(neighbours))
+
+        self._tile_vertices = tuple(tile_vertices)
+        self._vertex_tiles = tuple(tuple(tiles) for tiles in vertex_tiles)
+        self._vertex_neighbours = tuple(tuple(neighbours) for neighbours in vertex_neighbours)
+        self._vertex_edges = tuple(tuple(edges) for edges in vertex_edges)
+        self._tile_coords = tuple(self._tile_coords)
+        self._vertex_coords = tuple(self._vertex_coords)
+        self._edge_vertices = tuple(self._edge_vertices)
+        self._tile_neighbours = tuple(self._tile_neighbours)
+
+    def create_masks(self):
+        """
+        Creates the bitmasks of the neighbours and edges of each vertex from the tables
+        """
+        neighbour_masks = []
+        edge_masks = []
+        for vertex in range(len(self._vertex_coords)):
+            neighbour_mask = 0
+            for neighbour in self._vertex_neighbours[vertex]:
+                neighbour_mask |= 1 << neighbour
+            edge_mask = 0
+            for edge in self._vertex_edges[vertex]:
+                edge_mask |= 1 << edge
+            neighbour_masks.append(neighbour_mask)
+            edge_masks.append(edge_mask)
+
+        self._vertex_neighbour_masks = tuple(neighbour_masks)
+        self._vertex_edge_masks = tuple(edge_masks)
+
+    def get_tables(self):
+        """
+        Returns a dictionary of every table, with the table name as the key, which can be passed back in as the
+        tables parameter to rebuild the topology without creating the tables again
+        """
+        tables = {}
+        for name in TABLE_NAMES:
+            tables[name] = getattr(self, "_" + name)
+        return tables
+
+    def set_tables(self, tables):
+        """
+        Takes a dictionary of tables from get_tables, sets each table and rebuilds the lookups from them
+        """
+        for name in TABLE_NAMES:
+            setattr(self, "_" + name, tables[name])
+
+        self._tile_lookup = {coords: tile for tile, coords in enumerate(self._tile_coords)}
+        self._vertex_lookup = {coords: vertex for vertex, coords in enumerate(self._vertex_coords)}
+        self._edge_lookup = {vertices: edge for edge, vertices in enumerate(self._edge_vertices)}
+
+    def save(self, cache_path):
+        """
+        Writes the tables to the cache file, the file is written under a temporary name and then renamed so other
+        processes never read a half written file
+        """
+        contents = {"version": TOPOLOGY_CACHE_VERSION, "radius": self._radius, "tables": self.get_tables()}
+        temporary_path = cache_path + "." + str(os.getpid()) + ".tmp"
+        with open(temporary_path, "wb") as cache_file:
+            pickle.dump(contents, cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+
+
+def load_topology(cache_path, radius=BOARD_RADIUS):
+    """
+    Returns the BoardTopology saved in the cache file, or None if the file is missing, unreadable, is missing its
+    tables, or was written for a different radius or cache version
+    """
+    try:
+        with open(cache_path, "rb") as cache_file:
+            contents = pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+    if not isinstance(contents, dict) or contents.get("version") != TOPOLOGY_CACHE_VERSION:
+        return None
+    if contents.get("radius") != radius:
+        return None
+    try:
+        return BoardTopology(radius, contents["tables"])
+    except KeyError:
+        # a cache written without its tables is stale, so the topology is built again
+        return None
+
+
+# The topology is the same for every game, so it is only built once
+_topology = None
+
+
+def get_topology(cache_path=None):
+    """
+    Returns the BoardTopology of the standard board, every game in the process shares the same object
+    The first time it is needed it is loaded from cache_path if the file is valid, otherwise it is created and, if
+    cache_path is given, saved there for the next process
+    """
+    global _topology
+    if _topology is None:
+        if cache_path is not None:
+            _topology = load_topology(cache_path)
+        if _topology is None:
+            _topology = BoardTopology()
+            if cache_path is not None:
+                _topology.save(cache_path)
+    return _topology
@@ -1,11 +1,12 @@
 # Author: Joanna Getek
-# Last Modified: 01/04/2023
+# Last Modified: 10/18/2026
 # Description: Contains all the buttons which allow the player to select turn options
 
 import pygame
-import sys
-import random
 from global_vars import *
+from actions import apply, ROLL_DICE, SETTLEMENT_COST, ROAD_COST
+from renderer import get_renderer, HUD_LAYER
+from assets import get_assets
 
 
 class Dice:
@@ -23,24 +24,15 @@ class Dice:
         """
         Displays two dice that indicate the dice number that was rolled
         """
-        dice_image_location = "images\\dice" + str(dice_roll) + ".jpg"
-        dice_image = pygame.image.load(dice_image_location).convert()
-        screen.blit(dice_image, (900, 425))
-        pygame.display.flip()
+        get_renderer().blit(HUD_LAYER, get_assets().get_image("dice" + str(dice_roll)), (900, 425))
 
-    def roll_dice(self):
+    def roll_dice(self, game_state):
         """
-        Returns the dice roll when the button is clicked
+        Takes the GameState object as a parameter
+        Rolls the dice in the GameState once the dice have been clicked and returns the dice roll
         """
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    x, y = event.pos
-                    if self._rect.collidepoint(x, y):
-                        dice_roll = random.randint(2, 12)
-                        return dice_roll
+        apply(game_state, (ROLL_DICE,))
+        return game_state.get_last_roll()
 
 
 class Button:
@@ -59,11 +51,11 @@ class Button:
     def get_position(self):
         return self._position
 
-    def draw_button(self):
+    def draw_button(self, surface):
         """
-        Draws the button on the game screen
+        Draws the button onto surface, the buttons are part of the static board
         """
-        screen.blit(self._image, self._position)
+        surface.blit(self._image, self._position)
 
 class Settlement_Button(Button):
     """
@@ -72,14 +64,15 @@ class Settlement_Button(Button):
     def __init__(self, colour=NAVY):
         super().__init__(colour)
         self._shape = pygame.Rect(1100, 315, 60, 65)
-        self._image = pygame.image.load("images\\settlement_button1.jpg").convert()
+        self._image = get_assets().get_image("settlement_button1")
         self._position = (1100, 315)
 
     def click_settlement_button(self, game, player):
         """
         When the button is clicked, it indicates player would like to build a settlement
+        Returns True if the player has the resources to buy a settlement, the game then waits for them to place it
         """
-        player.place_settlement(game)
+        return game.get_state().can_afford(player.get_player_index(), SETTLEMENT_COST)
 
 class Road_Button(Button):
     """
@@ -88,14 +81,15 @@ class Road_Button(Button):
     def __init__(self, colour=NAVY):
         super().__init__(colour)
         self._shape = pygame.Rect(1100, 250, 60, 65)
-        self._image = pygame.image.load("images\\road_button1.jpg").convert()
+        self._image = get_assets().get_image("road_button1")
         self._position = (1100, 250)
 
     def clicked_road_button(self, game, player):
         """
         Indicates player would like to build a road
+        Returns True if the player has the resources to buy a road, the game then waits for them to place it
         """
-        player.place_road(game)
+        return game.get_state().can_afford(player.get_player_index(), ROAD_COST)
 
 class City_Button(Button):
     """
@@ -104,7 +98,7 @@ class City_Button(Button):
     def __init__(self, colour=NAVY):
         super().__init__(colour)
         self._shape = pygame.Rect(1100, 185, 60, 65)
-        self._image = pygame.image.load("images\\city_button1.jpg").convert()
+        self._image = get_assets().get_image("city_button1")
         self._position = (1100, 185)
 
 class Development_Card(Button):
@@ -114,7 +108,7 @@ class Development_Card(Button):
     def __init__(self, colour=NAVY):
         super().__init__(colour)
         self._shape = pygame.Rect(1070, 405, 120, 183)
-        self._image = pygame.image.load("images\\development_card.jpg").convert()
+        self._image = get_assets().get_image("development_card")
         self._position = (1070, 405)
 
 class End_Turn(Button):
@@ -126,13 +120,12 @@ class End_Turn(Button):
         self._shape = pygame.Rect(900, 525, 150, 50)
         self._position = (910, 535)
 
-    def draw_button(self):
+    def draw_button(self, surface):
         """
-        Draws the end turn button on the game board
+        Draws the end turn button onto surface
         """
-        pygame.draw.rect(screen, self._colour, self._shape)
-        print_text = GAME_FONT.render("END TURN", True, BLACK)
-        screen.blit(print_text, self._position)
+        pygame.draw.rect(surface, self._colour, self._shape)
+        surface.blit(get_assets().render_text("END TURN", GAME_FONT, BLACK), self._position)
 
     def click_end_turn_button(self):
         """
@@ -147,23 +140,16 @@ class Wheat_Button(Button):
     def __init__(self, colour=NAVY):
         super().__init__(colour)
         self._shape = pygame.Rect(860, 70, 65, 65)
-        self._image = pygame.image.load("images\\wheat.jpg").convert()
+        self._image = get_assets().get_image("wheat")
         self._position = (860, 70)
 
-    def clicked_wheat_button(self, player):
+    def clicked_wheat_button(self, game, player):
         """
-        Takes the object player as a parameter
-        Checks whether a player has enough resources to trade in 4 wheat cards, removes the cards if trade is valid
+        Takes the GameBoard and Player objects as parameters
+        Checks whether a player has enough resources to trade in 4 wheat cards, the cards are removed by the GameState
+        once the player picks the resource they would like in return
         """
-        player_hand = player.get_resources()
-        if player_hand["wheat"] < 4:
-            # unable to trade
-            return False
-
-        # otherwise player is able to trade, 4 wheat cards are removed from player hand
-        current_wheat = player_hand["wheat"]
-        player_hand["wheat"] = current_wheat - 4
-        return True
+        return game.get_state().can_bank_trade(player.get_player_index(), "wheat")
 
 
 
@@ -173,22 +159,16 @@ class Brick_Button(Button):
     """
     def __init__(self):
         self._shape = pygame.Rect(925, 70, 65, 65)
-        self._image = pygame.image.load("images\\brick.jpg").convert()
+        self._image = get_assets().get_image("brick")
         self._position = (925, 70)
 
-    def clicked_brick_button(self, player):
+    def clicked_brick_button(self, game, player):
         """
-        Takes the object player as a parameter
-        Checks whether a player has enough resources to trade in 4 brick cards, removes the cards if trade is valid
+        Takes the GameBoard and Player objects as parameters
+        Checks whether a player has enough resources to trade in 4 brick cards, the cards are removed by the GameState
+        once the player picks the resource they would like in return
         """
-        player_hand = player.get_resources()
-        if player_hand["brick"] < 4:
-            return False
-
-        # otherwise player is able to trade, 4 brick cards are removed from player hand
-        current_brick = player_hand["brick"]
-        player_hand["brick"] = current_brick - 4
-        return True
+        return game.get_state().can_bank_trade(player.get_player_index(), "brick")
 
 
 class Wood_Button(Button):
@@ -198,22 +178,16 @@ class Wood_Button(Button):
 
     def __init__(self):
         self._shape = pygame.Rect(990, 70, 65, 65)
-        self._image = pygame.image.load("images\\wood.jpg").convert()
+        self._image = get_assets().get_image("wood")
         self._position = (990, 70)
 
-    def clicked_wood_button(self, player):
+    def clicked_wood_button(self, game, player):
         """
-        Takes the object player as a parameter
-        Checks whether a player has enough resources to trade in 4 wood cards, removes the cards if trade is valid
+        Takes the GameBoard and Player objects as parameters
+        Checks whether a player has enough resources to trade in 4 wood cards, the cards are removed by the GameState
+        once the player picks the resource they would like in return
         """
-        player_hand = player.get_resources()
-        if player_hand["wood"] < 4:
-            return False
-
-        # otherwise player is able to trade, 4 wood cards are removed from player hand
-        current_wood = player_hand["wood"]
-        player_hand["wood"] = current_wood - 4
-        return True
+        return game.get_state().can_bank_trade(player.get_player_index(), "wood")
 
 class Wool_Button(Button):
     """
@@ -222,22 +196,16 @@ class Wool_Button(Button):
 
     def __init__(self):
         self._shape = pygame.Rect(1055, 70, 65, 65)
-        self._image = pygame.image.load("images\\wool.jpg").convert()
+        self._image = get_assets().get_image("wool")
         self._position = (1055, 70)
 
-    def clicked_wool_button(self, player):
+    def clicked_wool_button(self, game, player):
         """
-        Takes the object player as a parameter
-        Checks whether a player has enough resources to trade in 4 wool cards, removes the cards if trade is valid
+        Takes the GameBoard and Player objects as parameters
+        Checks whether a player has enough resources to trade in 4 wool cards, the cards are removed by the GameState
+        once the player picks the resource they would like in return
         """
-        player_hand = player.get_resources()
-        if player_hand["wool"] < 4:
-            return False
-
-        # otherwise player is able to trade, 4 wool cards are removed from player hand
-        current_wool = player_hand["wool"]
-        player_hand["wool"] = current_wool - 4
-        return True
+        return game.get_state().can_bank_trade(player.get_player_index(), "wool")
 
 class Ore_Button(Button):
     """
@@ -246,20 +214,14 @@ class Ore_Button(Button):
 
     def __init__(self):
         self._shape = pygame.Rect(1120, 70, 65, 65)
-        self._image = pygame.image.load("images\\ore.jpg").convert()
+        self._image = get_assets().get_image("ore")
         self._position = (1120, 70)
 
-    def clicked_ore_button(self, player):
+    def clicked_ore_button(self, game, player):
         """
-        Takes the object player as a parameter
-        Checks whether a player has enough resources to trade in 4 ore cards, removes the cards if trade is valid
+        Takes the GameBoard and Player objects as parameters
+        Checks whether a player has enough resources to trade in 4 ore cards, the cards are removed by the GameState
+        once the player picks the resource they would like in return
         """
-        player_hand = player.get_resources()
-        if player_hand["ore"] < 4:
-            return False
-
-        # otherwise player is able to trade, 4 wool cards are removed from player hand
-        current_wool = player_hand["ore"]
-        player_hand["ore"] = current_wool - 4
-        return True
+        return game.get_state().can_bank_trade(player.get_player_index(), "ore")
 
@@ -1,9 +1,13 @@
 # Author: Joanna Getek
-# Last Modified: 01/03/2023
+# Last Modified: 10/18/2026
 # Description: A 2D Catan board game with an interactive GUI for four players using the Pygame library.
 # This file create the initial gameboard and generates the players. It also contains the main game loop.
+# Each seat can be a human or a computer player, for example: python catan.py human mcts random mcts
+# A game saved with --save after every turn can be carried on later with --resume, for example:
+# python catan.py --save game.snapshot, then python catan.py --resume game.snapshot
 
 # imports
+import argparse
 import sys
 import pygame
 from global_vars import *
@@ -11,88 +15,135 @@ from gameboard import *
 from buttons import *
 from structures import *
 from player import *
+from ai_players import AI_PLAYER_TYPES, create_ai_player
+from renderer import get_renderer
+from assets import get_assets
+from game_controller import GameController
 
-def start_game():
+# Player type for a seat played with mouse clicks, the computer player types are the names in AI_PLAYER_TYPES
+HUMAN_PLAYER = "human"
+
+def start_game(player_types=None, seed=None):
     """ Creates screen, GameBoard (and all its associated objects), and
-     calls generate players to set up the initial game play"""
+     calls generate players to create the players, the setup placements are played by the GameController
+     Takes player_types, a list of the player type of each seat, every seat is a human player if it is None, and the
+     seed of the game, which decides the board and dice rolls"""
 
     # filling background
-    screen.fill(LIGHT_BLUE)
-    pygame.display.flip()
+    get_renderer().clear(LIGHT_BLUE)
 
     # initializing GameBoard
-    game = GameBoard()
+    game = GameBoard(seed)
+    print("Game seed: " + str(game.get_state().get_seed()))
     game.create_hex_tiles()
     game.create_locations()
     game.create_buttons()
 
     # draw gameboard
     game.draw_gameboard()
-    pygame.display.flip()
 
-    # generate players and start initial setup
-    generate_players(game)
+    # generate players, the initial setup is played once the game starts
+    generate_players(game, player_types)
+
+    return game
+
+def resume_game(snapshot, player_types=None):
+    """ Creates screen and a GameBoard for the game saved in snapshot, the bytes made by GameBoard.save_snapshot, and
+     draws it as it was when it was saved
+     Takes player_types, a list of the player type of each seat, every seat is a human player if it is None
+     Raises ValueError if snapshot is not a saved game of four players"""
+
+    get_renderer().clear(LIGHT_BLUE)
+    game = GameBoard()
+    player_list = create_players(player_types)
+    game.load_snapshot(snapshot, player_list)
+    print("Game seed: " + str(game.get_state().get_seed()))
+
+    game.create_buttons()
+    game.draw_gameboard()
+    for player in player_list:
+        game.display_player_screen(player.get_player_name())
 
     return game
 
-def generate_players(game):
+def create_players(player_types=None):
     """
-    Takes game, the GameBoard object, and locations, the list of buildable locations on the board as parameters
-    Creates four players for gameplay and starts their initial two turns for game setup
+    Takes player_types, a list with HUMAN_PLAYER or the name of a computer player type for each of the four seats,
+    every seat is a human player if it is None
+    Returns the list of the four player objects, with their names displayed on the screen
     """
 
+    if player_types is None:
+        player_types = [HUMAN_PLAYER] * 4
     player_list = []
 
     # creating player list array, displaying names, and background
     for index in range(1, 5):
         player_name = "Player " + str(index)
-        new_player = Player(player_name, PLAYER_COLOUR_LIST[index - 1])
+        player_type = player_types[index - 1]
+        if player_type == HUMAN_PLAYER:
+            new_player = Player(player_name, PLAYER_COLOUR_LIST[index - 1])
+        else:
+            new_player = ComputerPlayer(player_name, PLAYER_COLOUR_LIST[index - 1], create_ai_player(player_type))
         print_text(player_name, PLAYER_POSITIONS[index - 1])
         player_list.append(new_player)
         new_player.set_player_rect(RECT_PLAYER_POSITIONS[index - 1])
 
-    game.set_player_list(player_list)
-    game.draw_settlement_icons()
-
-    # First round of settlements to add onto game board in order from player 1 - 4
-    for new_player in player_list:
-        game.update_text_box(str(new_player.get_player_name()) + ": Place your settlement")
-        new_player.place_settlement(game)
-        game.update_text_box(str(new_player.get_player_name()) + ": Place your road")
-        new_player.place_road(game)
-
-    # Now add second set of settlements/roads in reverse order
-    player_list.reverse()
+    return player_list
 
-    for player in player_list:
-        game.update_text_box(str(player.get_player_name()) + ": Place your settlement")
-        player.place_settlement(game)
-        game.update_text_box(str(player.get_player_name()) + ": Place your road")
-        player.place_road(game)
+def generate_players(game, player_types=None):
+    """
+    Takes game, the GameBoard object, and player_types, a list with HUMAN_PLAYER or the name of a computer player type
+    for each of the four seats, every seat is a human player if it is None
+    Creates four players for gameplay, the GameState decides the order of their initial two settlements and roads
+    """
 
-    # bringing back to original order
-    player_list.reverse()
+    player_list = create_players(player_types)
+    game.set_player_list(player_list)
+    game.draw_settlement_icons()
 
-def main():
+def main(player_types=None, seed=None, resume_path=None, save_path=None):
     """ The initial setup and main game loop that continues to run as long as there is no winner or
-    the user has not exited """
-
-    game = start_game()
-    winner = None
-
-    while winner is None:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                sys.exit()
-
-        # loop through each player turn until there is a winner
-        player_list = game.get_player_list()
-        for player in player_list:
-            player_name = player.get_player_name()
-            game.update_text_box(str(player_name) + "'s Turn. Click to roll the dice!")
-            player.player_turn(game, player)
-            winner = game.check_winner()
+    the user has not exited
+    Takes player_types, a list of the player type of each of the four seats, every seat is a human player if it is
+    None, and the seed of the game, a random seed is chosen if it is None
+    If resume_path is given the game saved in that file is carried on instead of starting a new one, and if save_path
+    is given the game is saved to that file at the end of every turn """
+
+    if player_types is not None:
+        for player_type in player_types:
+            if player_type != HUMAN_PLAYER and player_type not in AI_PLAYER_TYPES:
+                print("Unknown player type: " + str(player_type) + ", choose from " + HUMAN_PLAYER + ", " +
+                      ", ".join(AI_PLAYER_TYPES))
+                sys.exit(1)
+        if len(player_types) != 4:
+            print("Four player types are needed, one for each seat")
+            sys.exit(1)
+
+    # every image is loaded before the game starts, so nothing is loaded from disk during play
+    get_assets()
+
+    if resume_path is None:
+        game = start_game(player_types, seed)
+    else:
+        try:
+            with open(resume_path, "rb") as save_file:
+                game = resume_game(save_file.read(), player_types)
+        except (OSError, ValueError) as error:
+            print("Could not resume the saved game: " + str(error))
+            sys.exit(1)
+
+    # play the setup and then each player's turn in order until there is a winner, starting with the GameState's
+    # current player so a resumed game carries on with the right player
+    GameController(game, save_path).run()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Play catan")
+    parser.add_argument("players", nargs="*", help="the player type of each of the four seats, " + HUMAN_PLAYER +
+                        " or one of " + ", ".join(AI_PLAYER_TYPES) + ", every seat is human by default")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the board and dice, to replay a game")
+    parser.add_argument("--resume", default=None, help="file of a saved game to carry on playing")
+    parser.add_argument("--save", default=None, help="file the game is saved to after every turn")
+    arguments = parser.parse_args()
+    main(arguments.players or None, arguments.seed, arguments.resume, arguments.save)
\ No newline at end of file
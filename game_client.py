@@ -0,0 +1,163 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: A client for the game server that plays random legal actions, used to try out the server and to load
+# it with many games at once. Every player is its own connection and every game is played in the same event loop.
+# For example: python game_server.py, then python game_client.py --games 100 --players 4
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from game_server import DEFAULT_HOST, DEFAULT_PORT, MAX_PLAYERS, MAX_OPEN_GAMES, CREATE, JOIN, ACTION, STATE, LIST
+from game_state import GAME_OVER_PHASE
+
+
+class GameClient:
+    """
+    A connection to the game server
+    Reader and writer are the asyncio streams of the connection, messages are JSON objects sent one to a line
+    """
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Opens a connection to the server and returns a GameClient
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send(self, message):
+        self._writer.write(json.dumps(message).encode() + b"\n")
+        await self._writer.drain()
+
+    async def receive(self):
+        """
+        Returns the next message from the server, or None if the server closed the connection
+        """
+        line = await self._reader.readline()
+        if not line:
+            return None
+        return json.loads(line)
+
+    async def receive_type(self, message_type):
+        """
+        Returns the next message of message_type or error from the server, skipping the other messages
+        """
+        while True:
+            message = await self.receive()
+            if message is None or message["type"] in (message_type, "error"):
+                return message
+
+    async def create_game(self, number_of_players=MAX_PLAYERS):
+        """
+        Creates a game on the server and returns its game id
+        """
+        await self.send({"command": CREATE, "players": number_of_players})
+        return (await self.receive_type("created"))["game"]
+
+    async def list_games(self):
+        """
+        Returns a list of the games with free seats, each a dictionary of the game id and the number of free seats
+        """
+        await self.send({"command": LIST})
+        return (await self.receive_type("games"))["games"]
+
+    async def join_game(self, game_id, player_name):
+        """
+        Takes the next free seat of a game and returns the seat, or None if the game could not be joined
+        """
+        await self.send({"command": JOIN, "game": game_id, "name": player_name})
+        message = await self.receive_type("joined")
+        return None if message is None or message["type"] == "error" else message["seat"]
+
+    async def play_action(self, game_id, action):
+        await self.send({"command": ACTION, "game": game_id, "action": list(action)})
+
+    async def request_state(self, game_id):
+        await self.send({"command": STATE, "game": game_id})
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def play_random_player(host, port, game_id, player_name, seed=None):
+    """
+    Joins a game and plays a random legal action every time it is this player's turn until the game is over
+    Returns the last state message of the game, or None if the game could not be joined, was closed before it
+    started or the server disconnected
+    """
+    client = await GameClient.connect(host, port)
+    player_random = random.Random(seed)
+    try:
+        if await client.join_game(game_id, player_name) is None:
+            return None
+        while True:
+            message = await client.receive()
+            if message is None or message["type"] == "closed":
+                return None
+            if message["type"] != "state":
+                continue
+            if message["phase"] == GAME_OVER_PHASE:
+                return message
+            if message["legal_actions"]:
+                await client.play_action(game_id, player_random.choice(message["legal_actions"]))
+    finally:
+        await client.close()
+
+
+async def play_games(host=DEFAULT_HOST, port=DEFAULT_PORT, number_of_games=1, number_of_players=MAX_PLAYERS,
+                     seed=0):
+    """
+    Creates number_of_games games on the server and plays every seat of every game at once with random players
+    Returns the list of the last state message of every game
+    """
+    # a connection can only have MAX_OPEN_GAMES games waiting for players, so a new one creates each batch
+    game_ids = []
+    while len(game_ids) < number_of_games:
+        client = await GameClient.connect(host, port)
+        try:
+            for _ in range(min(MAX_OPEN_GAMES, number_of_games - len(game_ids))):
+                game_ids.append(await client.create_game(number_of_players))
+        finally:
+            await client.close()
+
+    players = []
+    for game_id in game_ids:
+        for seat in range(number_of_players):
+            players.append(play_random_player(host, port, game_id, "Player " + str(seat + 1),
+                                              seed * MAX_PLAYERS * number_of_games + len(players)))
+    results = await asyncio.gather(*players)
+    # every player of a game is sent the same last state, so the first seat's is kept
+    return results[::number_of_players]
+
+
+def main(argv=None):
+    """
+    Reads the client settings from the command line, plays the games and prints the winner of each
+    """
+    parser = argparse.ArgumentParser(description="Play random games on a Catan game server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address of the server")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port of the server")
+    parser.add_argument("--games", type=int, default=1, help="games played at once")
+    parser.add_argument("--players", type=int, default=MAX_PLAYERS, help="players in each game")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random players")
+    arguments = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    results = asyncio.run(play_games(arguments.host, arguments.port, arguments.games, arguments.players,
+                                     arguments.seed))
+    for result in results:
+        if result is None:
+            print("a game was not finished")
+        else:
+            print("game {}: won by seat {} on turn {}".format(result["game"], result["winner"], result["turn"]))
+    print("games: {}, time: {:.1f}s".format(len(results), time.perf_counter() - start_time))
+
+
+if __name__ == '__main__':
+    main()
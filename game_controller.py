@@ -0,0 +1,306 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Runs the game from a single event loop. Each frame the waiting events are sent to the input handler of
+# the current input state, a computer player takes its next action, the changes are drawn, and the clock sleeps until
+# the next frame, so a game waiting for a click uses almost no CPU.
+# The input states form a state machine: every handler deals with one event and returns, moving to the next state
+# when the click was accepted, so waiting for the player never nests calls or loops.
+
+import os
+import sys
+import pygame
+from global_vars import *
+from actions import *
+from player import ComputerPlayer
+from gameboard import DICE_BUTTON
+from renderer import get_renderer
+
+# Input states, what the game is waiting for from the current player
+ROLL_INPUT = "roll"
+ROBBER_INPUT = "robber"
+ACTION_INPUT = "action"
+TRADE_INPUT = "trade"
+PLACE_SETTLEMENT_INPUT = "place_settlement"
+PLACE_ROAD_INPUT = "place_road"
+COMPUTER_INPUT = "computer"
+GAME_OVER_INPUT = "game_over"
+
+
+def save_game(game, path):
+    """ Writes a snapshot of the game to the file at path, the snapshot is written to a temporary file first and then
+    moved over the old one, so quitting in the middle of saving never leaves a broken save """
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as save_file:
+        save_file.write(game.save_snapshot())
+    os.replace(temporary_path, path)
+
+
+class GameController:
+    """
+    Plays a game from its setup placements to its winner, from one event loop
+    Game is the GameBoard object and save path is the file the game is saved to at the end of every turn, or None
+    Input state is what the game is waiting for and handlers maps each input state to the method that handles the
+    events in that state
+    Trade resource is the resource the current player is trading in while the game waits for the one they want back
+    Running is False once the game has a winner, the loop is kept to FPS frames a second by the clock in global_vars
+    """
+    def __init__(self, game, save_path=None):
+        self._game = game
+        self._save_path = save_path
+        self._input_state = None
+        self._handlers = {ROLL_INPUT: self.handle_roll_input,
+                          ROBBER_INPUT: self.handle_robber_input,
+                          ACTION_INPUT: self.handle_action_input,
+                          TRADE_INPUT: self.handle_trade_input,
+                          PLACE_SETTLEMENT_INPUT: self.handle_place_settlement_input,
+                          PLACE_ROAD_INPUT: self.handle_place_road_input,
+                          COMPUTER_INPUT: self.ignore_input,
+                          GAME_OVER_INPUT: self.ignore_input}
+        self._trade_resource = None
+        self._running = False
+
+    def get_input_state(self):
+        return self._input_state
+
+    def get_current_player(self):
+        return self._game.get_player_list()[self._game.get_state().get_current_player()]
+
+    def run(self):
+        """
+        Runs the event loop until there is a winner
+        Returns the winning player
+        """
+        self._running = True
+        self.start_turn()
+        renderer = get_renderer()
+
+        while self._running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    sys.exit()
+                self.handle_event(event)
+
+            # a computer player takes one action each frame, so every move is drawn before the next one
+            if self._input_state == COMPUTER_INPUT:
+                self.play_computer_action()
+
+            renderer.present()
+            clock.tick(FPS)
+
+        return self._game.check_winner()
+
+    def handle_event(self, event):
+        """
+        Sends the event to the input handler of the current input state
+        """
+        self._handlers[self._input_state](event)
+
+    def start_turn(self):
+        """
+        Starts what the current player does next, placing one of their setup settlements or roads or taking their
+        turn, or stops the loop if there is a winner
+        """
+        if self._game.check_winner() is not None:
+            self._input_state = GAME_OVER_INPUT
+            self._running = False
+            return
+
+        player = self.get_current_player()
+        phase = self._game.get_state().get_phase()
+        if isinstance(player, ComputerPlayer):
+            self._game.update_text_box(str(player.get_player_name()) + " is thinking...")
+            self._input_state = COMPUTER_INPUT
+        elif phase == SETUP_SETTLEMENT_PHASE:
+            self._game.update_text_box(str(player.get_player_name()) + ": Place your settlement")
+            self._input_state = PLACE_SETTLEMENT_INPUT
+        elif phase == SETUP_ROAD_PHASE:
+            self._game.update_text_box(str(player.get_player_name()) + ": Place your road")
+            self._input_state = PLACE_ROAD_INPUT
+        else:
+            self._game.update_text_box(str(player.get_player_name()) + "'s Turn. Click to roll the dice!")
+            self._input_state = ROLL_INPUT
+
+    def end_turn(self):
+        """
+        Saves the game if it is being saved and starts the next player's turn, games are only saved once the setup
+        is over
+        """
+        in_setup = self._game.get_state().get_phase() in (SETUP_SETTLEMENT_PHASE, SETUP_ROAD_PHASE)
+        if self._save_path is not None and not in_setup:
+            save_game(self._game, self._save_path)
+        self.start_turn()
+
+    def start_actions(self):
+        """
+        Waits for the current player to click one of the action buttons
+        """
+        player_name = self.get_current_player().get_player_name()
+        self._game.update_text_box(str(player_name) + ", Click an icon to chose an action")
+        self._game.update_trade_text("Select which item you'd like to trade in")
+        self._input_state = ACTION_INPUT
+
+    def ignore_input(self, event):
+        """
+        Input handler for the states that do not wait for the mouse
+        """
+        return
+
+    def handle_roll_input(self, event):
+        """
+        Rolls the dice when the player clicks them, a 7 waits for the player to move the robber and any other roll
+        pays out the resources before the player chooses an action
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        if self._game.find_button(event.pos) != DICE_BUTTON:
+            return
+
+        dice = self._game.get_dice()
+        player = self.get_current_player()
+        dice_roll = dice.roll_dice(self._game.get_state())
+        dice.draw_dice(dice_roll)
+
+        if dice_roll == 7:
+            self._game.update_text_box(str(player.get_player_name()) + " Click on a tile to move the robber")
+            self._input_state = ROBBER_INPUT
+        else:
+            # Otherwise the GameState has paid out the resources from the roll
+            player.display_collected_resources(self._game)
+            self.start_actions()
+
+    def handle_robber_input(self, event):
+        """
+        Moves the robber to the tile the player clicks near the center of, the robber has to move to a new tile
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        # Checking if the mouse click is within the center of a hex tile
+        hex_tile = self._game.find_hex_tile(event.pos)
+        if hex_tile is None or not apply(self._game.get_state(), (MOVE_ROBBER, hex_tile.get_tile_id())):
+            return
+        self.get_current_player().draw_robber_move(self._game, hex_tile)
+        self.start_actions()
+
+    def handle_action_input(self, event):
+        """
+        Builds, trades or ends the turn depending on the button the player clicks
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        game = self._game
+        player = self.get_current_player()
+        button_name = game.find_button(event.pos)
+
+        # monitoring if player selected a build structure or end turn button
+        build_buttons = game.get_build_buttons()
+
+        if button_name == "settlement_button":
+            if build_buttons["settlement_button"].click_settlement_button(game, player):
+                game.update_text_box(str(player.get_player_name()) + ": Place your settlement")
+                self._input_state = PLACE_SETTLEMENT_INPUT
+            else:
+                game.update_text_box(str(player.get_player_name()) + ", you need more resources for a settlement")
+            return
+        if button_name == "road_button":
+            if build_buttons["road_button"].clicked_road_button(game, player):
+                game.update_text_box(str(player.get_player_name()) + ": Place your road")
+                self._input_state = PLACE_ROAD_INPUT
+            else:
+                game.update_text_box(str(player.get_player_name()) + ", you need more resources for a road")
+            return
+        if button_name == "end_turn":
+            build_buttons["end_turn"].click_end_turn_button()
+            apply(game.get_state(), (END_TURN,))
+            self.end_turn()
+            return
+
+        # monitoring if player selected trade button
+        trade_buttons = game.get_trade_buttons()
+        trade_status = False
+        trade_resource = None
+
+        if button_name == "wheat":
+            trade_status = trade_buttons["wheat"].clicked_wheat_button(game, player)
+            trade_resource = "wheat"
+        elif button_name == "brick":
+            trade_status = trade_buttons["brick"].clicked_brick_button(game, player)
+            trade_resource = "brick"
+        elif button_name == "wood":
+            trade_status = trade_buttons["wood"].clicked_wood_button(game, player)
+            trade_resource = "wood"
+        elif button_name == "wool":
+            trade_status = trade_buttons["wool"].clicked_wool_button(game, player)
+            trade_resource = "wool"
+        elif button_name == "ore":
+            trade_status = trade_buttons["ore"].clicked_ore_button(game, player)
+            trade_resource = "ore"
+
+        if trade_status is True:
+            game.update_trade_text("Select which item you'd to receive")
+            self._trade_resource = trade_resource
+            self._input_state = TRADE_INPUT
+
+    def handle_trade_input(self, event):
+        """
+        Trades the resource the player chose to trade in with the bank for the resource button they click next
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+
+        receive_resource = self._game.find_button(event.pos)
+        if receive_resource not in self._game.get_trade_buttons():
+            return
+        apply(self._game.get_state(), (BANK_TRADE, self._trade_resource, receive_resource))
+        self._game.display_player_screen(self.get_current_player().get_player_name())
+        self._trade_resource = None
+        self._game.update_trade_text("Select which item you'd like to trade in")
+        self._input_state = ACTION_INPUT
+
+    def handle_place_settlement_input(self, event):
+        """
+        Builds a settlement at the location the player clicks on
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        in_setup = self._game.get_state().get_phase() == SETUP_SETTLEMENT_PHASE
+        placed = self.get_current_player().place_settlement(self._game, event.pos)
+        self.finish_placement(placed, in_setup)
+
+    def handle_place_road_input(self, event):
+        """
+        Builds a road between the locations the player clicks between
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        in_setup = self._game.get_state().get_phase() == SETUP_ROAD_PHASE
+        placed = self.get_current_player().place_road(self._game, event.pos)
+        self.finish_placement(placed, in_setup)
+
+    def finish_placement(self, placed, in_setup):
+        """
+        Moves on after a click placing a settlement or road, placed is True if it was built
+        During the setup the game keeps waiting until the player clicks somewhere they can build, and during a turn
+        a click anywhere else puts the settlement or road back and returns to choosing an action
+        """
+        if in_setup:
+            if placed:
+                self.start_turn()
+            return
+
+        # the turn is over as soon as the player builds their winning victory point
+        if is_terminal(self._game.get_state()):
+            self.end_turn()
+        else:
+            self.start_actions()
+
+    def play_computer_action(self):
+        """
+        Plays the next action of the computer player whose turn it is, and ends the turn once it is over
+        """
+        player = self.get_current_player()
+        player.play_next_action(self._game)
+
+        state = self._game.get_state()
+        if is_terminal(state) or self.get_current_player() is not player:
+            self.end_turn()
@@ -0,0 +1,322 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: A compact binary format for keeping a record of every game played. A record file starts with MAGIC
+# and RECORD_VERSION, then holds one game after another, each one written as its length in bytes followed by the game.
+# A game is a short header with the players, result, seed and board, followed by one varint for each action played,
+# with the dice rolls stored so the game can be replayed exactly without the random number generators.
+# Varints: https://protobuf.dev/programming-guides/encoding/#varints
+
+from actions import *
+
+MAGIC = b"CTNR"
+RECORD_VERSION = 1
+
+# Each action is written as one varint, the action type in the low ACTION_TYPE_BITS bits and the action's argument
+# above them, so most actions fit in a single byte
+ACTION_TYPE_BITS = 3
+ACTION_CODES = [BUILD_SETTLEMENT, BUILD_ROAD, BUILD_CITY, ROLL_DICE, MOVE_ROBBER, BANK_TRADE, END_TURN]
+ACTION_CODE_INDEX = {action_type: code for code, action_type in enumerate(ACTION_CODES)}
+
+# Number of bytes in a game header before the seed, tiles and actions
+FIXED_HEADER_SIZE = 2
+
+
+def encode_varint(value, buffer):
+    """
+    Appends the non-negative integer value to the bytearray buffer, seven bits to a byte with the highest bit set on
+    every byte but the last
+    """
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def decode_varint(data, position):
+    """
+    Reads a varint from data starting at position
+    Returns a tuple of the value and the position just after it
+    Raises ValueError if data ends in the middle of the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("varint runs past the end of the data")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def read_varint(record_file):
+    """
+    Reads a varint from a binary file
+    Returns the value, or None if the file is already at its end
+    Raises ValueError if the file ends in the middle of the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = record_file.read(1)
+        if not byte:
+            if shift == 0:
+                return None
+            raise ValueError("varint runs past the end of the file")
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def encode_action(action, buffer):
+    """
+    Appends the action to the bytearray buffer, a roll_dice action has to include the total that was rolled
+    """
+    action_type = action[0]
+    if action_type == BANK_TRADE:
+        argument = RESOURCE_INDEX[action[1]] * NUMBER_OF_RESOURCES + RESOURCE_INDEX[action[2]]
+    elif action_type == END_TURN:
+        argument = 0
+    else:
+        argument = action[1]
+    encode_varint((argument << ACTION_TYPE_BITS) | ACTION_CODE_INDEX[action_type], buffer)
+
+
+def decode_action(code):
+    """
+    Returns the action written as the varint value code
+    """
+    action_type = ACTION_CODES[code & ((1 << ACTION_TYPE_BITS) - 1)]
+    argument = code >> ACTION_TYPE_BITS
+    if action_type == BANK_TRADE:
+        give, receive = divmod(argument, NUMBER_OF_RESOURCES)
+        return action_type, RESOURCE_TYPES[give], RESOURCE_TYPES[receive]
+    if action_type == END_TURN:
+        return (END_TURN,)
+    return action_type, argument
+
+
+class GameRecord:
+    """
+    The record of one game: the board it was played on, how it ended and every action played
+
+    Number of players is the number of players in the game, winner is the index of the winner or None if the game
+    did not finish, and turns is the turn number the game ended on
+    Seed is the game's seed, or None if it is not a non-negative integer
+    Tile types and tile numbers hold the type and number token of every tile, the desert has no number
+    Actions holds the encoded actions, added to as the game is played
+    """
+    __slots__ = ("_number_of_players", "_winner", "_turns", "_seed", "_tile_types", "_tile_numbers", "_actions")
+
+    def __init__(self, number_of_players, tile_types, tile_numbers, seed=None, winner=None, turns=0, actions=b""):
+        self._number_of_players = number_of_players
+        self._tile_types = list(tile_types)
+        self._tile_numbers = list(tile_numbers)
+        self._seed = seed
+        self._winner = winner
+        self._turns = turns
+        self._actions = bytearray(actions)
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Starts a record of the game in the GameState, which should not have had any actions played yet
+        """
+        board = state.get_board()
+        seed = state.get_seed()
+        if not isinstance(seed, int) or seed < 0:
+            seed = None
+        tile_types = [board.get_tile_type(tile) for tile in range(board.get_number_of_tiles())]
+        tile_numbers = [board.get_tile_number(tile) for tile in range(board.get_number_of_tiles())]
+        return cls(state.get_number_of_players(), tile_types, tile_numbers, seed)
+
+    def get_number_of_players(self):
+        return self._number_of_players
+
+    def get_winner(self):
+        return self._winner
+
+    def get_turns(self):
+        return self._turns
+
+    def get_seed(self):
+        return self._seed
+
+    def get_tile_types(self):
+        return self._tile_types
+
+    def get_tile_numbers(self):
+        return self._tile_numbers
+
+    def get_number_of_action_bytes(self):
+        return len(self._actions)
+
+    def add_action(self, action, state):
+        """
+        Adds an action that has just been applied to the GameState, for a dice roll the total that was rolled is
+        taken from the state
+        """
+        if action[0] == ROLL_DICE and len(action) == 1:
+            action = (ROLL_DICE, state.get_last_roll())
+        encode_action(action, self._actions)
+
+    def set_result(self, state):
+        """
+        Records the winner and number of turns of the finished GameState
+        """
+        winner = state.get_winner()
+        self._winner = None if winner is None else winner.get_index()
+        self._turns = state.get_turn_number()
+
+    def get_actions(self):
+        """
+        Generator that decodes the actions one at a time, in the order they were played
+        """
+        actions = self._actions
+        position = 0
+        while position < len(actions):
+            code, position = decode_varint(actions, position)
+            yield decode_action(code)
+
+    def create_state(self):
+        """
+        Returns a new GameState on the recorded board, before any actions were played
+        """
+        state = GameState(self._seed)
+        state.create_board(self._tile_types, self._tile_numbers)
+        for index in range(self._number_of_players):
+            state.add_player("Player " + str(index + 1))
+        return state
+
+    def replay(self):
+        """
+        Generator that plays the game again, yielding the action and the GameState after it is applied for every
+        action, the same GameState object is updated and yielded each time
+        Raises ValueError if a recorded action is not legal, which means the record is damaged
+        """
+        state = self.create_state()
+        for action in self.get_actions():
+            if not apply(state, action):
+                raise ValueError("recorded action " + str(action) + " could not be played")
+            yield action, state
+
+    def to_bytes(self):
+        """
+        Returns the game encoded as bytes, the header followed by the actions
+        """
+        buffer = bytearray()
+        buffer.append(self._number_of_players)
+        buffer.append(0 if self._winner is None else self._winner + 1)
+        encode_varint(self._turns, buffer)
+        encode_varint(0 if self._seed is None else self._seed + 1, buffer)
+        buffer.append(len(self._tile_types))
+        for tile_type, number in zip(self._tile_types, self._tile_numbers):
+            buffer.append(BOARD_TILE_INDEX[tile_type] * 16 + (number or 0))
+        buffer += self._actions
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data, header_only=False):
+        """
+        Returns the GameRecord encoded in data by to_bytes, without copying the actions if header_only is True
+        Raises ValueError if the data is too short to hold a game
+        """
+        number_of_players, winner, tile_types, tile_numbers, seed, turns, position = decode_header(data)
+        actions = b"" if header_only else data[position:]
+        return cls(number_of_players, tile_types, tile_numbers, seed, winner, turns, actions)
+
+
+def decode_header(data):
+    """
+    Reads the header at the start of an encoded game
+    Returns a tuple of (number of players, winner, tile types, tile numbers, seed, turns, position of the actions)
+    Raises ValueError if the data is too short to hold a header
+    """
+    if len(data) < FIXED_HEADER_SIZE:
+        raise ValueError("game record is too short")
+    number_of_players = data[0]
+    winner = None if data[1] == 0 else data[1] - 1
+    turns, position = decode_varint(data, FIXED_HEADER_SIZE)
+    seed, position = decode_varint(data, position)
+    seed = None if seed == 0 else seed - 1
+
+    if position >= len(data) or position + 1 + data[position] > len(data):
+        raise ValueError("game record is too short")
+    number_of_tiles = data[position]
+    position += 1
+    tile_types = []
+    tile_numbers = []
+    for tile_byte in data[position:position + number_of_tiles]:
+        tile_types.append(BOARD_TILE_TYPES[tile_byte >> 4])
+        tile_numbers.append((tile_byte & 0x0F) or None)
+    return number_of_players, winner, tile_types, tile_numbers, seed, turns, position + number_of_tiles
+
+
+class GameRecordWriter:
+    """
+    Appends game records to a record file as they finish
+    The file is opened for appending and the file header is only written when the file is empty, so many runs can add
+    to the same file
+    """
+    def __init__(self, path):
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC + bytes([RECORD_VERSION]))
+        self._games_written = 0
+
+    def get_games_written(self):
+        return self._games_written
+
+    def write_game(self, record):
+        """
+        Appends a GameRecord, or a game already encoded with GameRecord.to_bytes, to the file
+        """
+        if isinstance(record, GameRecord):
+            record = record.to_bytes()
+        length = bytearray()
+        encode_varint(len(record), length)
+        self._file.write(length)
+        self._file.write(record)
+        self._games_written += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+def check_file_header(record_file):
+    """
+    Reads the file header from the start of a record file
+    Raises ValueError if the file is not a record file of this version
+    """
+    file_header = record_file.read(len(MAGIC) + 1)
+    if file_header[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a game record file")
+    if file_header[len(MAGIC):] != bytes([RECORD_VERSION]):
+        raise ValueError("unsupported game record version")
+
+
+def read_game_records(path, header_only=False):
+    """
+    Generator that reads the games in a record file one at a time, yielding a GameRecord for each game
+    Only one game is held in memory at once, with header_only the actions of each game are skipped
+    Raises ValueError if the file is not a record file or ends in the middle of a game
+    """
+    with open(path, "rb") as record_file:
+        check_file_header(record_file)
+        while True:
+            length = read_varint(record_file)
+            if length is None:
+                return
+            data = record_file.read(length)
+            if len(data) < length:
+                raise ValueError("game record file ends in the middle of a game")
+            yield GameRecord.from_bytes(data, header_only)
@@ -0,0 +1,516 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Hosts many games at once in one asyncio event loop, so games can be played over the network without
+# the pygame window. Every game's GameState is kept in memory and players send their actions as JSON messages, one
+# message to a line, over TCP. Nothing waits on a player: messages are handled as they arrive and a player who does not
+# act within the turn timeout has the rest of their turn played for them, so a slow player never holds up any other
+# game. For example: python game_server.py --port 8765 --turn-timeout 30, then python game_client.py --games 100
+#
+# Messages sent to the server, each a JSON object with a "command":
+#   {"command": "create", "players": 4} - creates a game for that many players, answered with "created"
+#   {"command": "join", "game": 1, "name": "Player 1"} - takes the next free seat of a game, answered with "joined",
+#       once every seat is taken every player is sent "started" and then "state"
+#   {"command": "action", "game": 1, "action": ["build_road", 12]} - plays one of the actions in "legal_actions"
+#   {"command": "state", "game": 1} - asks for the "state" of a game again
+#   {"command": "list"} - lists the games with free seats, answered with "games"
+# Every player of a game is sent its "state" after every action, a request that can not be played is answered with
+# "error" and the game is not changed.
+# A game whose seats are not all taken within the join timeout is closed and its players are sent "closed", and a
+# connection can only have MAX_OPEN_GAMES of the games it created waiting for players at once, so clients can not
+# fill the server with games that are never played.
+
+import argparse
+import asyncio
+import json
+import random
+from actions import *
+from board_generator import BoardGenerator
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Seconds a player has to play each action before the server plays for them
+TURN_TIMEOUT = 30.0
+
+# Seconds a game can wait for its seats to be taken before it is closed
+JOIN_TIMEOUT = 300.0
+
+# Most games one connection can have created that are still waiting for players
+MAX_OPEN_GAMES = 100
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 4
+
+# A client that has not read this many bytes of its messages is too slow to keep up and is disconnected, instead of
+# the server waiting for it
+MAX_WRITE_BUFFER = 1 << 20
+
+# Commands
+CREATE = "create"
+JOIN = "join"
+ACTION = "action"
+STATE = "state"
+LIST = "list"
+
+
+def is_integer(value):
+    """
+    Returns True if a value read from JSON is a whole number, true and false are not numbers even though Python
+    counts bool as a kind of int
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class ClientConnection:
+    """
+    One client connected to the server, it can play in any number of games
+    Writer is the asyncio StreamWriter of the connection and games is the set of game ids the client has a seat in
+    Created games is the set of ids of the games the client created, kept to limit how many are waiting for players
+    """
+    def __init__(self, writer):
+        self._writer = writer
+        self._games = set()
+        self._created_games = set()
+
+    def get_games(self):
+        return self._games
+
+    def get_created_games(self):
+        return self._created_games
+
+    def is_closing(self):
+        return self._writer.is_closing()
+
+    def send(self, message):
+        """
+        Writes the message as one line of JSON without waiting for it to be sent, a client too slow to read its
+        messages is disconnected
+        """
+        if self._writer.is_closing():
+            return
+        self._writer.write(json.dumps(message).encode() + b"\n")
+        if self._writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self._writer.close()
+
+    def send_error(self, reason):
+        self.send({"type": "error", "reason": reason})
+
+    def close(self):
+        self._writer.close()
+
+
+class GameSession:
+    """
+    One game hosted by the server
+    Game id is the number the clients use for the game, state is its GameState and seats holds the ClientConnection
+    of each player, None for a seat that is free or whose player left, the game starts once every seat is taken
+    Last action is the last action played and the seat that played it
+    Timer is the asyncio timer handle that closes the game if its seats are not taken before the join timeout, and
+    once it has started plays for the current player when the turn timeout runs out, the timeout player's random
+    generator chooses those actions
+    On game over is called with the GameSession once the game is over, whether the last action was sent by a player
+    or played by the turn timeout, or when it is closed without starting
+    """
+    def __init__(self, game_id, number_of_players, seed=None, turn_timeout=TURN_TIMEOUT, tile_types=None,
+                 tile_numbers=None, on_game_over=None):
+        self._game_id = game_id
+        self._state = new_game(["Player " + str(seat + 1) for seat in range(number_of_players)], seed, tile_types,
+                               tile_numbers)
+        self._seats = [None] * number_of_players
+        self._player_names = [None] * number_of_players
+        self._started = False
+        self._turn_timeout = turn_timeout
+        self._timer = None
+        self._timeout_random = random.Random(seed)
+        self._last_action = None
+        self._on_game_over = on_game_over
+
+    def get_game_id(self):
+        return self._game_id
+
+    def get_state(self):
+        return self._state
+
+    def get_seats(self):
+        return self._seats
+
+    def is_started(self):
+        return self._started
+
+    def get_free_seats(self):
+        return 0 if self._started else self._seats.count(None)
+
+    def add_player(self, connection, player_name):
+        """
+        Seats the connection's player in the first free seat and starts the game once every seat is taken
+        Returns the seat, or None if the game has already started
+        """
+        if self._started:
+            return None
+        seat = self._seats.index(None)
+        self._seats[seat] = connection
+        self._player_names[seat] = player_name
+        connection.get_games().add(self._game_id)
+        connection.send({"type": "joined", "game": self._game_id, "seat": seat})
+
+        if None not in self._seats:
+            self._started = True
+            board = self._state.get_board()
+            for connection in self._seats:
+                connection.send({"type": "started", "game": self._game_id, "players": self._player_names,
+                                 "tile_types": [board.get_tile_type(tile)
+                                                for tile in range(board.get_number_of_tiles())],
+                                 "tile_numbers": [board.get_tile_number(tile)
+                                                  for tile in range(board.get_number_of_tiles())]})
+            self.start_turn_timer()
+            self.send_state()
+        return seat
+
+    def start_join_timer(self, join_timeout):
+        """
+        Starts the timeout for every seat to be taken, the turn timer replaces it once the game starts
+        """
+        self._timer = asyncio.get_running_loop().call_later(join_timeout, self.close_unstarted)
+
+    def close_unstarted(self):
+        """
+        Closes a game whose seats were not all taken in time, the players who joined are sent "closed"
+        """
+        self._timer = None
+        if self._started:
+            return
+        for connection in self._seats:
+            if connection is not None:
+                connection.send({"type": "closed", "game": self._game_id})
+        if self._on_game_over is not None:
+            self._on_game_over(self)
+
+    def remove_connection(self, connection):
+        """
+        Frees every seat of a connection that left, the game carries on and the turn timeout plays for those seats
+        """
+        for seat in range(len(self._seats)):
+            if self._seats[seat] is connection:
+                self._seats[seat] = None
+
+    def is_abandoned(self):
+        """
+        Returns True if every player has left
+        """
+        return self._seats.count(None) == len(self._seats)
+
+    def play(self, seat, action):
+        """
+        Plays the action for the player in seat if it is their turn and the action is one of their legal actions
+        Returns None if the action was played, otherwise the reason it was not
+        """
+        if not self._started:
+            return "the game has not started"
+        if is_terminal(self._state):
+            return "the game is over"
+        if seat != self._state.get_current_player():
+            return "it is not your turn"
+        if action not in legal_actions(self._state):
+            return "that action is not allowed"
+
+        apply(self._state, action)
+        self._last_action = (seat, action)
+        self.finish_action()
+        return None
+
+    def finish_action(self):
+        """
+        Sends every player the state after an action and restarts the turn timeout, or ends the game if it is over
+        """
+        self.start_turn_timer()
+        self.send_state()
+        if is_terminal(self._state) and self._on_game_over is not None:
+            self._on_game_over(self)
+
+    def start_turn_timer(self):
+        """
+        Restarts the turn timeout for the current player, it is stopped once the game is over
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not is_terminal(self._state):
+            self._timer = asyncio.get_running_loop().call_later(self._turn_timeout, self.play_timeout)
+
+    def stop_turn_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def play_timeout(self):
+        """
+        Plays the rest of the turn of a player who ran out of time, ending the turn as soon as it is allowed and
+        otherwise playing a random legal action
+        """
+        self._timer = None
+        seat = self._state.get_current_player()
+        while not is_terminal(self._state) and self._state.get_current_player() == seat:
+            actions = legal_actions(self._state)
+            action = (END_TURN,) if (END_TURN,) in actions else self._timeout_random.choice(actions)
+            apply(self._state, action)
+            self._last_action = (seat, action)
+        self.finish_action()
+
+    def get_state_message(self, seat):
+        """
+        Returns the state of the game as seen by the player in seat, the other players' hands are only counted and
+        the legal actions are only listed for the player whose turn it is
+        """
+        state = self._state
+        number_of_players = state.get_number_of_players()
+        winner = state.get_winner()
+        current_player = state.get_current_player()
+        actions = legal_actions(state) if seat == current_player and not is_terminal(state) else []
+        return {"type": "state",
+                "game": self._game_id,
+                "seat": seat,
+                "phase": state.get_phase(),
+                "turn": state.get_turn_number(),
+                "current_player": current_player,
+                "last_roll": state.get_last_roll(),
+                "last_action": None if self._last_action is None else [self._last_action[0],
+                                                                       list(self._last_action[1])],
+                "robber": state.get_robber_tile(),
+                "hand": state.get_player(seat).get_resources(),
+                "hand_sizes": [sum(state.get_player(player).get_resources().values())
+                               for player in range(number_of_players)],
+                "victory_points": [state.get_victory_points(player) for player in range(number_of_players)],
+                "settlements": [state.get_player(player).get_settlements() for player in range(number_of_players)],
+                "cities": [state.get_player(player).get_cities() for player in range(number_of_players)],
+                "roads": [state.get_player(player).get_roads() for player in range(number_of_players)],
+                "longest_road": state.get_longest_road_player(),
+                "winner": None if winner is None else winner.get_index(),
+                "legal_actions": [list(action) for action in actions]}
+
+    def send_state(self, connection=None):
+        """
+        Sends the state of the game to every player, or only to the seats of connection if it is given
+        """
+        for seat, seat_connection in enumerate(self._seats):
+            if seat_connection is not None and (connection is None or seat_connection is connection):
+                seat_connection.send(self.get_state_message(seat))
+
+
+class GameServer:
+    """
+    Hosts games for clients connected over TCP, every game and connection is handled in one asyncio event loop
+    Games maps each game id to its GameSession, a game is removed once it is over, every player has left or its seats
+    were not taken within the join timeout, and connections maps each ClientConnection to the asyncio task reading its
+    messages
+    Seed is the seed of the random generator that picks the seed of each game, so a server started with the same seed
+    deals the same games, turn timeout is the seconds a player has for each action, join timeout is the seconds a
+    game waits for its players and if fair boards is True every game is played on a board from the BoardGenerator
+    """
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, seed=None, turn_timeout=TURN_TIMEOUT, fair_boards=False,
+                 join_timeout=JOIN_TIMEOUT):
+        self._host = host
+        self._port = port
+        self._turn_timeout = turn_timeout
+        self._join_timeout = join_timeout
+        self._random = random.Random(seed)
+        self._board_generator = BoardGenerator(seed) if fair_boards else None
+        self._games = {}
+        self._next_game_id = 1
+        self._finished_games = 0
+        self._connections = {}
+        self._server = None
+
+    def get_games(self):
+        return self._games
+
+    def get_finished_games(self):
+        return self._finished_games
+
+    def get_port(self):
+        """
+        Returns the port the server is listening on, the port picked by the system if it was started on port 0
+        """
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self):
+        """
+        Starts listening for connections, the connections are handled by the running event loop
+        """
+        self._server = await asyncio.start_server(self.handle_connection, self._host, self._port)
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops listening, stops the turn timers of every game and disconnects every client
+        """
+        if self._server is not None:
+            self._server.close()
+        for session in self._games.values():
+            session.stop_turn_timer()
+        self._games = {}
+        tasks = list(self._connections.values())
+        for connection in self._connections:
+            connection.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Reads one message per line from a client until it disconnects, every message is handled as soon as it is read
+        """
+        connection = ClientConnection(writer)
+        self._connections[connection] = asyncio.current_task()
+        try:
+            while not connection.is_closing():
+                line = await reader.readline()
+                if not line:
+                    break
+                self.handle_line(connection, line)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            del self._connections[connection]
+            self.remove_connection(connection)
+            connection.close()
+
+    def handle_line(self, connection, line):
+        """
+        Decodes one line of JSON from a client and handles it, a line that is not a command is answered with an error
+        """
+        try:
+            message = json.loads(line)
+        except ValueError:
+            connection.send_error("message is not JSON")
+            return
+        if not isinstance(message, dict):
+            connection.send_error("message is not a JSON object")
+            return
+        try:
+            self.handle_message(connection, message)
+        except TypeError:
+            # a field of the wrong type only turns away this message, the connection and its seats are kept
+            connection.send_error("message has a field of the wrong type")
+
+    def handle_message(self, connection, message):
+        """
+        Handles one command from a client
+        """
+        command = message.get("command")
+        if command == LIST:
+            connection.send({"type": "games",
+                             "games": [{"game": game_id, "free_seats": session.get_free_seats()}
+                                       for game_id, session in self._games.items() if session.get_free_seats() > 0]})
+            return
+        if command == CREATE:
+            number_of_players = message.get("players", MAX_PLAYERS)
+            if not is_integer(number_of_players) or not MIN_PLAYERS <= number_of_players <= MAX_PLAYERS:
+                connection.send_error("a game has " + str(MIN_PLAYERS) + " to " + str(MAX_PLAYERS) + " players")
+                return
+            # only the games still waiting for players count towards the limit
+            created_games = connection.get_created_games()
+            for game_id in list(created_games):
+                if game_id not in self._games or self._games[game_id].is_started():
+                    created_games.discard(game_id)
+            if len(created_games) >= MAX_OPEN_GAMES:
+                connection.send_error("you already have " + str(MAX_OPEN_GAMES) + " games waiting for players")
+                return
+            session = self.create_game(number_of_players)
+            created_games.add(session.get_game_id())
+            connection.send({"type": "created", "game": session.get_game_id()})
+            return
+
+        game_id = message.get("game")
+        session = self._games.get(game_id) if is_integer(game_id) else None
+        if command not in (JOIN, ACTION, STATE):
+            connection.send_error("unknown command")
+        elif session is None:
+            connection.send_error("no such game")
+        elif command == JOIN:
+            if session.add_player(connection, str(message.get("name", ""))) is None:
+                connection.send_error("the game is full")
+        elif session.get_game_id() not in connection.get_games():
+            connection.send_error("you are not playing in that game")
+        elif command == STATE:
+            session.send_state(connection)
+        else:
+            action = message.get("action")
+            if not isinstance(action, list) or not action or any(isinstance(part, bool) for part in action):
+                connection.send_error("an action is a list starting with the action type")
+                return
+            # a connection can hold several seats of one game, such as a test client playing every seat
+            seat = session.get_state().get_current_player()
+            if session.get_seats()[seat] is not connection:
+                seat = session.get_seats().index(connection)
+            reason = session.play(seat, tuple(action))
+            if reason is not None:
+                connection.send_error(reason)
+
+    def create_game(self, number_of_players):
+        """
+        Creates a new game with a seed from the server's random generator and returns its GameSession, the game is
+        closed if its seats are not taken within the join timeout
+        """
+        tile_types, tile_numbers = None, None
+        if self._board_generator is not None:
+            tile_types, tile_numbers = self._board_generator.create_tiles()
+        session = GameSession(self._next_game_id, number_of_players, self._random.getrandbits(32), self._turn_timeout,
+                              tile_types, tile_numbers, self.finish_game)
+        self._games[self._next_game_id] = session
+        self._next_game_id += 1
+        session.start_join_timer(self._join_timeout)
+        return session
+
+    def finish_game(self, session):
+        """
+        Removes a game that is over, that every player has left or that was closed without starting
+        """
+        session.stop_turn_timer()
+        if self._games.pop(session.get_game_id(), None) is not None and is_terminal(session.get_state()):
+            self._finished_games += 1
+        for connection in session.get_seats():
+            if connection is not None:
+                connection.get_games().discard(session.get_game_id())
+
+    def remove_connection(self, connection):
+        """
+        Frees the seats of a client that disconnected, a game every player has left is removed
+        """
+        for game_id in list(connection.get_games()):
+            session = self._games.get(game_id)
+            if session is None:
+                continue
+            session.remove_connection(connection)
+            if session.is_abandoned():
+                self.finish_game(session)
+
+
+def main(argv=None):
+    """
+    Reads the server settings from the command line and serves games until it is stopped
+    """
+    parser = argparse.ArgumentParser(description="Host Catan games for clients connected over TCP")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the games dealt by the server")
+    parser.add_argument("--turn-timeout", type=float, default=TURN_TIMEOUT,
+                        help="seconds a player has for each action before the server plays for them")
+    parser.add_argument("--fair-boards", action="store_true",
+                        help="play every game on a board with the 6s and 8s apart and the resources spread out")
+    parser.add_argument("--join-timeout", type=float, default=JOIN_TIMEOUT,
+                        help="seconds a game waits for its players before it is closed")
+    arguments = parser.parse_args(argv)
+
+    server = GameServer(arguments.host, arguments.port, arguments.seed, arguments.turn_timeout,
+                        arguments.fair_boards, arguments.join_timeout)
+    print("Serving games on " + arguments.host + ":" + str(arguments.port))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1113 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: A display-free rules engine for the catan project. It contains the classes Board, PlayerState and
+# GameState, which hold the board layout, the players and the rules of the game without importing pygame, so games
+# can be created and played on machines without a display. GameBoard and Player draw the state held here.
+
+import random
+import struct
+from board_topology import get_topology
+from zobrist import get_zobrist_keys
+from road_network import LONGEST_ROAD_MINIMUM, LONGEST_ROAD_POINTS, split_road_pieces, measure_road
+
+# Resources a player can hold, in the order they are displayed
+RESOURCE_TYPES = ["wheat", "brick", "wood", "wool", "ore"]
+
+# The 18 resource tiles on the board, the 19th tile is always the desert
+TILE_TYPES = ["wheat", "wool", "wood"] * 4 + ["ore", "brick"] * 3
+DESERT = "desert"
+
+# each number corresponds to a number token on one of the resource tiles
+NUMBER_TOKENS = [2, 12] + [3, 4, 5, 6, 8, 9, 10, 11] * 2
+
+# Position of each resource in a player's row of the resources array
+RESOURCE_INDEX = {resource: index for index, resource in enumerate(RESOURCE_TYPES)}
+NUMBER_OF_RESOURCES = len(RESOURCE_TYPES)
+
+# Building costs and trade rates
+SETTLEMENT_COST = {"wheat": 1, "brick": 1, "wood": 1, "wool": 1}
+ROAD_COST = {"brick": 1, "wood": 1}
+CITY_COST = {"wheat": 2, "ore": 3}
+BANK_TRADE_RATE = 4
+WINNING_VICTORY_POINTS = 10
+
+# Phases of the game, players place two settlements and roads each during setup, then every turn starts by rolling
+# the dice, moving the robber if a 7 was rolled, then building and trading until the player ends their turn
+SETUP_SETTLEMENT_PHASE = "setup_settlement"
+SETUP_ROAD_PHASE = "setup_road"
+ROLL_PHASE = "roll"
+ROBBER_PHASE = "robber"
+BUILD_PHASE = "build"
+GAME_OVER_PHASE = "game_over"
+PHASES = [SETUP_SETTLEMENT_PHASE, SETUP_ROAD_PHASE, ROLL_PHASE, ROBBER_PHASE, BUILD_PHASE, GAME_OVER_PHASE]
+
+# Tile types in the order they are numbered when a board is saved, each tile is saved as one byte of the type's
+# position in this list * 16 + the number token, 0 for the desert
+BOARD_TILE_TYPES = RESOURCE_TYPES + [DESERT]
+BOARD_TILE_INDEX = {tile_type: index for index, tile_type in enumerate(BOARD_TILE_TYPES)}
+
+# Snapshots start with SNAPSHOT_MAGIC and SNAPSHOT_VERSION, then the SNAPSHOT_HEADER_FORMAT fields: the number of
+# players, phase, current player, setup step, last settlement + 1, last roll, robber tile, whether the dice generator
+# is included, the turn number and the player with the longest road + 1
+# Version 1 snapshots were saved before the longest road was scored and are loaded without it
+SNAPSHOT_MAGIC = b"CTNS"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER_FORMAT = "<BBBBBBBBIB"
+SNAPSHOT_HEADER_FORMATS = {1: "<BBBBBBBBI", 2: SNAPSHOT_HEADER_FORMAT}
+# The state of a random.Random generator is its version, 625 integers and a float that is not always set
+RANDOM_STATE_FORMAT = "<B625IBd"
+
+
+def mask_to_list(mask):
+    """
+    Returns the list of the positions of the bits that are set in the mask, from lowest to highest
+    """
+    positions = []
+    while mask:
+        lowest_bit = mask & -mask
+        positions.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+    return positions
+
+
+class Board:
+    """
+    One game's board, the resource types and number tokens shuffled onto the shared BoardTopology
+
+    Tiles, vertices (the 54 corners a settlement can be built on) and edges (the 72 sides a road can be built on) are
+    numbered by the BoardTopology, which also holds the adjacency tables
+    tile_types and tile_numbers hold the resource type and number token of each tile, the desert has no number
+    number_tiles holds the tiles with each number token, indexed by the number
+    A board is not changed after its tiles are created, so copies of a GameState share the same Board
+    """
+    __slots__ = ("_topology", "_tile_types", "_tile_numbers", "_number_tiles", "_desert_tile")
+
+    def __init__(self, topology=None):
+        if topology is None:
+            topology = get_topology()
+        self._topology = topology
+        self._tile_types = [DESERT] * topology.get_number_of_tiles()
+        self._tile_numbers = [None] * topology.get_number_of_tiles()
+        self._number_tiles = [[] for number in range(13)]
+        self._desert_tile = None
+
+    def get_topology(self):
+        return self._topology
+
+    def get_number_of_tiles(self):
+        return self._topology.get_number_of_tiles()
+
+    def get_number_of_vertices(self):
+        return self._topology.get_number_of_vertices()
+
+    def get_number_of_edges(self):
+        return self._topology.get_number_of_edges()
+
+    def get_tile_type(self, tile):
+        return self._tile_types[tile]
+
+    def get_tile_number(self, tile):
+        return self._tile_numbers[tile]
+
+    def get_number_tiles(self, number):
+        return self._number_tiles[number]
+
+    def get_desert_tile(self):
+        return self._desert_tile
+
+    def get_tile_vertices(self, tile):
+        return self._topology.get_tile_vertices(tile)
+
+    def get_vertex_tiles(self, vertex):
+        return self._topology.get_vertex_tiles(vertex)
+
+    def get_vertex_neighbours(self, vertex):
+        return self._topology.get_vertex_neighbours(vertex)
+
+    def get_vertex_edges(self, vertex):
+        return self._topology.get_vertex_edges(vertex)
+
+    def get_edge_vertices(self, edge):
+        return self._topology.get_edge_vertices(edge)
+
+    def get_edge(self, vertex1, vertex2):
+        """
+        Returns the edge between the two vertices, or None if the vertices are not neighbours
+        """
+        return self._topology.get_edge(vertex1, vertex2)
+
+    def create_tiles(self, generator=random):
+        """
+        Shuffles the resource types and number tokens onto the tiles to ensure the map is different for each game
+        Takes generator, the random number generator used for the shuffles, the random module by default
+        """
+        number_of_tiles = self._topology.get_number_of_tiles()
+        type_list = list(TILE_TYPES)
+        number_list = list(NUMBER_TOKENS)
+        positions = list(range(number_of_tiles))
+
+        generator.shuffle(type_list)
+        generator.shuffle(positions)
+        generator.shuffle(number_list)
+
+        # filling the first 18 positions with resources, then the desert goes on the last position
+        tile_types = [DESERT] * number_of_tiles
+        tile_numbers = [None] * number_of_tiles
+        for index in range(len(type_list)):
+            tile_types[positions[index]] = type_list[index]
+            tile_numbers[positions[index]] = number_list[index]
+        self.set_tiles(tile_types, tile_numbers)
+
+    def get_tile_bytes(self):
+        """
+        Returns the board as bytes, one byte for each tile made from its type and number token
+        """
+        return bytes(BOARD_TILE_INDEX[tile_type] * 16 + (number or 0)
+                     for tile_type, number in zip(self._tile_types, self._tile_numbers))
+
+    def set_tile_bytes(self, tile_bytes):
+        """
+        Takes bytes made by get_tile_bytes and places the tiles on the board
+        """
+        self.set_tiles([BOARD_TILE_TYPES[tile_byte >> 4] for tile_byte in tile_bytes],
+                       [(tile_byte & 0x0F) or None for tile_byte in tile_bytes])
+
+    def set_tiles(self, tile_types, tile_numbers):
+        """
+        Takes the resource type and number token of every tile, with None as the number of the desert, and places
+        them on the board
+        """
+        self._tile_types = list(tile_types)
+        self._tile_numbers = list(tile_numbers)
+        self._desert_tile = self._tile_types.index(DESERT)
+
+        number_of_tiles = self._topology.get_number_of_tiles()
+        self._number_tiles = [[] for number in range(13)]
+        for tile in range(number_of_tiles):
+            if self._tile_numbers[tile] is not None:
+                self._number_tiles[self._tile_numbers[tile]].append(tile)
+
+
+class PlayerState:
+    """
+    A view of one player's information in a GameState, the information itself is stored in the GameState arrays
+    Index is the player's position in the turn order, starting at 0
+    """
+    __slots__ = ("_state", "_index")
+
+    def __init__(self, state, index):
+        self._state = state
+        self._index = index
+
+    def get_index(self):
+        return self._index
+
+    def get_player_name(self):
+        return self._state.get_player_names()[self._index]
+
+    def get_resources(self):
+        """
+        Returns a dictionary where the key is the name of the resource and the value is the number of resources of
+        that type, changing the dictionary does not change the player's hand
+        """
+        start = self._index * NUMBER_OF_RESOURCES
+        counts = self._state.get_resource_counts()[start:start + NUMBER_OF_RESOURCES]
+        return dict(zip(RESOURCE_TYPES, counts))
+
+    def get_settlements(self):
+        return mask_to_list(self._state.get_settlement_mask(self._index))
+
+    def get_cities(self):
+        return mask_to_list(self._state.get_city_mask(self._index))
+
+    def get_roads(self):
+        return mask_to_list(self._state.get_road_mask(self._index))
+
+    def get_victory_points(self):
+        return self._state.get_victory_points(self._index)
+
+    def get_road_length(self):
+        return self._state.get_road_length(self._index)
+
+    def has_longest_road(self):
+        return self._state.get_longest_road_player() == self._index
+
+    def add_resource(self, resource, amount):
+        self._state.add_resource(self._index, resource, amount)
+
+    def add_victory_points(self, number_of_points):
+        self._state.add_victory_points(self._index, number_of_points)
+
+    def can_afford(self, cost):
+        return self._state.can_afford(self._index, cost)
+
+    def pay(self, cost):
+        self._state.pay(self._index, cost)
+
+
+class GameState:
+    """
+    Holds everything needed to play a game of catan and applies the rules of the game
+
+    The state is kept in a few flat arrays and integer bitmasks so copying a game only copies a handful of small lists
+    Board is the Board object with the tile layout, shared with every copy of the state
+    Player names is a tuple of the player names in turn order
+    Resources is a flat list with NUMBER_OF_RESOURCES counts for each player, in the order of RESOURCE_TYPES
+    Victory points is a list with each player's victory points
+    Settlement masks, city masks and road masks hold one bitmask for each player, bit n is set if the player has a
+    settlement or city on vertex n, or a road on edge n
+    Occupied mask has a bit set for every vertex with a building on it, road mask has a bit set for every edge with a road
+    The legal placements are kept up to date on every build instead of being searched for: open mask has a bit set for
+    every vertex that is empty with no building next to it, road end masks hold the vertices at the ends of each
+    player's roads and buildable road masks hold the empty edges each player's network can be extended onto
+    Road pieces hold a tuple of (edge mask, length) for each connected piece of each player's roads, with the length
+    of the longest road through it, road lengths hold each player's longest road and longest road player is the
+    index of the player holding the longest road award, or None
+    Robber tile is the tile the robber is currently on
+    Phase is the current phase of the game and current player is the index of the player whose turn it is
+    Setup step counts the settlement and road pairs placed during setup, last settlement is the vertex of the most
+    recent setup settlement, which the setup road has to be attached to
+    Last roll is the most recent dice roll and turn number counts the turns played after setup
+    Roll payouts is indexed by dice roll and holds a tuple of (player index, resource, amount) for every resource paid
+    out when that number is rolled, it is updated whenever a settlement or city is built or the robber moves
+    Hash is the Zobrist hash of the board, buildings, roads, robber, resources, current player, phase and last
+    settlement, every method that changes one of them updates the hash with the shared ZobristKeys in keys
+    Seed is the game's seed, the board is shuffled with board random and the dice are rolled with dice random, two
+    separate generators seeded from it, so a game is reproduced exactly by its seed and the actions played
+    """
+    __slots__ = ("_board", "_player_names", "_resources", "_victory_points", "_settlement_masks", "_city_masks",
+                 "_road_masks", "_occupied_mask", "_road_mask", "_open_mask", "_road_end_masks",
+                 "_buildable_road_masks", "_road_pieces", "_road_lengths", "_longest_road_player", "_robber_tile",
+                 "_phase", "_current_player",
+                 "_setup_step", "_last_settlement", "_last_roll", "_turn_number", "_roll_payouts", "_keys", "_hash",
+                 "_seed", "_board_random", "_dice_random")
+
+    def __init__(self, seed=None):
+        self._board = Board()
+        self._player_names = ()
+        self._resources = []
+        self._victory_points = []
+        self._settlement_masks = []
+        self._city_masks = []
+        self._road_masks = []
+        self._occupied_mask = 0
+        self._road_mask = 0
+        self._open_mask = (1 << self._board.get_number_of_vertices()) - 1
+        self._road_end_masks = []
+        self._buildable_road_masks = []
+        self._road_pieces = []
+        self._road_lengths = []
+        self._longest_road_player = None
+        self._robber_tile = None
+        self._phase = SETUP_SETTLEMENT_PHASE
+        self._current_player = 0
+        self._setup_step = 0
+        self._last_settlement = None
+        self._last_roll = None
+        self._turn_number = 0
+        self._roll_payouts = [() for number in range(13)]
+        self._keys = get_zobrist_keys()
+        self._hash = self._keys.get_phase_key(self._phase) ^ self._keys.get_player_key(self._current_player)
+
+        # without a seed one is drawn from the random module, so the game can still be reproduced from get_seed
+        if seed is None:
+            seed = random.getrandbits(63)
+        self._seed = seed
+        self._board_random = random.Random(str(seed) + "-board")
+        self._dice_random = random.Random(str(seed) + "-dice")
+
+    def copy(self, dice_random=None, share_dice=False):
+        """
+        Returns an independent copy of the game, the board and player names are shared because they never change
+        The copy rolls its dice with dice_random if it is given, otherwise with a copy of this game's dice generator
+        so it rolls the same numbers as this game would
+        If share_dice is True the copy uses this game's dice generator itself instead of copying it, which is cheaper
+        but means rolling on the copy also moves this game's dice
+        """
+        state = GameState.__new__(GameState)
+        state._board = self._board
+        state._player_names = self._player_names
+        state._resources = self._resources[:]
+        state._victory_points = self._victory_points[:]
+        state._settlement_masks = self._settlement_masks[:]
+        state._city_masks = self._city_masks[:]
+        state._road_masks = self._road_masks[:]
+        state._occupied_mask = self._occupied_mask
+        state._road_mask = self._road_mask
+        state._open_mask = self._open_mask
+        state._road_end_masks = self._road_end_masks[:]
+        state._buildable_road_masks = self._buildable_road_masks[:]
+        state._road_pieces = self._road_pieces[:]
+        state._road_lengths = self._road_lengths[:]
+        state._longest_road_player = self._longest_road_player
+        state._robber_tile = self._robber_tile
+        state._phase = self._phase
+        state._current_player = self._current_player
+        state._setup_step = self._setup_step
+        state._last_settlement = self._last_settlement
+        state._last_roll = self._last_roll
+        state._turn_number = self._turn_number
+        state._roll_payouts = self._roll_payouts[:]
+        state._keys = self._keys
+        state._hash = self._hash
+        state._seed = self._seed
+        state._board_random = self._board_random
+        if dice_random is None:
+            dice_random = self._dice_random
+            if not share_dice:
+                dice_random = random.Random()
+                dice_random.setstate(self._dice_random.getstate())
+        state._dice_random = dice_random
+        return state
+
+    def to_bytes(self, include_random=False):
+        """
+        Returns a snapshot of the game as bytes, which from_bytes turns back into an equal GameState
+        Only the players, board, buildings, roads, resources and turn information are saved, the rest is rebuilt
+        from them, the dice generator is only saved if include_random is True so the game rolls the same dice
+        """
+        topology = self._board.get_topology()
+        vertex_bytes = (topology.get_number_of_vertices() + 7) // 8
+        edge_bytes = (topology.get_number_of_edges() + 7) // 8
+
+        snapshot = bytearray(SNAPSHOT_MAGIC)
+        snapshot.append(SNAPSHOT_VERSION)
+        snapshot += struct.pack(SNAPSHOT_HEADER_FORMAT, len(self._player_names), PHASES.index(self._phase),
+                                self._current_player, self._setup_step,
+                                0 if self._last_settlement is None else self._last_settlement + 1,
+                                self._last_roll or 0, self._robber_tile, include_random, self._turn_number,
+                                0 if self._longest_road_player is None else self._longest_road_player + 1)
+
+        # the seed is saved as text with a flag for whether it was a number, so any seed can be saved
+        seed_text = str(self._seed).encode("utf-8")
+        snapshot += struct.pack("<BH", isinstance(self._seed, int), len(seed_text)) + seed_text
+        snapshot += self._board.get_tile_bytes()
+
+        for player_index, player_name in enumerate(self._player_names):
+            name_bytes = player_name.encode("utf-8")
+            snapshot += struct.pack("<H", len(name_bytes)) + name_bytes
+            start = player_index * NUMBER_OF_RESOURCES
+            snapshot += struct.pack("<5IH", *self._resources[start:start + NUMBER_OF_RESOURCES],
+                                    self._victory_points[player_index])
+            snapshot += self._settlement_masks[player_index].to_bytes(vertex_bytes, "little")
+            snapshot += self._city_masks[player_index].to_bytes(vertex_bytes, "little")
+            snapshot += self._road_masks[player_index].to_bytes(edge_bytes, "little")
+
+        if include_random:
+            version, internal_state, gauss_next = self._dice_random.getstate()
+            snapshot += struct.pack(RANDOM_STATE_FORMAT, version, *internal_state, gauss_next is not None,
+                                    gauss_next or 0.0)
+        return bytes(snapshot)
+
+    @classmethod
+    def from_bytes(cls, snapshot):
+        """
+        Returns the GameState saved in a snapshot made by to_bytes, on a new Board
+        Raises ValueError if the snapshot is not a GameState snapshot of this version, is cut short or holds a value
+        that is out of range for the board or players
+        """
+        if snapshot[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or len(snapshot) <= len(SNAPSHOT_MAGIC):
+            raise ValueError("not a game snapshot")
+        header_format = SNAPSHOT_HEADER_FORMATS.get(snapshot[len(SNAPSHOT_MAGIC)])
+        if header_format is None:
+            raise ValueError("unsupported game snapshot version")
+
+        try:
+            position = len(SNAPSHOT_MAGIC) + 1
+            header = struct.unpack_from(header_format, snapshot, position)
+            number_of_players, phase, current_player, setup_step, last_settlement, last_roll, robber_tile, \
+                include_random, turn_number = header[:9]
+            longest_road_player = header[9] if len(header) > 9 else 0
+            position += struct.calcsize(header_format)
+
+            seed_is_number, seed_length = struct.unpack_from("<BH", snapshot, position)
+            position += 3
+            seed = bytes(snapshot[position:position + seed_length]).decode("utf-8")
+            position += seed_length
+            if seed_is_number:
+                seed = int(seed)
+
+            state = cls(seed)
+            topology = state._board.get_topology()
+            number_of_vertices = topology.get_number_of_vertices()
+            number_of_edges = topology.get_number_of_edges()
+            number_of_tiles = topology.get_number_of_tiles()
+            vertex_bytes = (number_of_vertices + 7) // 8
+            edge_bytes = (number_of_edges + 7) // 8
+            state._board.set_tile_bytes(snapshot[position:position + number_of_tiles])
+            position += number_of_tiles
+
+            for player_index in range(number_of_players):
+                name_length = struct.unpack_from("<H", snapshot, position)[0]
+                position += 2
+                state.add_player(bytes(snapshot[position:position + name_length]).decode("utf-8"))
+                position += name_length
+                counts = struct.unpack_from("<5IH", snapshot, position)
+                position += struct.calcsize("<5IH")
+                state._resources[player_index * NUMBER_OF_RESOURCES:(player_index + 1) * NUMBER_OF_RESOURCES] = \
+                    counts[:NUMBER_OF_RESOURCES]
+                state._victory_points[player_index] = counts[NUMBER_OF_RESOURCES]
+                for masks, mask_bytes in ((state._settlement_masks, vertex_bytes), (state._city_masks, vertex_bytes),
+                                          (state._road_masks, edge_bytes)):
+                    masks[player_index] = int.from_bytes(snapshot[position:position + mask_bytes], "little")
+                    position += mask_bytes
+
+            if include_random:
+                values = struct.unpack_from(RANDOM_STATE_FORMAT, snapshot, position)
+                position += struct.calcsize(RANDOM_STATE_FORMAT)
+                state._dice_random.setstate((values[0], values[1:626], values[627] if values[626] else None))
+            if position != len(snapshot):
+                raise ValueError("game snapshot has extra data")
+            if phase >= len(PHASES) or robber_tile >= number_of_tiles or current_player >= max(number_of_players, 1):
+                raise ValueError("game snapshot is damaged: phase, robber tile or current player out of range")
+            if last_settlement > number_of_vertices or longest_road_player > number_of_players:
+                raise ValueError("game snapshot is damaged: last settlement or longest road player out of range")
+            # the masks are read from whole bytes, so any bit past the last vertex or edge means the snapshot is damaged
+            for player_index in range(number_of_players):
+                buildings = state._settlement_masks[player_index] | state._city_masks[player_index]
+                if buildings >> number_of_vertices or state._road_masks[player_index] >> number_of_edges:
+                    raise ValueError("game snapshot is damaged: a building or road is off the board")
+
+            state._phase = PHASES[phase]
+            state._current_player = current_player
+            state._setup_step = setup_step
+            state._last_settlement = None if last_settlement == 0 else last_settlement - 1
+            state._last_roll = last_roll or None
+            state._robber_tile = robber_tile
+            state._turn_number = turn_number
+            state._longest_road_player = None if longest_road_player == 0 else longest_road_player - 1
+            for player_index in range(number_of_players):
+                state._occupied_mask |= state._settlement_masks[player_index] | state._city_masks[player_index]
+                state._road_mask |= state._road_masks[player_index]
+            state.rebuild_placement_masks()
+            state.rebuild_road_pieces()
+            for number in range(len(state._roll_payouts)):
+                state.update_roll_payouts(number)
+            state._hash = state.compute_hash()
+        except (struct.error, UnicodeDecodeError, IndexError) as error:
+            raise ValueError("game snapshot is damaged: " + str(error))
+        return state
+
+    def get_hash(self):
+        """
+        Returns the 64-bit Zobrist hash of the game, which is kept up to date as the game is played
+        """
+        return self._hash
+
+    def compute_hash(self):
+        """
+        Returns the Zobrist hash of the game calculated from scratch, which is always the same as get_hash
+        """
+        keys = self._keys
+        board = self._board
+        game_hash = keys.get_phase_key(self._phase) ^ keys.get_player_key(self._current_player) ^ \
+            keys.get_last_settlement_key(self._last_settlement) ^ keys.get_robber_key(self._robber_tile) ^ \
+            keys.get_longest_road_key(self._longest_road_player)
+        if board.get_desert_tile() is not None:
+            for tile in range(board.get_number_of_tiles()):
+                game_hash ^= keys.get_tile_key(tile, board.get_tile_type(tile), board.get_tile_number(tile))
+
+        for slot, count in enumerate(self._resources):
+            game_hash ^= keys.get_resource_key(slot, count)
+        for player_index in range(len(self._player_names)):
+            for vertex in mask_to_list(self._settlement_masks[player_index]):
+                game_hash ^= keys.get_settlement_key(player_index, vertex)
+            for vertex in mask_to_list(self._city_masks[player_index]):
+                game_hash ^= keys.get_city_key(player_index, vertex)
+            for edge in mask_to_list(self._road_masks[player_index]):
+                game_hash ^= keys.get_road_key(player_index, edge)
+        return game_hash
+
+    def get_board(self):
+        return self._board
+
+    def get_seed(self):
+        return self._seed
+
+    def get_dice_random(self):
+        return self._dice_random
+
+    def get_number_of_players(self):
+        return len(self._player_names)
+
+    def get_player_names(self):
+        return self._player_names
+
+    def get_players(self):
+        return [PlayerState(self, index) for index in range(len(self._player_names))]
+
+    def get_player(self, player_index):
+        return PlayerState(self, player_index)
+
+    def get_resource_counts(self):
+        return self._resources
+
+    def get_resource(self, player_index, resource):
+        return self._resources[player_index * NUMBER_OF_RESOURCES + RESOURCE_INDEX[resource]]
+
+    def add_resource(self, player_index, resource, amount):
+        self.change_resource(player_index * NUMBER_OF_RESOURCES + RESOURCE_INDEX[resource], amount)
+
+    def change_resource(self, slot, amount):
+        """
+        Adds amount to the count at slot in the resources list and updates the hash for the new count
+        """
+        count = self._resources[slot]
+        self._resources[slot] = count + amount
+        self._hash ^= self._keys.get_resource_key(slot, count) ^ self._keys.get_resource_key(slot, count + amount)
+
+    def get_victory_points(self, player_index):
+        return self._victory_points[player_index]
+
+    def add_victory_points(self, player_index, number_of_points):
+        self._victory_points[player_index] += number_of_points
+
+    def get_settlement_mask(self, player_index):
+        return self._settlement_masks[player_index]
+
+    def get_city_mask(self, player_index):
+        return self._city_masks[player_index]
+
+    def get_road_mask(self, player_index):
+        return self._road_masks[player_index]
+
+    def get_robber_tile(self):
+        return self._robber_tile
+
+    def get_vertex_owner(self, vertex):
+        """
+        Returns the index of the player with a settlement or city on the vertex, None if it is empty
+        """
+        bit = 1 << vertex
+        if not self._occupied_mask & bit:
+            return None
+        for player_index in range(len(self._player_names)):
+            if (self._settlement_masks[player_index] | self._city_masks[player_index]) & bit:
+                return player_index
+        return None
+
+    def get_edge_owner(self, edge):
+        """
+        Returns the index of the player with a road on the edge, None if it is empty
+        """
+        bit = 1 << edge
+        if not self._road_mask & bit:
+            return None
+        for player_index in range(len(self._player_names)):
+            if self._road_masks[player_index] & bit:
+                return player_index
+        return None
+
+    def is_city(self, vertex):
+        bit = 1 << vertex
+        for city_mask in self._city_masks:
+            if city_mask & bit:
+                return True
+        return False
+
+    def get_phase(self):
+        return self._phase
+
+    def set_phase(self, phase):
+        self._hash ^= self._keys.get_phase_key(self._phase) ^ self._keys.get_phase_key(phase)
+        self._phase = phase
+
+    def set_current_player(self, player_index):
+        self._hash ^= self._keys.get_player_key(self._current_player) ^ self._keys.get_player_key(player_index)
+        self._current_player = player_index
+
+    def get_current_player(self):
+        return self._current_player
+
+    def get_last_settlement(self):
+        return self._last_settlement
+
+    def get_setup_step(self):
+        return self._setup_step
+
+    def set_last_settlement(self, vertex):
+        self._hash ^= self._keys.get_last_settlement_key(self._last_settlement) ^ \
+            self._keys.get_last_settlement_key(vertex)
+        self._last_settlement = vertex
+
+    def get_last_roll(self):
+        return self._last_roll
+
+    def set_last_roll(self, dice_roll):
+        self._last_roll = dice_roll
+
+    def get_turn_number(self):
+        return self._turn_number
+
+    def create_board(self, tile_types=None, tile_numbers=None):
+        """
+        Shuffles a new board with the board random generator and places the robber on the desert
+        A saved board can be set up instead by passing the type and number token of every tile
+        """
+        if tile_types is None:
+            self._board.create_tiles(self._board_random)
+        else:
+            self._board.set_tiles(tile_types, tile_numbers)
+        self._robber_tile = self._board.get_desert_tile()
+        for number in range(len(self._roll_payouts)):
+            self.update_roll_payouts(number)
+        self._hash = self.compute_hash()
+
+    def add_player(self, player_name):
+        """
+        Adds a player to the end of the turn order and returns its PlayerState
+        """
+        self._player_names = self._player_names + (player_name,)
+        for slot in range(len(self._resources), len(self._resources) + NUMBER_OF_RESOURCES):
+            self._hash ^= self._keys.get_resource_key(slot, 0)
+        self._resources.extend([0] * NUMBER_OF_RESOURCES)
+        self._victory_points.append(0)
+        self._settlement_masks.append(0)
+        self._city_masks.append(0)
+        self._road_masks.append(0)
+        self._road_end_masks.append(0)
+        self._buildable_road_masks.append(0)
+        self._road_pieces.append(())
+        self._road_lengths.append(0)
+        return PlayerState(self, len(self._player_names) - 1)
+
+    def advance_setup(self):
+        """
+        Moves on to the next player after a setup settlement and road have been placed, setup goes in order from the
+        first player to the last, then in reverse order back to the first player, then the first turn starts
+        """
+        self._setup_step += 1
+        number_of_players = len(self._player_names)
+
+        if self._setup_step >= 2 * number_of_players:
+            self.set_current_player(0)
+            self._turn_number = 1
+            self.set_phase(ROLL_PHASE)
+            return
+
+        if self._setup_step < number_of_players:
+            self.set_current_player(self._setup_step)
+        else:
+            self.set_current_player(2 * number_of_players - 1 - self._setup_step)
+        self.set_phase(SETUP_SETTLEMENT_PHASE)
+
+    def end_turn(self):
+        """
+        Passes the dice to the next player
+        """
+        self.set_current_player((self._current_player + 1) % len(self._player_names))
+        self._turn_number += 1
+        self.set_phase(ROLL_PHASE)
+
+    def roll_dice(self):
+        """
+        Returns the sum of two six-sided dice rolled with the game's dice random generator
+        """
+        return self._dice_random.randint(1, 6) + self._dice_random.randint(1, 6)
+
+    def can_afford(self, player_index, cost):
+        """
+        Takes cost, a dictionary of resource to amount, and returns True if the player holds enough of every resource
+        """
+        start = player_index * NUMBER_OF_RESOURCES
+        for resource, amount in cost.items():
+            if self._resources[start + RESOURCE_INDEX[resource]] < amount:
+                return False
+        return True
+
+    def pay(self, player_index, cost):
+        """
+        Removes the resources in cost from the player's hand
+        """
+        start = player_index * NUMBER_OF_RESOURCES
+        for resource, amount in cost.items():
+            self.change_resource(start + RESOURCE_INDEX[resource], -amount)
+
+    def touches_own_road(self, player_index, vertex):
+        """
+        Returns True if the player has a road ending at the vertex
+        """
+        return self._road_masks[player_index] & self._board.get_topology().get_vertex_edge_mask(vertex) != 0
+
+    def get_road_vertex_mask(self, player_index):
+        """
+        Returns a bitmask of the vertices at the ends of the player's roads, the only vertices where the player can
+        build a settlement after setup
+        """
+        return self._road_end_masks[player_index]
+
+    def get_open_mask(self):
+        """
+        Returns a bitmask of the vertices a settlement can still be built on, the empty vertices with no building on
+        any of their neighbours
+        """
+        return self._open_mask
+
+    def get_buildable_settlement_mask(self, player_index, setup=False):
+        """
+        Returns a bitmask of the vertices the player can build a settlement on, the same vertices can_build_settlement
+        allows without checking the cost, during setup every open vertex and afterwards only those at the ends of the
+        player's roads
+        """
+        if setup:
+            return self._open_mask
+        return self._open_mask & self._road_end_masks[player_index]
+
+    def get_buildable_road_mask(self, player_index):
+        """
+        Returns a bitmask of the empty edges the player's network of roads and buildings can be extended onto, the
+        same edges can_build_road allows without checking the cost
+        """
+        return self._buildable_road_masks[player_index]
+
+    def compute_buildable_road_mask(self, player_index):
+        """
+        Returns the buildable road mask of the player calculated from scratch, which is always the same as
+        get_buildable_road_mask
+        """
+        topology = self._board.get_topology()
+        buildings = self._settlement_masks[player_index] | self._city_masks[player_index]
+        # roads can only continue through a vertex that has no other player's building on it
+        vertex_mask = buildings | (self._road_end_masks[player_index] & ~self._occupied_mask)
+        edge_mask = 0
+        for vertex in mask_to_list(vertex_mask):
+            edge_mask |= topology.get_vertex_edge_mask(vertex)
+        return edge_mask & ~self._road_mask
+
+    def rebuild_placement_masks(self):
+        """
+        Calculates the open mask, road end masks and buildable road masks from the buildings and roads, used when a
+        game is loaded, every build after that updates them as it goes
+        """
+        topology = self._board.get_topology()
+        self._open_mask = (1 << topology.get_number_of_vertices()) - 1
+        for vertex in mask_to_list(self._occupied_mask):
+            self._open_mask &= ~((1 << vertex) | topology.get_vertex_neighbour_mask(vertex))
+
+        for player_index in range(len(self._player_names)):
+            road_end_mask = 0
+            for edge in mask_to_list(self._road_masks[player_index]):
+                vertex1, vertex2 = topology.get_edge_vertices(edge)
+                road_end_mask |= (1 << vertex1) | (1 << vertex2)
+            self._road_end_masks[player_index] = road_end_mask
+            self._buildable_road_masks[player_index] = self.compute_buildable_road_mask(player_index)
+
+    def can_build_settlement(self, player_index, vertex, setup=False):
+        """
+        Checks that the vertex and all of its neighbours are empty, so settlements are never next to each other
+            *UNLESS the settlement is placed during initial setup, the player must also have a road at the vertex and
+            enough resources to pay for the settlement*
+        Returns True if the player can build a settlement on the vertex, False otherwise
+        """
+        if not self._open_mask >> vertex & 1:
+            return False
+
+        if setup:
+            return True
+        return self._road_end_masks[player_index] >> vertex & 1 == 1 and self.can_afford(player_index, SETTLEMENT_COST)
+
+    def build_settlement(self, player_index, vertex, setup=False):
+        """
+        Builds a settlement for the player on the vertex, removing the resources unless it is the initial setup
+        Returns True if the settlement was built, False otherwise
+        """
+        if not self.can_build_settlement(player_index, vertex, setup):
+            return False
+
+        if not setup:
+            self.pay(player_index, SETTLEMENT_COST)
+        self._settlement_masks[player_index] |= 1 << vertex
+        self._occupied_mask |= 1 << vertex
+        self._hash ^= self._keys.get_settlement_key(player_index, vertex)
+        self._victory_points[player_index] += 1
+        self.update_vertex_payouts(vertex)
+        self.update_settlement_placements(player_index, vertex)
+        self.cut_road_pieces(player_index, vertex)
+        return True
+
+    def update_settlement_placements(self, player_index, vertex):
+        """
+        Updates the legal placements after the player builds a settlement on the vertex
+        The vertex and its neighbours are closed to settlements, the player can build roads from the vertex, and the
+        other players' roads can no longer be extended through it
+        """
+        topology = self._board.get_topology()
+        vertex_edges = topology.get_vertex_edge_mask(vertex)
+        self._open_mask &= ~((1 << vertex) | topology.get_vertex_neighbour_mask(vertex))
+        self._buildable_road_masks[player_index] |= vertex_edges & ~self._road_mask
+
+        for other_index in range(len(self._player_names)):
+            if other_index == player_index or not self._buildable_road_masks[other_index] & vertex_edges:
+                continue
+            # an edge at the vertex stays buildable only if the other player can still reach its far end
+            buildings = self._settlement_masks[other_index] | self._city_masks[other_index]
+            reachable = buildings | (self._road_end_masks[other_index] & ~self._occupied_mask)
+            for edge in mask_to_list(self._buildable_road_masks[other_index] & vertex_edges):
+                vertex1, vertex2 = topology.get_edge_vertices(edge)
+                far_vertex = vertex2 if vertex1 == vertex else vertex1
+                if not reachable >> far_vertex & 1:
+                    self._buildable_road_masks[other_index] &= ~(1 << edge)
+
+    def can_build_city(self, player_index, vertex):
+        """
+        Checks that the player owns a settlement on the vertex and has enough resources to upgrade it to a city
+        """
+        return self._settlement_masks[player_index] & (1 << vertex) != 0 and self.can_afford(player_index, CITY_COST)
+
+    def build_city(self, player_index, vertex):
+        """
+        Upgrades the player's settlement on the vertex to a city
+        Returns True if the city was built, False otherwise
+        """
+        if not self.can_build_city(player_index, vertex):
+            return False
+
+        self.pay(player_index, CITY_COST)
+        self._settlement_masks[player_index] &= ~(1 << vertex)
+        self._city_masks[player_index] |= 1 << vertex
+        self._hash ^= self._keys.get_settlement_key(player_index, vertex) ^ self._keys.get_city_key(player_index, vertex)
+        self._victory_points[player_index] += 1
+        self.update_vertex_payouts(vertex)
+        return True
+
+    def can_build_road(self, player_index, edge, setup=False):
+        """
+        Checks that the edge is empty and attached to one of the player's settlements, or to one of the player's roads
+        that is not cut off by another player's settlement
+            *UNLESS the road is placed during initial setup, the player must also have enough resources*
+        Returns True if the player can build a road on the edge, False otherwise
+        """
+        if not self._buildable_road_masks[player_index] >> edge & 1:
+            return False
+        return setup or self.can_afford(player_index, ROAD_COST)
+
+    def build_road(self, player_index, edge, setup=False):
+        """
+        Builds a road for the player on the edge, removing the resources unless it is the initial setup
+        Returns True if the road was built, False otherwise
+        """
+        if not self.can_build_road(player_index, edge, setup):
+            return False
+
+        if not setup:
+            self.pay(player_index, ROAD_COST)
+        self._road_masks[player_index] |= 1 << edge
+        self._road_mask |= 1 << edge
+        self._hash ^= self._keys.get_road_key(player_index, edge)
+        self.update_road_placements(player_index, edge)
+        self.join_road_pieces(player_index, edge)
+        return True
+
+    def update_road_placements(self, player_index, edge):
+        """
+        Updates the legal placements after the player builds a road on the edge
+        No one can build on the edge any more, and the player can build settlements at its ends and continue it
+        through any end without another player's building on it
+        """
+        topology = self._board.get_topology()
+        for other_index in range(len(self._player_names)):
+            self._buildable_road_masks[other_index] &= ~(1 << edge)
+
+        buildings = self._settlement_masks[player_index] | self._city_masks[player_index]
+        for vertex in topology.get_edge_vertices(edge):
+            self._road_end_masks[player_index] |= 1 << vertex
+            if buildings >> vertex & 1 or not self._occupied_mask >> vertex & 1:
+                self._buildable_road_masks[player_index] |= topology.get_vertex_edge_mask(vertex) & ~self._road_mask
+
+    def get_road_length(self, player_index):
+        """
+        Returns the number of roads in the player's longest road
+        """
+        return self._road_lengths[player_index]
+
+    def get_road_pieces(self, player_index):
+        return self._road_pieces[player_index]
+
+    def get_longest_road_player(self):
+        return self._longest_road_player
+
+    def get_blocked_mask(self, player_index):
+        """
+        Returns a bitmask of the vertices with another player's building on them, which the player's roads cannot
+        continue through
+        """
+        return self._occupied_mask & ~(self._settlement_masks[player_index] | self._city_masks[player_index])
+
+    def set_road_pieces(self, player_index, road_pieces):
+        """
+        Sets the player's pieces of road, a tuple of (edge mask, length), and the length of their longest road
+        """
+        self._road_pieces[player_index] = road_pieces
+        self._road_lengths[player_index] = max([length for piece, length in road_pieces], default=0)
+
+    def join_road_pieces(self, player_index, edge):
+        """
+        Adds the player's new road on the edge to their pieces of road, the pieces it touches at an end that is not
+        blocked are joined into one and only that piece is measured again
+        """
+        topology = self._board.get_topology()
+        blocked_mask = self.get_blocked_mask(player_index)
+        touching_edges = 0
+        for vertex in topology.get_edge_vertices(edge):
+            if not blocked_mask >> vertex & 1:
+                touching_edges |= topology.get_vertex_edge_mask(vertex)
+
+        joined = 1 << edge
+        road_pieces = []
+        for piece, length in self._road_pieces[player_index]:
+            if piece & touching_edges:
+                joined |= piece
+            else:
+                road_pieces.append((piece, length))
+        road_pieces.append((joined, measure_road(topology, joined, blocked_mask)))
+        self.set_road_pieces(player_index, tuple(road_pieces))
+        self.update_longest_road()
+
+    def cut_road_pieces(self, player_index, vertex):
+        """
+        Splits the other players' roads that run through the vertex the player just built a settlement on, only the
+        pieces with two or more roads meeting at the vertex can be cut, and only they are measured again
+        """
+        topology = self._board.get_topology()
+        vertex_edges = topology.get_vertex_edge_mask(vertex)
+        cut = False
+        for other_index in range(len(self._player_names)):
+            if other_index == player_index or bin(self._road_masks[other_index] & vertex_edges).count("1") < 2:
+                continue
+            blocked_mask = self.get_blocked_mask(other_index)
+            road_pieces = []
+            for piece, length in self._road_pieces[other_index]:
+                if bin(piece & vertex_edges).count("1") < 2:
+                    road_pieces.append((piece, length))
+                    continue
+                for new_piece in split_road_pieces(topology, piece, blocked_mask):
+                    road_pieces.append((new_piece, measure_road(topology, new_piece, blocked_mask)))
+            self.set_road_pieces(other_index, tuple(road_pieces))
+            cut = True
+        if cut:
+            self.update_longest_road()
+
+    def rebuild_road_pieces(self):
+        """
+        Splits every player's roads into pieces and measures them, used when a game is loaded
+        """
+        topology = self._board.get_topology()
+        for player_index in range(len(self._player_names)):
+            blocked_mask = self.get_blocked_mask(player_index)
+            pieces = split_road_pieces(topology, self._road_masks[player_index], blocked_mask)
+            self.set_road_pieces(player_index, tuple((piece, measure_road(topology, piece, blocked_mask))
+                                                     for piece in pieces))
+
+    def update_longest_road(self):
+        """
+        Gives the longest road award to the player who has earned it after the road lengths changed
+        The holder keeps it while no one has a longer road, otherwise it goes to the only player with the longest
+        road of at least LONGEST_ROAD_MINIMUM roads, and if players tie for the longest road no one holds it
+        """
+        holder = self._longest_road_player
+        longest = max(self._road_lengths, default=0)
+        if holder is not None and self._road_lengths[holder] == longest and longest >= LONGEST_ROAD_MINIMUM:
+            return
+
+        leaders = [player_index for player_index, length in enumerate(self._road_lengths) if length == longest]
+        new_holder = leaders[0] if longest >= LONGEST_ROAD_MINIMUM and len(leaders) == 1 else None
+        if new_holder == holder:
+            return
+
+        if holder is not None:
+            self._victory_points[holder] -= LONGEST_ROAD_POINTS
+        if new_holder is not None:
+            self._victory_points[new_holder] += LONGEST_ROAD_POINTS
+        self._hash ^= self._keys.get_longest_road_key(holder) ^ self._keys.get_longest_road_key(new_holder)
+        self._longest_road_player = new_holder
+
+    def update_roll_payouts(self, number):
+        """
+        Rebuilds the payouts for one dice roll from the buildings on the tiles with that number, skipping the tile
+        with the robber on it
+        """
+        board = self._board
+        payouts = []
+        for tile in board.get_number_tiles(number):
+            if tile == self._robber_tile:
+                continue
+            resource = board.get_tile_type(tile)
+            for vertex in board.get_tile_vertices(tile):
+                bit = 1 << vertex
+                if not self._occupied_mask & bit:
+                    continue
+                for player_index in range(len(self._player_names)):
+                    if self._settlement_masks[player_index] & bit:
+                        payouts.append((player_index, resource, 1))
+                    elif self._city_masks[player_index] & bit:
+                        payouts.append((player_index, resource, 2))
+        self._roll_payouts[number] = tuple(payouts)
+
+    def update_vertex_payouts(self, vertex):
+        """
+        Rebuilds the payouts for the numbers on the tiles around a vertex after something is built on it
+        """
+        for tile in self._board.get_vertex_tiles(vertex):
+            number = self._board.get_tile_number(tile)
+            if number is not None:
+                self.update_roll_payouts(number)
+
+    def get_roll_payouts(self, dice_roll):
+        return self._roll_payouts[dice_roll]
+
+    def collect_resources(self, dice_roll):
+        """
+        Every settlement next to a tile with the rolled number collects one of the tile's resource, and every city
+        collects two, unless the robber is on the tile
+        The payouts are looked up in roll payouts, so only the buildings that collect something are visited
+        Returns a tuple of (player index, resource, amount) for each payout
+        """
+        payouts = self._roll_payouts[dice_roll]
+        for player_index, resource, amount in payouts:
+            self.change_resource(player_index * NUMBER_OF_RESOURCES + RESOURCE_INDEX[resource], amount)
+        return payouts
+
+    def move_robber(self, tile):
+        """
+        Moves the robber onto the tile, blocking it from producing resources
+        Returns True if the robber was moved, False if it is already on the tile
+        """
+        if tile == self._robber_tile:
+            return False
+        old_tile = self._robber_tile
+        self._robber_tile = tile
+        self._hash ^= self._keys.get_robber_key(old_tile) ^ self._keys.get_robber_key(tile)
+
+        # the old tile produces again and the new tile stops producing
+        for changed_tile in (old_tile, tile):
+            number = self._board.get_tile_number(changed_tile)
+            if number is not None:
+                self.update_roll_payouts(number)
+        return True
+
+    def can_bank_trade(self, player_index, give):
+        """
+        Checks whether the player has enough of the give resource to trade it in with the bank
+        """
+        return self.get_resource(player_index, give) >= BANK_TRADE_RATE
+
+    def bank_trade(self, player_index, give, receive):
+        """
+        Trades in BANK_TRADE_RATE of the give resource for one of the receive resource
+        Returns True if the trade was made, False otherwise
+        """
+        if not self.can_bank_trade(player_index, give) or give == receive:
+            return False
+
+        self.add_resource(player_index, give, -BANK_TRADE_RATE)
+        self.add_resource(player_index, receive, 1)
+        return True
+
+    def get_winner(self):
+        """
+        Returns the PlayerState of the first player with WINNING_VICTORY_POINTS or more, None if there is no winner
+        """
+        for player_index in range(len(self._player_names)):
+            if self._victory_points[player_index] >= WINNING_VICTORY_POINTS:
+                return PlayerState(self, player_index)
+        return None
@@ -1,12 +1,20 @@
 # Author: Joanna Getek
-# Last Modified: 01/03/2023
+# Last Modified: 10/18/2026
 # Description: The creation of the board and buttons for gameplay. It contains the classes
 # GameBoard, HexTile, and Location, as well as a method for printing text to be displayed
+# The rules of the game are applied by the GameState these classes draw
 
 import math
-import random
 from global_vars import *
 from buttons import *
+from game_state import GameState
+from board_topology import NORTH, get_topology
+from renderer import get_renderer, BOARD_LAYER, ROBBER_LAYER, HUD_LAYER
+from assets import get_assets
+from hit_test import HitTestIndex, create_board_index, VERTEX_TARGET, EDGE_TARGET, TILE_TARGET, BUTTON_TARGET
+
+# Key the dice are found by in the button hit test index, the other buttons are found by their dictionary key
+DICE_BUTTON = "dice"
 
 class GameBoard:
     """
@@ -16,28 +24,86 @@ class GameBoard:
     Hex_size indicates the size of each HexTile in pixels
     list_hex_tiles contains a list of all 19 HexTile objects on the board
     list_locations contains a list of all 54 Location objects on the board
+    geometry is the BoardGeometry shared by every game, with the pixel positions of the tiles and locations
     player_list contains a list of the four player objects
     build_buttons contains a dictionary of build-related buttons, with the string of the button name as the key
         and the button object as the value
     trade_buttons contains a dictionary of trade-related buttons, with the string of the button name as the key
         and the button object as the value
     robber_hex_tile is the HexTile object that the robber is currently on
+    robber_rect is the area of the robber layer the robber image was last drawn in, None before it is drawn
+    board_surface is the off-screen surface holding everything that never changes during a game, the tiles, number
+        tokens, building costs and buttons, drawn once the first time it is needed
     dice is the dice object
+    board_index is the HitTestIndex of the locations, roads and tiles, created with the locations, and button_index is
+        the HitTestIndex of the buttons and dice, created with the buttons
+    state is the GameState object that holds the board layout, the players' buildings and resources, it is created
+        with seed so the same seed gives the same board and dice rolls
     """
-    def __init__(self):
+    def __init__(self, seed=None):
         self._center = (425, 250)
-        self._hex_size = 120
+        self._hex_size = HEX_SIZE
         self._list_hex_tiles = []
         self._list_locations = []
+        self._geometry = get_board_geometry()
         self._player_list = []
         self._build_buttons = {}
         self._trade_buttons = {}
         self._robber_hex_tile = None
+        self._robber_rect = None
+        self._board_surface = None
         self._dice = None
+        self._board_index = None
+        self._button_index = None
+        self._state = GameState(seed)
+
+    def get_state(self):
+        return self._state
 
     def get_locations(self):
         return self._list_locations
 
+    def get_location(self, position):
+        """
+        Returns the Location object at the (x, y) position, or None if there is no location there
+        """
+        vertex = self._geometry.get_vertex_at(position)
+        if vertex is None:
+            return None
+        return self._list_locations[vertex]
+
+    def find_location(self, position):
+        """
+        Returns the Location object a click at the (x, y) position landed on, or None if it missed every location
+        """
+        vertex = self._board_index.find_point(VERTEX_TARGET, position)
+        if vertex is None:
+            return None
+        return self._list_locations[vertex]
+
+    def find_edge(self, position):
+        """
+        Returns the edge of the GameState board whose midpoint is closest to a click at the (x, y) position, or None
+        if the click is not near any edge
+        """
+        return self._board_index.find_point(EDGE_TARGET, position)
+
+    def find_hex_tile(self, position):
+        """
+        Returns the HexTile object whose center a click at the (x, y) position landed near, or None if there is none
+        """
+        tile = self._board_index.find_point(TILE_TARGET, position)
+        if tile is None:
+            return None
+        return self._list_hex_tiles[tile]
+
+    def find_button(self, position):
+        """
+        Returns the name of the button a click at the (x, y) position landed on, its key in the build or trade buttons
+        or DICE_BUTTON for the dice, or None if it missed every button
+        """
+        return self._button_index.find_rect(BUTTON_TARGET, position)
+
     def get_dice(self):
         return self._dice
 
@@ -60,7 +126,43 @@ class GameBoard:
         return self._player_list
 
     def set_player_list(self, player_list):
+        """
+        Sets the list of player objects and adds each player to the GameState in turn order
+        """
+        self._player_list = player_list
+        for player in player_list:
+            player.set_player_state(self._state.add_player(player.get_player_name()))
+
+    def save_snapshot(self):
+        """
+        Returns a snapshot of the game as bytes, including the dice, which load_snapshot uses to resume the game
+        Only the GameState is saved, the pygame objects are all rebuilt from it
+        """
+        return self._state.to_bytes(include_random=True)
+
+    def load_snapshot(self, snapshot, player_list):
+        """
+        Replaces the game with the one saved in snapshot, creating the hex tiles and locations for its board
+        Takes player_list, the list of player objects for the saved players in turn order, each player is given its
+        PlayerState and its settlements, cities and roads are rebuilt from the GameState
+        Raises ValueError if snapshot is not a saved game or was saved with a different number of players, in which
+        case the game is not changed
+        """
+        state = GameState.from_bytes(snapshot)
+        if state.get_number_of_players() != len(player_list):
+            raise ValueError("the saved game has " + str(state.get_number_of_players()) + " players, not " +
+                             str(len(player_list)))
+        self._state = state
+        self._list_hex_tiles = []
+        self._list_locations = []
+        self._board_surface = None
+        self.create_hex_tiles_from_board()
+        self.create_locations()
+
         self._player_list = player_list
+        for index, player in enumerate(player_list):
+            player.set_player_state(self._state.get_player(index))
+            player.restore_structures(self)
 
     def create_buttons(self):
         """
@@ -81,128 +183,129 @@ class GameBoard:
         self._trade_buttons["wool"] = Wool_Button()
         self._trade_buttons["ore"] = Ore_Button()
 
+        self._button_index = HitTestIndex()
+        self._button_index.add_rect(BUTTON_TARGET, DICE_BUTTON, self._dice.get_rect())
+        for buttons in (self._build_buttons, self._trade_buttons):
+            for name, button in buttons.items():
+                self._button_index.add_rect(BUTTON_TARGET, name, button.get_shape())
+
     def create_hex_tiles(self):
         """
-        Creates the 19 hexagon tiles that make up the game board
+        Creates the 19 hexagon tiles that make up the game board from the tiles shuffled by the GameState, the
+        positions of the tiles are taken from the shared BoardGeometry
         """
+        self._state.create_board()
+        self.create_hex_tiles_from_board()
 
-        # Each tuple is matched with the tile colour and corresponding resource
-        type_colours = [("wheat", YELLOW), ("wool", GREEN), ("wood", DARK_GREEN)] * 4
-        type_colours += [("ore", GREY), ("brick", RED)] * 3
-
-        hex_center_coord_list = [           (321, 100), (425, 100), (529, 100),
-                                        (269, 190), (373, 190), (477, 190), (581, 190),
-                                 (217, 280), (321, 280), (425, 280), (529, 280), (633, 280),
-                                        (269, 370), (373, 370), (477, 370), (581, 370),
-                                            (321, 460), (425, 460), (529, 460)               ]
-
-        # each number will correspond to a number token on the HexTile
-        numbers = [2, 12]
-        numbers += [3, 4, 5, 6, 8, 9, 10, 11] * 2
-
-        # shuffling to ensure the map is different for each game
-        random.shuffle(type_colours)
-        random.shuffle(hex_center_coord_list)
-        random.shuffle(numbers)
+    def create_hex_tiles_from_board(self):
+        """
+        Creates the hexagon tiles for the board that is already in the GameState, with the robber on its tile
+        """
+        board = self._state.get_board()
+        self._board_surface = None
 
-        # Creating first 18 tile objects on the board, then creating desert last to ensure robber is on desert
-        for index in range(18):
-            hexagon = HexTile(type_colours[index], self._hex_size, hex_center_coord_list[index], numbers[index])
+        for tile in range(board.get_number_of_tiles()):
+            tile_type = board.get_tile_type(tile)
+            number = board.get_tile_number(tile)
+            if number is None:
+                number = ""
+            center = self._geometry.get_tile_center(tile)
+            corners = self._geometry.get_tile_corners(tile)
+            hexagon = HexTile((tile_type, TILE_COLOURS[tile_type]), self._hex_size, center, number, tile, corners)
             self._list_hex_tiles.append(hexagon)
 
-        # Creating desert tile
-        desert_hexagon = HexTile(("desert", BEIGE), self._hex_size, hex_center_coord_list[18], "")
-        self._list_hex_tiles.append(desert_hexagon)
-
         # adding robber to hexagon tile for initial location
-        self.set_robber_tile(desert_hexagon)
+        robber_hex_tile = self._list_hex_tiles[self._state.get_robber_tile()]
+        robber_hex_tile.set_robber(True)
+        self.set_robber_tile(robber_hex_tile)
 
     def create_locations(self):
         """
-        Creates all possible Location objects that settlements and roads can be placed on the board
+        Creates all possible Location objects that settlements and roads can be placed on the board, one for each
+        vertex of the GameState board
         """
-
-        location_points = []
-
-        # iterate through all hexagon coordinates, create a location point as long as it is not a duplicate as some
-        # hexagon corners overlap
-        for hex_tile in self._list_hex_tiles:
-            single_hex_coords = hex_tile.get_coordinates()
-            for coord in single_hex_coords:
-                if coord not in location_points:
-                    location_points.append(coord)
-
-        # iterate through list of all possible location points on board and create a Location object for each
-        for location_coords in location_points:
-            point = Location(location_coords[0], location_coords[1])
-            self._list_locations.append(point)
+        for vertex in range(self._state.get_board().get_number_of_vertices()):
+            x_coord, y_coord = self._geometry.get_vertex_position(vertex)
+            self._list_locations.append(Location(x_coord, y_coord, vertex))
 
         # create neighbours for each location to keep track of the adjacent spaces
         self.create_location_neighbours()
+        self._board_index = create_board_index(self._geometry, self._state.get_board())
 
     def create_location_neighbours(self):
         """
-        Create the neighbouring location points to ensure settlements and cities cannot be placed next to each other
-        and roads are being placed to other roads or structures
+        Sets the neighbouring locations of each location, the locations one road away on the GameState board
         """
+        board = self._state.get_board()
 
-        # iterate through the list of locations on game board
         for location in self._list_locations:
             neighbour_locations = []
-            loc_x, loc_y = location.get_x_y_coords()
-            # iterate through each location checking if they are potentially a neighbour
-            for neighbour_location in self._list_locations:
-                neigh_x, neigh_y = neighbour_location.get_x_y_coords()
-                # if the neighbours are within range of original location, will be added to the neighbour list
-                if (neigh_x > loc_x - 5 and neigh_x < loc_x + 5) and (neigh_y > loc_y - 65 and neigh_y < loc_y + 65):
-                    neighbour_locations.append(neighbour_location)
-                elif (neigh_x > loc_x - 60 and neigh_x < loc_x + 60) and (neigh_y > loc_y - 35 and neigh_y < loc_y + 35):
-                    neighbour_locations.append(neighbour_location)
+            for vertex in board.get_vertex_neighbours(location.get_vertex_id()):
+                neighbour_locations.append(self._list_locations[vertex])
             location.set_neighbours_list(neighbour_locations)
 
     def check_winner(self):
         """
-        Iterates through the player list and checks if any player has 10 or more victory points
+        Checks the GameState for a player with 10 or more victory points
         Returns winning player if there is a winner, Returns None otherwise
         """
-        for player in self._player_list:
-            if player.get_victory_points() >= 10:
-                return player
-        return None
+        winner = self._state.get_winner()
+        if winner is None:
+            return None
+        return self._player_list[winner.get_index()]
 
-    def draw_gameboard(self):
+    def get_board_surface(self):
         """
-        Calls on all functions that will draw the gameboard to the screen
+        Returns the surface with the static board on it, drawing it the first time it is needed
         """
+        if self._board_surface is None:
+            self.create_board_surface()
+        return self._board_surface
+
+    def create_board_surface(self):
+        """
+        Draws everything that does not change during the game onto an off-screen surface the size of the screen, so
+        the whole board can be drawn again with a single blit
+        """
+        assets = get_assets()
+        board_surface = pygame.Surface(screen.get_size()).convert()
+        board_surface.fill(LIGHT_BLUE)
+
         # displays the building cost image
-        building_cost_image = pygame.image.load("images/building_costs.jpg").convert()
-        screen.blit(building_cost_image, (875, 185))
+        board_surface.blit(assets.get_image("building_costs"), (875, 185))
+        board_surface.blit(assets.render_text("Trade Resources"), (920, 30))
+        self.draw_hex_tiles(board_surface)
+        self.draw_buttons(board_surface)
+        self._board_surface = board_surface
 
-        print_text("Trade Resources", (920, 30))
-        self.draw_hex_tiles()
+    def draw_gameboard(self):
+        """
+        Calls on all functions that will draw the gameboard to the screen, the static board is drawn as one image
+        with the structures, robber, dice and player icons on top of it
+        """
+        get_renderer().blit(BOARD_LAYER, self.get_board_surface(), (0, 0))
+        self.draw_all_roads()
+        self.draw_all_settlements()
         self.update_robber_position()
-        self.draw_buttons()
+        self._dice.draw_dice()
         self.draw_settlement_icons()
-        pygame.display.flip()
 
-    def draw_hex_tiles(self):
+    def draw_hex_tiles(self, surface):
         """
-        Calls on the function draw to display all hex tiles to the screen
+        Calls on the function draw to draw all hex tiles onto surface
         """
         for hextile in self._list_hex_tiles:
-            hextile.draw_hex()
+            hextile.draw_hex(surface)
 
-    def draw_buttons(self):
+    def draw_buttons(self, surface):
         """
-        Iterates through both buttons lists (build buttons and trade buttons) to draw them to the screen
+        Iterates through both buttons lists (build buttons and trade buttons) to draw them onto surface
         """
         for button in self._build_buttons.values():
-            button.draw_button()
+            button.draw_button(surface)
 
         for button in self._trade_buttons.values():
-            button.draw_button()
-
-        self._dice.draw_dice()
+            button.draw_button(surface)
 
     def draw_settlement_icons(self):
         """
@@ -215,18 +318,18 @@ class GameBoard:
             x += 120
             y += 15
             pentagon_coordinates = [(x - 10, y - 10), (x - 10, y + 10), (x + 10, y + 10), (x + 10, y - 10), (x, y - 20)]
-            pygame.draw.polygon(screen, colour, pentagon_coordinates)
-
-        pygame.display.flip()
+            get_renderer().draw_polygon(HUD_LAYER, colour, pentagon_coordinates)
 
     def draw_all_settlements(self):
         """
-        Draws each player's settlements to the screen
+        Draws each player's settlements and cities to the screen
         """
         for player in self._player_list:
             player_settlements = player.get_player_settlements()
             for settlement in player_settlements:
                 settlement.draw_settlement()
+            for city in player.get_player_cities():
+                city.draw_settlement()
 
     def draw_all_roads(self):
         """
@@ -243,7 +346,7 @@ class GameBoard:
             if player_obj.get_player_name() == player_name:
                 player = player_obj
 
-        pygame.draw.rect(screen, BEIGE, player.get_player_rect())
+        get_renderer().draw_rect(HUD_LAYER, BEIGE, player.get_player_rect())
         index = int(player.get_player_name()[-1])  # getting player number
         index -= 1
 
@@ -252,25 +355,22 @@ class GameBoard:
             line = str(key) + " : " + str(value)
             print_text(line, (PLAYER_POSITIONS[index][0] + 10, PLAYER_POSITIONS[index][1] + down_pos))
             down_pos += 25  # add 25 to move it down screen
-            pygame.display.flip()
 
         string_victory_points = "VP: " + str(player.get_victory_points())
         print_text(string_victory_points, (PLAYER_POSITIONS[index][0] + 10, PLAYER_POSITIONS[index][1] + 170))
-        pygame.display.flip()
 
     def update_robber_position(self):
         """
         Uses the position of the current robber tile to draw the robber image at this location
+        The robber has a layer of its own, so only the area of the old robber image is cleared to remove it
         """
-        # need to clear the GameBoard background to remove old robber image from old robber HexTile
-        self.draw_hex_tiles()
-        self.draw_all_settlements()
-        self.draw_all_roads()
+        renderer = get_renderer()
+        if self._robber_rect is not None:
+            renderer.clear_rect(ROBBER_LAYER, self._robber_rect)
 
         position = self._robber_hex_tile.get_center_coords()
-        robber_image = pygame.image.load("images\\robber.png").convert_alpha()
-        screen.blit(robber_image, (position[0] - 25, position[1] - 40))
-        pygame.display.flip()
+        robber_image = get_assets().get_image("robber")
+        self._robber_rect = renderer.blit(ROBBER_LAYER, robber_image, (position[0] - 25, position[1] - 40))
 
     def update_text_box(self, text):
         """
@@ -278,9 +378,8 @@ class GameBoard:
         Takes text, a string, as a parameter to indicate the text that should be printed
         """
         rect = pygame.Rect((175, 540), (515, 40))
-        pygame.draw.rect(screen, WHITE, rect)
+        get_renderer().draw_rect(HUD_LAYER, WHITE, rect)
         print_text(text, (180, 545))
-        pygame.display.flip()
 
     def update_trade_text(self, text):
         """
@@ -288,10 +387,10 @@ class GameBoard:
         Takes text, a string, as a parameter
         """
         rect = pygame.Rect(860, 150, 325, 25)
-        pygame.draw.rect(screen, WHITE, rect)
-        print_to_screen = SMALL_FONT.render(text, True, BLACK)
-        screen.blit(print_to_screen, (865, 155))
-        pygame.display.flip()
+        renderer = get_renderer()
+        renderer.draw_rect(HUD_LAYER, WHITE, rect)
+        print_to_screen = get_assets().render_text(text, SMALL_FONT, BLACK)
+        renderer.blit(HUD_LAYER, print_to_screen, (865, 155))
 
 class HexTile:
     """
@@ -302,8 +401,12 @@ class HexTile:
         a tuple representing the center coordinates
         a list that holds the coordinates of the 6 hexagon corners, the method create_coordinates generate this list
         a bool that indicates whether there is a robber on the space (True), otherwise will be False
+        an int for the tile id of the tile on the GameState board
+    The corner coordinates can be passed in as coordinates when they have already been calculated
     """
-    def __init__(self, type_colour, size, center, number):
+    __slots__ = ("_type", "_colour", "_size", "_center", "_number", "_coordinates", "_robber", "_tile_id")
+
+    def __init__(self, type_colour, size, center, number, tile_id=None, coordinates=None):
         self._type = type_colour[0]
         self._colour = type_colour[1]
         self._size = size
@@ -311,9 +414,13 @@ class HexTile:
         self._number = number
         self._coordinates = []
         self._robber = False
+        self._tile_id = tile_id
 
         # Uses the center coordinate to create the 6 hexagon corners
-        self.create_coordinates(self._center)
+        if coordinates is None:
+            self.create_coordinates(self._center)
+        else:
+            self._coordinates = coordinates
 
     def get_center_coords(self):
         return self._center
@@ -333,30 +440,21 @@ class HexTile:
     def get_type(self):
         return self._type
 
+    def get_tile_id(self):
+        return self._tile_id
+
     def create_coordinates(self, hex_center):
         """
         Creates the list of coordinates representing each hexagon corner used to generate the hexagon shape on the board
-        Formula to calculate coordinates modified from: https://www.redblobgames.com/grids/hexagons/
         """
+        self._coordinates = hex_corners(hex_center, self._size)
 
-        x_coord = hex_center[0]
-        y_coord = hex_center[1]
-        alpha = self._size / 4
-        beta = math.sqrt(3) * alpha
-
-        self._coordinates.append((round(x_coord), round(y_coord - (2 * alpha))))
-        self._coordinates.append((round(x_coord + beta), round(y_coord - alpha)))
-        self._coordinates.append((round(x_coord + beta), round(y_coord + alpha)))
-        self._coordinates.append((round(x_coord), round(y_coord + (2 * alpha))))
-        self._coordinates.append((round(x_coord - beta), round(y_coord + alpha)))
-        self._coordinates.append((round(x_coord - beta), round(y_coord - alpha)))
-
-    def draw_hex(self):
+    def draw_hex(self, surface):
         """
-        Displays the hex tile to the screen surface
+        Draws the hex tile and its number token onto surface
         """
-        pygame.draw.polygon(screen, self._colour, self._coordinates)
-        print_text(str(self._number), (self._center[0] - 15, self._center[1] - 15))
+        pygame.draw.polygon(surface, self._colour, self._coordinates)
+        surface.blit(get_assets().render_text(str(self._number)), (self._center[0] - 15, self._center[1] - 15))
 
 
 class Location:
@@ -364,13 +462,17 @@ class Location:
     Creates a location object that represents one of the possible "buildable" points, where a player is allowed
     to place a settlement or city. A player may place a road that is attached to two adjacent locations.
     x_coord and y_coord are integers representing the location x and y coordinates
+    vertex_id is the id of the vertex on the GameState board at this location
     neighbour_list is a list of all adjacent locations one space away
     bool_road, bool_settlement, and bool_city will be True if the corresponding object is on the location, False otherwise
     """
+    __slots__ = ("_x_coord", "_y_coord", "_vertex_id", "_neighbours_list", "_bool_road", "_bool_settlement",
+                 "_bool_city")
 
-    def __init__(self, x_coord, y_coord):
+    def __init__(self, x_coord, y_coord, vertex_id=None):
         self._x_coord = x_coord
         self._y_coord = y_coord
+        self._vertex_id = vertex_id
         self._neighbours_list = []
         self._bool_road = False
         self._bool_settlement = False
@@ -385,6 +487,9 @@ class Location:
     def get_x_y_coords(self):
         return self._x_coord, self._y_coord
 
+    def get_vertex_id(self):
+        return self._vertex_id
+
     def get_settlement_bool(self):
         return self._bool_settlement
 
@@ -398,9 +503,99 @@ class Location:
         self._neighbours_list = list_of_neighbours
 
 
-def print_text(text, position, colour=BLACK):
+class BoardGeometry:
+    """
+    The pixel positions of the tiles and vertices of the BoardTopology, which are the same for every game
+    tile_centers and tile_corners hold the pixel center and the 6 pixel corners of each tile
+    vertex_positions holds the pixel position of each vertex and vertex_lookup maps a pixel position back to its vertex
+    """
+    def __init__(self, topology):
+        self._tile_centers = []
+        self._tile_corners = []
+        self._vertex_positions = []
+        self._vertex_lookup = {}
+
+        for tile in range(topology.get_number_of_tiles()):
+            center = hex_to_pixel(topology.get_tile_coords(tile))
+            self._tile_centers.append(center)
+            self._tile_corners.append(hex_corners(center, HEX_SIZE))
+
+        for vertex in range(topology.get_number_of_vertices()):
+            position = vertex_to_pixel(topology.get_vertex_coords(vertex))
+            self._vertex_positions.append(position)
+            self._vertex_lookup[position] = vertex
+
+    def get_tile_center(self, tile):
+        return self._tile_centers[tile]
+
+    def get_tile_corners(self, tile):
+        return self._tile_corners[tile]
+
+    def get_vertex_position(self, vertex):
+        return self._vertex_positions[vertex]
+
+    def get_vertex_at(self, position):
+        """
+        Returns the vertex at the (x, y) pixel position, or None if there is no vertex there
+        """
+        return self._vertex_lookup.get(position)
+
+
+# The geometry is the same for every game, so it is only calculated once
+_geometry = None
+
+
+def get_board_geometry():
+    """
+    Returns the BoardGeometry of the shared BoardTopology, calculating it the first time it is needed
+    """
+    global _geometry
+    if _geometry is None:
+        _geometry = BoardGeometry(get_topology())
+    return _geometry
+
+
+def hex_to_pixel(hex_coords):
+    """
+    Takes the axial (q, r) coordinates of a tile and returns the pixel coordinates of its center on the screen
+    """
+    q, r = hex_coords[0], hex_coords[1]
+    return BOARD_CENTER[0] + HEX_SPACING_X * q + (HEX_SPACING_X // 2) * r, BOARD_CENTER[1] + HEX_SPACING_Y * r
+
+
+def vertex_to_pixel(vertex_coords):
+    """
+    Takes the (q, r, NORTH or SOUTH) coordinates of a vertex and returns its pixel coordinates on the screen, the top
+    or bottom corner of the hex at (q, r)
+    """
+    x_coord, y_coord = hex_to_pixel(vertex_coords)
+    if vertex_coords[2] == NORTH:
+        return x_coord, y_coord - HEX_SIZE // 2
+    return x_coord, y_coord + HEX_SIZE // 2
+
+
+def hex_corners(hex_center, size):
+    """
+    Returns the list of coordinates of the 6 corners of a hexagon, starting at the top corner and going clockwise
+    Formula to calculate coordinates modified from: https://www.redblobgames.com/grids/hexagons/
+    """
+    x_coord = hex_center[0]
+    y_coord = hex_center[1]
+    alpha = size / 4
+    beta = math.sqrt(3) * alpha
+
+    return [(round(x_coord), round(y_coord - (2 * alpha))),
+            (round(x_coord + beta), round(y_coord - alpha)),
+            (round(x_coord + beta), round(y_coord + alpha)),
+            (round(x_coord), round(y_coord + (2 * alpha))),
+            (round(x_coord - beta), round(y_coord + alpha)),
+            (round(x_coord - beta), round(y_coord - alpha))]
+
+
+def print_text(text, position, colour=BLACK, layer=HUD_LAYER):
     """
-    Displays text to screen
+    Draws text onto a layer of the screen, the text boxes and player statistics on top of the board by default
+    The same text is drawn again and again, so the rendered text is taken from the asset cache
     """
-    print_to_screen = GAME_FONT.render(text, True, colour)
-    screen.blit(print_to_screen, position)
\ No newline at end of file
+    print_to_screen = get_assets().render_text(text, GAME_FONT, colour)
+    get_renderer().blit(layer, print_to_screen, position)
\ No newline at end of file
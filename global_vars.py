@@ -1,5 +1,5 @@
 # Author: Joanna Getek
-# Last Modified: 01/03/2023
+# Last Modified: 10/18/2026
 # Description: Global variables that are used among the files for catan project
 
 import pygame
@@ -32,6 +32,16 @@ PINK = (255, 153, 255)
 ORANGE = (255, 133, 51)
 NAVY = (0, 0, 153)
 
+# Define the colour of each tile type on the board
+TILE_COLOURS = {"wheat": YELLOW, "wool": GREEN, "wood": DARK_GREEN, "ore": GREY, "brick": RED, "desert": BEIGE}
+
+# Define board layout constants, the board center is the pixel center of the middle tile and each tile is
+# HEX_SIZE pixels from its top corner to its bottom corner
+BOARD_CENTER = (425, 280)
+HEX_SIZE = 120
+HEX_SPACING_X = 104  # sqrt(3) / 2 * HEX_SIZE, rounded so tiles share corner pixels
+HEX_SPACING_Y = 90  # 3 / 4 * HEX_SIZE
+
 # Define player constants
 PLAYER_COLOUR_LIST = [BLUE, PINK, PURPLE, ORANGE]
 PLAYER_POSITIONS = [(10, 10), (700, 10), (10, 360), (700, 360)]
@@ -44,5 +54,5 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 # Creates caption for window
 pygame.display.set_caption("Settlers of Catan Pygame")
 
-# Ensures we are running at correct FPS - do we need?
-#clock = pygame.time.Clock()
+# Ensures we are running at correct FPS, the game loop sleeps on the clock between frames instead of spinning
+clock = pygame.time.Clock()
@@ -0,0 +1,112 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Finds what a mouse click landed on without checking every location, road, tile and button in turn.
+# The screen is divided into a uniform grid of square cells and each target is stored in every cell it reaches, so a
+# click only checks the few targets stored in its own cell, however many targets the board has.
+
+import pygame
+from global_vars import *
+
+# Kinds of target a click can land on: a vertex of the board, an edge by its midpoint, a tile by its center, or a
+# button by its rectangle
+VERTEX_TARGET = "vertex"
+EDGE_TARGET = "edge"
+TILE_TARGET = "tile"
+BUTTON_TARGET = "button"
+
+# Size in pixels of the square cells of the grid
+CELL_SIZE = 40
+
+# How far in pixels a click can be from a target and still land on it, the closest target is chosen when a click is
+# near more than one, edges are 60 pixels long so a click is always nearest the midpoint of the edge it is on
+VERTEX_RADIUS = 10
+EDGE_RADIUS = 30
+TILE_RADIUS = 40
+
+
+class HitTestIndex:
+    """
+    A uniform grid of the targets on the screen
+    Cell size is the size in pixels of each square cell
+    Cells maps the (column, row) of a cell to a dictionary of the targets in it, which maps each kind of target to a
+    list of (key, position, radius) for targets around a point and (key, rect) for buttons
+    """
+    def __init__(self, cell_size=CELL_SIZE):
+        self._cell_size = cell_size
+        self._cells = {}
+
+    def get_cell_size(self):
+        return self._cell_size
+
+    def get_cell(self, position):
+        """
+        Returns the (column, row) of the cell holding the (x, y) position
+        """
+        return int(position[0]) // self._cell_size, int(position[1]) // self._cell_size
+
+    def add_to_cells(self, kind, target, rect):
+        """
+        Stores target in every cell that rect overlaps
+        """
+        first_column, first_row = self.get_cell(rect.topleft)
+        last_column, last_row = self.get_cell((rect.right - 1, rect.bottom - 1))
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self._cells.setdefault((column, row), {}).setdefault(kind, []).append(target)
+
+    def add_point(self, kind, key, position, radius):
+        """
+        Adds a target of kind that a click lands on when it is within radius pixels of the (x, y) position, key is
+        returned when it is found
+        """
+        rect = pygame.Rect(position[0] - radius, position[1] - radius, 2 * radius + 1, 2 * radius + 1)
+        self.add_to_cells(kind, (key, position, radius), rect)
+
+    def add_rect(self, kind, key, rect):
+        """
+        Adds a target of kind that a click lands on when it is inside rect, key is returned when it is found
+        """
+        self.add_to_cells(kind, (key, pygame.Rect(rect)), rect)
+
+    def find_point(self, kind, position):
+        """
+        Returns the key of the closest target of kind added with add_point that the click at position lands on, or
+        None if it does not land on one
+        """
+        targets = self._cells.get(self.get_cell(position), {}).get(kind, [])
+        found = None
+        found_distance = None
+        for key, target_position, radius in targets:
+            distance = (target_position[0] - position[0]) ** 2 + (target_position[1] - position[1]) ** 2
+            if distance <= radius * radius and (found_distance is None or distance < found_distance):
+                found = key
+                found_distance = distance
+        return found
+
+    def find_rect(self, kind, position):
+        """
+        Returns the key of the target of kind added with add_rect that contains position, or None if there is none
+        """
+        for key, rect in self._cells.get(self.get_cell(position), {}).get(kind, []):
+            if rect.collidepoint(position):
+                return key
+        return None
+
+
+def create_board_index(geometry, board):
+    """
+    Takes the BoardGeometry with the pixel positions of the board and the Board of the GameState
+    Returns a HitTestIndex of every vertex, edge and tile of the board, keyed by their index on the board
+    """
+    index = HitTestIndex()
+    for vertex in range(board.get_number_of_vertices()):
+        index.add_point(VERTEX_TARGET, vertex, geometry.get_vertex_position(vertex), VERTEX_RADIUS)
+
+    for edge in range(board.get_number_of_edges()):
+        vertex1, vertex2 = board.get_edge_vertices(edge)
+        (x1, y1), (x2, y2) = geometry.get_vertex_position(vertex1), geometry.get_vertex_position(vertex2)
+        index.add_point(EDGE_TARGET, edge, ((x1 + x2) / 2, (y1 + y2) / 2), EDGE_RADIUS)
+
+    for tile in range(board.get_number_of_tiles()):
+        index.add_point(TILE_TARGET, tile, geometry.get_tile_center(tile), TILE_RADIUS)
+    return index
@@ -0,0 +1,167 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Scores the vertices of many boards for the setup settlements with NumPy arrays. Each vertex's expected
+# yield of every resource per dice roll is worked out once from the pips of the number tokens around it, then the
+# snake draft of setup settlements is played greedily on every board at once. choose_opening places the setup
+# settlements of computer players created with evaluate_openings, for example python tournament.py
+# mcts:evaluate_openings=1 mcts random random, and play_snake_draft scores thousands of boards together. Requires NumPy.
+
+import numpy as np
+from game_state import RESOURCE_TYPES, DESERT
+from board_topology import get_topology
+
+# Number of ways two six-sided dice roll each total, indexed by the total, a number token with more pips is rolled
+# more often, and the desert and robber roll of 7 pay nothing
+PIPS = np.array([0, 0, 1, 2, 3, 4, 5, 0, 5, 4, 3, 2, 1], dtype=np.float64)
+DICE_OUTCOMES = 36
+
+# Expected resources per roll a settlement is worth for each resource it collects that the player does not already
+# collect, so the second settlement is pushed towards the resources the first one is missing
+DIVERSITY_WEIGHT = 0.05
+
+
+class OpeningEvaluator:
+    """
+    Holds the expected yields of every vertex of many boards and plays the setup snake draft on all of them at once
+
+    Vertex yield is a (boards, vertices, resources) array of the expected number of each resource a settlement on
+    the vertex collects per dice roll
+    Vertex total is a (boards, vertices) array of the expected number of resources of any type per dice roll, vertex
+    produces is the (boards, vertices, resources) array that is True for each resource the vertex collects and vertex
+    diversity is a (boards, vertices) array of how many different resources a settlement on the vertex collects
+    Adjacency is the (vertices, vertices) matrix that is True where two vertices are one road apart, shared by every
+    board
+    """
+    def __init__(self, tile_resource, tile_number):
+        """
+        Takes tile resource, a (boards, tiles) array of the index in RESOURCE_TYPES of each tile's resource, -1 for the
+        desert, and tile number, a (boards, tiles) array of the number token of each tile, 0 for the desert, the same
+        arrays as a BatchSimulator
+        """
+        topology = get_topology()
+        number_of_tiles = topology.get_number_of_tiles()
+        number_of_vertices = topology.get_number_of_vertices()
+
+        incidence = np.zeros((number_of_tiles, number_of_vertices), dtype=np.float64)
+        for tile in range(number_of_tiles):
+            incidence[tile, topology.get_tile_vertices(tile)] = 1.0
+
+        self._adjacency = np.zeros((number_of_vertices, number_of_vertices), dtype=bool)
+        for vertex in range(number_of_vertices):
+            self._adjacency[vertex, topology.get_vertex_neighbours(vertex)] = True
+
+        tile_resource = np.asarray(tile_resource)
+        probability = PIPS[np.asarray(tile_number)] / DICE_OUTCOMES
+        resource_one_hot = tile_resource[:, :, None] == np.arange(len(RESOURCE_TYPES))
+        # each tile's yield of its resource, summed onto the vertices at its corners with one matrix product
+        tile_yield = probability[:, :, None] * resource_one_hot
+        self._vertex_yield = np.matmul(incidence.T, tile_yield)
+        self._vertex_total = self._vertex_yield.sum(axis=2)
+        self._vertex_produces = self._vertex_yield > 0
+        self._vertex_diversity = self._vertex_produces.sum(axis=2)
+
+    @classmethod
+    def from_states(cls, states):
+        """
+        Takes a list of GameState objects and returns an OpeningEvaluator of their boards
+        """
+        number_of_tiles = states[0].get_board().get_number_of_tiles()
+        tile_resource = np.full((len(states), number_of_tiles), -1, dtype=np.int32)
+        tile_number = np.zeros((len(states), number_of_tiles), dtype=np.int32)
+        for game, state in enumerate(states):
+            board = state.get_board()
+            for tile in range(number_of_tiles):
+                if board.get_tile_type(tile) != DESERT:
+                    tile_resource[game, tile] = RESOURCE_TYPES.index(board.get_tile_type(tile))
+                    tile_number[game, tile] = board.get_tile_number(tile)
+        return cls(tile_resource, tile_number)
+
+    @classmethod
+    def from_batch(cls, batch):
+        """
+        Returns an OpeningEvaluator of the boards of a BatchSimulator, so thousands of boards shuffled with
+        create_boards can be scored together
+        """
+        return cls(batch.get_tile_resource(), batch.get_tile_number())
+
+    def get_number_of_boards(self):
+        return self._vertex_yield.shape[0]
+
+    def get_vertex_yield(self):
+        return self._vertex_yield
+
+    def get_vertex_diversity(self):
+        return self._vertex_diversity
+
+    def get_legal_vertices(self, occupied):
+        """
+        Takes occupied, a (boards, vertices) boolean array of the vertices with a settlement on them
+        Returns a (boards, vertices) boolean array of the vertices a settlement can be built on, the empty vertices with
+        no settlement next to them
+        """
+        occupied = occupied.astype(np.int32)
+        return (occupied + occupied @ self._adjacency.astype(np.int32)) == 0
+
+    def score_vertices(self, legal, collected=None):
+        """
+        Takes legal, a (boards, vertices) boolean array of the vertices a settlement can be built on, and collected,
+        a (boards, resources) boolean array of the resources the player already collects, or None if they collect none
+        Returns a (boards, vertices) array of the score of a settlement on every vertex, its expected resources per
+        roll plus DIVERSITY_WEIGHT for every new resource it collects, and -inf for the vertices that are not legal
+        """
+        diversity = self._vertex_diversity
+        if collected is not None:
+            diversity = (self._vertex_produces & ~collected[:, None, :]).sum(axis=2)
+        scores = self._vertex_total + DIVERSITY_WEIGHT * diversity
+        return np.where(legal, scores, -np.inf)
+
+    def rank_placements(self, legal, collected=None):
+        """
+        Returns a (boards, vertices) array of the vertices of every board in order from the best placement to the
+        worst, the vertices that are not legal come last
+        """
+        # a stable sort of the negated scores keeps the lowest vertex first among equal scores
+        return np.argsort(-self.score_vertices(legal, collected), axis=1, kind="stable")
+
+    def play_snake_draft(self, number_of_players=4, settlements_per_player=2):
+        """
+        Plays the setup settlements of every board at once in the snake order of the GameState, each player taking
+        the best scoring legal vertex for them in turn
+        Returns a (boards, picks) array of the vertex of each pick in draft order and a (boards, players) array of the
+        expected resources per roll each player collects from their settlements
+        """
+        number_of_boards, number_of_vertices = self._vertex_diversity.shape
+        order = list(range(number_of_players))
+        draft = []
+        for round_number in range(settlements_per_player):
+            draft += order if round_number % 2 == 0 else order[::-1]
+
+        boards = np.arange(number_of_boards)
+        legal = np.ones((number_of_boards, number_of_vertices), dtype=bool)
+        collected = np.zeros((number_of_boards, number_of_players, len(RESOURCE_TYPES)), dtype=bool)
+        player_yield = np.zeros((number_of_boards, number_of_players), dtype=np.float64)
+        picks = np.zeros((number_of_boards, len(draft)), dtype=np.int32)
+
+        for pick, player_index in enumerate(draft):
+            vertex = np.argmax(self.score_vertices(legal, collected[:, player_index]), axis=1)
+            picks[:, pick] = vertex
+            # the settlement closes its own vertex and the vertices next to it
+            legal[boards, vertex] = False
+            legal &= ~self._adjacency[vertex]
+            collected[:, player_index] |= self._vertex_produces[boards, vertex]
+            player_yield[:, player_index] += self._vertex_total[boards, vertex]
+        return picks, player_yield
+
+
+def choose_opening(state):
+    """
+    Takes a GameState in the setup settlement phase and returns the best scoring vertex for the current player's
+    settlement, counting the resources their earlier settlements already collect
+    """
+    evaluator = OpeningEvaluator.from_states([state])
+    number_of_vertices = state.get_board().get_number_of_vertices()
+    occupied = np.array([[state.get_vertex_owner(vertex) is not None for vertex in range(number_of_vertices)]])
+
+    own_vertices = state.get_player(state.get_current_player()).get_settlements()
+    collected = (evaluator.get_vertex_yield()[0, own_vertices] > 0).any(axis=0)[None, :]
+    return int(evaluator.rank_placements(evaluator.get_legal_vertices(occupied), collected)[0, 0])
@@ -0,0 +1,141 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Draws the game in layers that are only copied to the screen where they have changed. Everything is
+# drawn onto an off-screen layer and the area it covers is marked dirty, then present composites the layers inside the
+# dirty rectangles and updates only those parts of the display, once for each frame.
+# Dirty rectangles: https://www.pygame.org/docs/tut/newbieguide.html
+
+import pygame
+from global_vars import *
+
+# Layers from the bottom up: the board and buttons, which rarely change, the players' roads and buildings, the robber,
+# and the player statistics, text boxes and dice drawn on top of everything
+BOARD_LAYER = 0
+STRUCTURE_LAYER = 1
+ROBBER_LAYER = 2
+HUD_LAYER = 3
+NUMBER_OF_LAYERS = 4
+
+# Colour that clears a part of a layer above the board so the layers underneath show through
+TRANSPARENT = (0, 0, 0, 0)
+
+# When more rectangles than this are dirty in one frame, a single rectangle around all of them is updated instead
+MAX_DIRTY_RECTS = 24
+
+
+class Renderer:
+    """
+    Draws onto off-screen layer surfaces and copies the changed areas to the display
+    Display is the display surface, layers holds one surface the size of the display for each layer, the board layer
+    is opaque and the layers above it are transparent wherever nothing has been drawn on them
+    Dirty rects is the list of rectangles drawn on since the last frame and frames counts the frames presented
+    """
+    def __init__(self, display=None):
+        if display is None:
+            display = screen
+        self._display = display
+        self._display_rect = display.get_rect()
+        size = display.get_size()
+        self._layers = [pygame.Surface(size).convert()]
+        for layer in range(1, NUMBER_OF_LAYERS):
+            self._layers.append(pygame.Surface(size, pygame.SRCALPHA).convert_alpha())
+        self._dirty_rects = []
+        self._frames = 0
+        self.clear()
+
+    def get_layer(self, layer):
+        return self._layers[layer]
+
+    def get_dirty_rects(self):
+        return self._dirty_rects
+
+    def get_frames(self):
+        return self._frames
+
+    def clear(self, background=LIGHT_BLUE):
+        """
+        Fills the board layer with the background colour and empties every other layer, the whole display is redrawn
+        in the next frame
+        """
+        self._layers[BOARD_LAYER].fill(background)
+        for layer in range(1, NUMBER_OF_LAYERS):
+            self._layers[layer].fill(TRANSPARENT)
+        self._dirty_rects = [self._display_rect.copy()]
+
+    def clear_rect(self, layer, rect):
+        """
+        Empties the rectangle rect of a layer above the board, showing the layers underneath again
+        """
+        self.mark_dirty(self._layers[layer].fill(TRANSPARENT, rect))
+
+    def mark_dirty(self, rect):
+        """
+        Adds rect to the areas of the display that are redrawn in the next frame, returns the rectangle
+        """
+        rect = pygame.Rect(rect).clip(self._display_rect)
+        if rect.width > 0 and rect.height > 0:
+            self._dirty_rects.append(rect)
+        return rect
+
+    def draw_polygon(self, layer, colour, points, width=0):
+        return self.mark_dirty(pygame.draw.polygon(self._layers[layer], colour, points, width))
+
+    def draw_line(self, layer, colour, start_position, end_position, width=1):
+        return self.mark_dirty(pygame.draw.line(self._layers[layer], colour, start_position, end_position, width))
+
+    def draw_rect(self, layer, colour, rect):
+        return self.mark_dirty(pygame.draw.rect(self._layers[layer], colour, rect))
+
+    def blit(self, layer, surface, position):
+        return self.mark_dirty(self._layers[layer].blit(surface, position))
+
+    def present(self):
+        """
+        Composites the layers inside the dirty rectangles onto the display and updates those areas of the display
+        with a single call, nothing is done if nothing has been drawn since the last frame
+        Returns the list of rectangles that were updated
+        """
+        if not self._dirty_rects:
+            return []
+        rects = merge_rects(self._dirty_rects)
+        self._dirty_rects = []
+
+        for rect in rects:
+            for layer_surface in self._layers:
+                self._display.blit(layer_surface, rect, rect)
+        pygame.display.update(rects)
+        self._frames += 1
+        return rects
+
+
+def merge_rects(rects, max_rects=MAX_DIRTY_RECTS):
+    """
+    Returns a list of rectangles covering rects where none of them overlap, overlapping rectangles are joined into one
+    so no area is composited twice, and if more than max_rects are left one rectangle around them all is returned
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        overlapping = rect.collidelist(merged)
+        while overlapping != -1:
+            rect.union_ip(merged.pop(overlapping))
+            overlapping = rect.collidelist(merged)
+        merged.append(rect)
+
+    if len(merged) > max_rects:
+        return [merged[0].unionall(merged[1:])]
+    return merged
+
+
+# Every part of the game draws onto the same layers, so there is only one renderer
+_renderer = None
+
+
+def get_renderer():
+    """
+    Returns the Renderer of the game screen, creating it the first time it is needed
+    """
+    global _renderer
+    if _renderer is None:
+        _renderer = Renderer()
+    return _renderer
@@ -0,0 +1,177 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: A corpus file of recorded games that can be memory mapped and read in any order. The games are stored
+# one after another in the GameRecord.to_bytes format, followed by an index of the offset of every game and a footer
+# that says where the index starts, so game i is found without reading the games before it.
+# For example: python replay_corpus.py games.rec games.corpus builds a corpus from a game record file.
+
+import mmap
+import struct
+import sys
+from game_record import GameRecord, read_game_records
+
+CORPUS_MAGIC = b"CTNC"
+CORPUS_VERSION = 1
+
+# The footer is the offset of the index, the number of games and the footer magic, all little-endian
+FOOTER_FORMAT = "<QQ4s"
+FOOTER_SIZE = struct.calcsize(FOOTER_FORMAT)
+FOOTER_MAGIC = b"CIDX"
+
+# The index holds the offset of every game plus the offset of the end of the last game, each as a little-endian
+# unsigned 64-bit integer, so the length of game i is offset i + 1 minus offset i
+OFFSET_FORMAT = "<Q"
+OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+GAME_RANGE_FORMAT = "<QQ"
+
+# Bytes before the first game
+FILE_HEADER_SIZE = len(CORPUS_MAGIC) + 1
+
+
+class CorpusWriter:
+    """
+    Writes a new corpus file, games are added one at a time and the index is written when the writer is closed
+    Offsets holds the offset of every game written so far
+    """
+    def __init__(self, path):
+        self._file = open(path, "wb")
+        self._file.write(CORPUS_MAGIC + bytes([CORPUS_VERSION]))
+        self._offsets = []
+
+    def get_number_of_games(self):
+        return len(self._offsets)
+
+    def write_game(self, record):
+        """
+        Adds a GameRecord, or a game already encoded with GameRecord.to_bytes, to the end of the corpus
+        """
+        if isinstance(record, GameRecord):
+            record = record.to_bytes()
+        self._offsets.append(self._file.tell())
+        self._file.write(record)
+
+    def close(self):
+        """
+        Writes the index and footer after the last game and closes the file
+        """
+        index_offset = self._file.tell()
+        index = bytearray()
+        for offset in self._offsets + [index_offset]:
+            index += struct.pack(OFFSET_FORMAT, offset)
+        self._file.write(index)
+        self._file.write(struct.pack(FOOTER_FORMAT, index_offset, len(self._offsets), FOOTER_MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+class ReplayCorpus:
+    """
+    A corpus file opened with mmap, games are read straight out of the mapped file and only the pages that are used
+    are loaded from disk
+    Data is the mmap of the file, index offset is where the index of game offsets starts and number of games is the
+    number of games in the corpus
+    Raises ValueError if the file is not a corpus file of this version
+    """
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("corpus file is empty")
+
+        if len(self._data) < FILE_HEADER_SIZE + FOOTER_SIZE or self._data[:len(CORPUS_MAGIC)] != CORPUS_MAGIC:
+            self.close()
+            raise ValueError("not a corpus file")
+        if self._data[len(CORPUS_MAGIC)] != CORPUS_VERSION:
+            self.close()
+            raise ValueError("unsupported corpus version")
+
+        index_offset, number_of_games, footer_magic = struct.unpack_from(FOOTER_FORMAT, self._data,
+                                                                         len(self._data) - FOOTER_SIZE)
+        if footer_magic != FOOTER_MAGIC or \
+                index_offset + (number_of_games + 1) * OFFSET_SIZE != len(self._data) - FOOTER_SIZE:
+            self.close()
+            raise ValueError("corpus index is damaged")
+        self._index_offset = index_offset
+        self._number_of_games = number_of_games
+
+    def __len__(self):
+        return self._number_of_games
+
+    def get_game_bytes(self, game):
+        """
+        Returns a memoryview of the encoded game, which points into the mapped file instead of copying it, the
+        memoryview has to be released before the corpus is closed
+        Raises IndexError if there is no game with that index
+        """
+        if game < 0:
+            game += self._number_of_games
+        if game < 0 or game >= self._number_of_games:
+            raise IndexError("corpus has no game " + str(game))
+        position = self._index_offset + game * OFFSET_SIZE
+        start, end = struct.unpack_from(GAME_RANGE_FORMAT, self._data, position)
+        return memoryview(self._data)[start:end]
+
+    def __getitem__(self, game):
+        """
+        Returns the GameRecord of the game with index game
+        """
+        return GameRecord.from_bytes(self.get_game_bytes(game))
+
+    def get_header(self, game):
+        """
+        Returns the GameRecord of the game without its actions, only the header is read
+        """
+        return GameRecord.from_bytes(self.get_game_bytes(game), header_only=True)
+
+    def __iter__(self):
+        for game in range(self._number_of_games):
+            yield self[game]
+
+    def iter_headers(self):
+        """
+        Generator of the header-only GameRecord of every game, in order
+        """
+        for game in range(self._number_of_games):
+            yield self.get_header(game)
+
+    def filter_games(self, predicate):
+        """
+        Returns the list of the indexes of the games whose header-only GameRecord passes predicate, for example
+        the games with a 6 and an 8 next to each other
+        """
+        return [game for game in range(self._number_of_games) if predicate(self.get_header(game))]
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+def build_corpus(record_path, corpus_path):
+    """
+    Copies every game in a game record file into a new corpus file
+    Returns the number of games copied
+    """
+    with CorpusWriter(corpus_path) as writer:
+        for record in read_game_records(record_path):
+            writer.write_game(record)
+        return writer.get_number_of_games()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("usage: python replay_corpus.py <game record file> <corpus file>")
+        sys.exit(1)
+    print("Copied " + str(build_corpus(sys.argv[1], sys.argv[2])) + " games")
@@ -0,0 +1,74 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Finds the connected pieces of a player's roads and the longest road in each of them, for the longest
+# road award. Roads are bitmasks of edges of the BoardTopology and a vertex with another player's building on it
+# blocks a road, which can end there but not continue through it.
+# The GameState keeps each player's pieces of road with their lengths and only measures the piece a new road joins
+# or the piece an opponent's settlement cuts, so the length of a road is never searched for over the whole board.
+
+# Longest road award, the first player to build a road of LONGEST_ROAD_MINIMUM roads in a row holds it until someone
+# builds a longer one, and it is worth LONGEST_ROAD_POINTS victory points
+LONGEST_ROAD_MINIMUM = 5
+LONGEST_ROAD_POINTS = 2
+
+
+def split_road_pieces(topology, road_mask, blocked_mask):
+    """
+    Takes a bitmask of a player's roads and a bitmask of the vertices blocked by other players' buildings
+    Returns a list of edge bitmasks, one for each piece of connected road, roads are only connected through a vertex
+    that is not blocked
+    """
+    pieces = []
+    remaining = road_mask
+    while remaining:
+        first_edge = remaining & -remaining
+        piece = first_edge
+        frontier = first_edge
+        while frontier:
+            edge_bit = frontier & -frontier
+            frontier ^= edge_bit
+            for vertex in topology.get_edge_vertices(edge_bit.bit_length() - 1):
+                if blocked_mask >> vertex & 1:
+                    continue
+                joined = topology.get_vertex_edge_mask(vertex) & remaining & ~piece
+                piece |= joined
+                frontier |= joined
+        pieces.append(piece)
+        remaining &= ~piece
+    return pieces
+
+
+def measure_road(topology, piece, blocked_mask):
+    """
+    Returns the number of roads in the longest path through the connected piece of road, a path never uses the same
+    road twice and stops at blocked vertices
+    Only the roads of the piece are searched, so the cost depends on the size of the piece and not the board
+    """
+    ends = {}
+    remaining = piece
+    while remaining:
+        edge_bit = remaining & -remaining
+        remaining ^= edge_bit
+        for vertex in topology.get_edge_vertices(edge_bit.bit_length() - 1):
+            ends[vertex] = ends.get(vertex, 0) + 1
+
+    def walk(vertex, used):
+        longest = 0
+        edges = topology.get_vertex_edge_mask(vertex) & piece & ~used
+        while edges:
+            edge_bit = edges & -edges
+            edges ^= edge_bit
+            edge = edge_bit.bit_length() - 1
+            vertex1, vertex2 = topology.get_edge_vertices(edge)
+            next_vertex = vertex2 if vertex1 == vertex else vertex1
+            length = 1
+            if not blocked_mask >> next_vertex & 1:
+                length += walk(next_vertex, used | edge_bit)
+            longest = max(longest, length)
+        return longest
+
+    # a longest path starts at a dead end or a junction unless the whole piece is a loop, where any vertex will do
+    starts = [vertex for vertex, count in ends.items() if count != 2 or blocked_mask >> vertex & 1]
+    if not starts:
+        starts = list(ends)[:1]
+    return max([walk(vertex, 0) for vertex in starts], default=0)
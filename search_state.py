@@ -0,0 +1,516 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: The rules of the game in the form the MCTSPlayer searches with. A search game is one flat list of
+# numbers and bitmasks, so copying it for a playout is a single list slice, and actions are played straight onto the
+# placement masks without the checks apply makes, because the search only plays actions listed by legal_actions
+# The Zobrist hash, turn number and roll payout index are not kept, each tile's payouts and the number of turns played
+# since the search game was made are kept instead, and the longest road award stays with the player who held it when
+# the search started, so a search game is only used to score moves, never to play the real game
+
+from actions import *
+
+# Positions of the values in a search game list
+PHASE = 0
+CURRENT_PLAYER = 1
+ROBBER_TILE = 2
+SETUP_STEP = 3
+LAST_SETTLEMENT = 4
+OPEN_MASK = 5
+OCCUPIED_MASK = 6
+ROAD_MASK = 7
+TURNS_PLAYED = 8
+PLAYERS_START = 9
+
+# Each player's values follow PLAYERS_START in turn order, at these positions from the start of the player's values,
+# the five resource counts come first in the order of RESOURCE_TYPES, and production is the number of resource cards
+# the player's buildings are expected to collect per dice roll, counting the tile with the robber on it
+VICTORY_POINTS = NUMBER_OF_RESOURCES
+SETTLEMENT_MASK = NUMBER_OF_RESOURCES + 1
+CITY_MASK = NUMBER_OF_RESOURCES + 2
+PLAYER_ROAD_MASK = NUMBER_OF_RESOURCES + 3
+ROAD_END_MASK = NUMBER_OF_RESOURCES + 4
+BUILDABLE_ROAD_MASK = NUMBER_OF_RESOURCES + 5
+PRODUCTION = NUMBER_OF_RESOURCES + 6
+PLAYER_SIZE = NUMBER_OF_RESOURCES + 7
+
+# Every total of two six-sided dice, one for each way of rolling it, so a roll is one pick from 36
+DICE_TOTALS = tuple(first + second for first in range(1, 7) for second in range(1, 7))
+
+# Chance of rolling each total with two six-sided dice, indexed by the total
+DICE_PROBABILITIES = [0.0, 0.0] + [(6 - abs(7 - total)) / 36 for total in range(2, 13)]
+
+# The action that ends a turn, one tuple shared by every list of legal actions, and the legal actions when it is the
+# only one
+END_TURN_ACTION = (END_TURN,)
+END_TURN_ACTIONS = (END_TURN_ACTION,)
+
+# Building costs as (position of the resource, amount) pairs
+SETTLEMENT_PRICE = tuple((RESOURCE_INDEX[resource], amount) for resource, amount in SETTLEMENT_COST.items())
+CITY_PRICE = tuple((RESOURCE_INDEX[resource], amount) for resource, amount in CITY_COST.items())
+ROAD_PRICE = tuple((RESOURCE_INDEX[resource], amount) for resource, amount in ROAD_COST.items())
+
+
+class SearchRules:
+    """
+    The tables a search game is played with, made once for a board and number of players
+    Payouts start is the position in a search game list of the first tile's payouts, a tuple with the position of a
+    resource count for each card the tile pays out, so a city's position is in it twice, and position players maps
+    each of those positions to the player it belongs to, player starts holds the position where each player's values
+    start
+    Number payouts start is the position of the payouts for the number 0, followed by those for each other number,
+    the payouts of all the tiles with that number so most rolls are paid out in one loop
+    The vertex, edge and tile tables are copied out of the BoardTopology into tuples, and the action tables hold every
+    action tuple up front so listing the legal actions never makes a new tuple
+    Setup actions keeps the tuple of setup settlement actions for each open mask the search has listed, build actions
+    keeps the tuples of build phase actions the same way, and build options keeps what each hand of resources the
+    search has seen can pay for
+    """
+    def __init__(self, state):
+        board = state.get_board()
+        topology = board.get_topology()
+        number_of_tiles = topology.get_number_of_tiles()
+        number_of_vertices = topology.get_number_of_vertices()
+        number_of_edges = topology.get_number_of_edges()
+
+        self._number_of_players = state.get_number_of_players()
+        self._number_of_tiles = number_of_tiles
+        self._number_of_vertices = number_of_vertices
+        self._payouts_start = PLAYERS_START + self._number_of_players * PLAYER_SIZE
+        self._player_starts = tuple(range(PLAYERS_START, self._payouts_start, PLAYER_SIZE))
+        self._buildable_road_positions = tuple(start + BUILDABLE_ROAD_MASK for start in self._player_starts)
+        self._next_players = tuple((player_index + 1) % self._number_of_players
+                                   for player_index in range(self._number_of_players))
+        self._number_payouts_start = self._payouts_start + number_of_tiles
+        self._position_players = {PLAYERS_START + player_index * PLAYER_SIZE + resource: player_index
+                                  for player_index in range(self._number_of_players)
+                                  for resource in range(NUMBER_OF_RESOURCES)}
+
+        self._vertex_neighbour_masks = tuple(topology.get_vertex_neighbour_mask(vertex)
+                                             for vertex in range(number_of_vertices))
+        self._vertex_edge_masks = tuple(topology.get_vertex_edge_mask(vertex) for vertex in range(number_of_vertices))
+        self._vertex_edges = tuple(tuple(topology.get_vertex_edges(vertex)) for vertex in range(number_of_vertices))
+        self._edge_vertices = tuple(tuple(topology.get_edge_vertices(edge)) for edge in range(number_of_edges))
+        # the bit and edge mask of the first vertex at the ends of each edge, followed by those of the second
+        self._edge_ends = tuple((1 << vertex1, self._vertex_edge_masks[vertex1], 1 << vertex2,
+                                 self._vertex_edge_masks[vertex2]) for vertex1, vertex2 in self._edge_vertices)
+        # only the tiles with a number token ever pay out
+        self._vertex_tiles = tuple(tuple(tile for tile in topology.get_vertex_tiles(vertex)
+                                         if board.get_tile_number(tile) is not None)
+                                   for vertex in range(number_of_vertices))
+        self._tile_resources = tuple(RESOURCE_INDEX.get(board.get_tile_type(tile), -1)
+                                     for tile in range(number_of_tiles))
+        self._number_tiles = tuple(tuple(board.get_number_tiles(number)) for number in range(13))
+        self._tile_numbers = tuple(board.get_tile_number(tile) or 0 for tile in range(number_of_tiles))
+        # for each player's start and each vertex, the positions of the payouts of the vertex's tiles and their
+        # numbers and the payout a building there adds to them for the player
+        self._vertex_payouts = {start: tuple(tuple((self._payouts_start + tile,
+                                                    self._number_payouts_start + self._tile_numbers[tile],
+                                                    (start + self._tile_resources[tile],))
+                                                   for tile in self._vertex_tiles[vertex])
+                                             for vertex in range(number_of_vertices))
+                                for start in self._player_starts}
+        self._tile_probabilities = tuple(DICE_PROBABILITIES[board.get_tile_number(tile) or 0]
+                                         for tile in range(number_of_tiles))
+        self._vertex_production = tuple(sum(self._tile_probabilities[tile] for tile in self._vertex_tiles[vertex])
+                                        for vertex in range(number_of_vertices))
+
+        self._settlement_actions = tuple((BUILD_SETTLEMENT, vertex) for vertex in range(number_of_vertices))
+        self._city_actions = tuple((BUILD_CITY, vertex) for vertex in range(number_of_vertices))
+        self._road_actions = tuple((BUILD_ROAD, edge) for edge in range(number_of_edges))
+        # the robber can be moved to any tile but the one it is on
+        self._robber_actions = tuple(tuple((MOVE_ROBBER, tile) for tile in range(number_of_tiles) if tile != robber_tile)
+                                     for robber_tile in range(number_of_tiles))
+        self._trade_actions = tuple(tuple((BANK_TRADE, give, receive) for receive in RESOURCE_TYPES if receive != give)
+                                    for give in RESOURCE_TYPES)
+        self._setup_actions = {}
+        self._build_actions = {}
+        self._build_options = {}
+
+    def get_number_of_players(self):
+        return self._number_of_players
+
+    def get_number_of_tiles(self):
+        return self._number_of_tiles
+
+    def create_game(self, state):
+        """
+        Returns the search game list of a GameState on the board the rules were made for
+        """
+        game = [state.get_phase(), state.get_current_player(), state.get_robber_tile(), state.get_setup_step(),
+                state.get_last_settlement(), state.get_open_mask(), 0, 0, 0]
+        resources = state.get_resource_counts()
+        for player_index in range(self._number_of_players):
+            buildings = state.get_settlement_mask(player_index) | state.get_city_mask(player_index)
+            game[OCCUPIED_MASK] |= buildings
+            game[ROAD_MASK] |= state.get_road_mask(player_index)
+            game += resources[player_index * NUMBER_OF_RESOURCES:(player_index + 1) * NUMBER_OF_RESOURCES]
+            game += [state.get_victory_points(player_index), state.get_settlement_mask(player_index),
+                     state.get_city_mask(player_index), state.get_road_mask(player_index),
+                     state.get_road_vertex_mask(player_index), state.get_buildable_road_mask(player_index), 0.0]
+
+        game += [()] * (self._number_of_tiles + 13)
+        for start in self._player_starts:
+            for vertex in mask_to_list(game[start + SETTLEMENT_MASK]):
+                self.add_payouts(game, start, vertex)
+            # a city is paid for twice, the same as when a settlement is built and then upgraded
+            for vertex in mask_to_list(game[start + CITY_MASK]):
+                self.add_payouts(game, start, vertex)
+                self.add_payouts(game, start, vertex)
+        return game
+
+    def legal_actions(self, game):
+        """
+        Returns the list of every action the current player is allowed to take, the same list legal_actions returns
+        for the GameState, read from the placement masks
+        """
+        phase = game[PHASE]
+        start = PLAYERS_START + game[CURRENT_PLAYER] * PLAYER_SIZE
+
+        if phase == BUILD_PHASE:
+            return list(self.get_build_actions(game, start, self.get_build_options(game, start)))
+
+        if phase == ROLL_PHASE:
+            return [(ROLL_DICE,)]
+
+        if phase == ROBBER_PHASE:
+            return list(self._robber_actions[game[ROBBER_TILE]])
+
+        if phase == SETUP_SETTLEMENT_PHASE:
+            return list(self.get_setup_actions(game))
+
+        if phase == SETUP_ROAD_PHASE:
+            return [self._road_actions[edge] for edge in self.get_setup_road_edges(game)]
+
+        return []
+
+    def get_setup_actions(self, game):
+        """
+        Returns the tuple of setup settlement actions for the search game's open vertices, every playout of a setup
+        move starts from the same few open masks, so the tuple for each is kept and shared
+        """
+        open_mask = game[OPEN_MASK]
+        actions = self._setup_actions.get(open_mask)
+        if actions is None:
+            actions = tuple(self._settlement_actions[vertex] for vertex in mask_to_list(open_mask))
+            self._setup_actions[open_mask] = actions
+        return actions
+
+    def get_build_actions(self, game, start, options):
+        """
+        Returns the legal actions of the build phase for the player whose values start at start, options is what
+        their hand can pay for from get_build_options
+        The actions are kept as a tuple for each set of vertices and edges that can be paid for and resources that
+        can be traded, so the same choice is always the same object
+        """
+        if not options:
+            return END_TURN_ACTIONS
+        can_build_settlement, can_build_city, can_build_road, trade_resources = options
+        key = (game[OPEN_MASK] & game[start + ROAD_END_MASK] if can_build_settlement else 0,
+               game[start + SETTLEMENT_MASK] if can_build_city else 0,
+               game[start + BUILDABLE_ROAD_MASK] if can_build_road else 0, trade_resources)
+        actions = self._build_actions.get(key)
+        if actions is None:
+            vertices, cities, edges = key[:3]
+            actions = tuple([self._settlement_actions[vertex] for vertex in mask_to_list(vertices)] +
+                            [self._city_actions[vertex] for vertex in mask_to_list(cities)] +
+                            [self._road_actions[edge] for edge in mask_to_list(edges)] +
+                            [action for resource in trade_resources for action in self._trade_actions[resource]] +
+                            [END_TURN_ACTION])
+            self._build_actions[key] = actions
+        return actions
+
+    def get_build_options(self, game, start):
+        """
+        Returns what the player whose values start at start can pay for, see find_build_options
+        """
+        hand = tuple(game[start:start + NUMBER_OF_RESOURCES])
+        options = self._build_options.get(hand)
+        if options is None:
+            options = self.find_build_options(hand)
+        return options
+
+    def find_build_options(self, hand):
+        """
+        Takes a tuple of the resource counts in a player's hand and returns a tuple of whether it pays for a
+        settlement, a city and a road and the resources it can trade in to the bank, or an empty tuple if it can not
+        pay for anything, and keeps it for the next time the search sees the same hand
+        """
+        options = (all(hand[resource] >= amount for resource, amount in SETTLEMENT_PRICE),
+                   all(hand[resource] >= amount for resource, amount in CITY_PRICE),
+                   all(hand[resource] >= amount for resource, amount in ROAD_PRICE),
+                   tuple(resource for resource in range(NUMBER_OF_RESOURCES) if hand[resource] >= BANK_TRADE_RATE))
+        if not any(options):
+            options = ()
+        self._build_options[hand] = options
+        return options
+
+    def play_until_choice(self, game, random_number):
+        """
+        Rolls the dice with random number, a function returning a float from 0 to 1 like random.random, and plays
+        every action that is the only legal one, until the current player has a choice or the game is over
+        Returns the current player's legal actions, or an empty list once the game is over, the setup settlement,
+        robber and build phase actions are tuples kept by the rules, the same object every time the choice is the same
+        """
+        build_options = self._build_options
+        while True:
+            phase = game[PHASE]
+            if phase == BUILD_PHASE:
+                # the hand is looked up here rather than with get_build_options, this is the most used part of the
+                # search, and ending the turn is the only legal action when the hand pays for nothing
+                start = PLAYERS_START + game[CURRENT_PLAYER] * PLAYER_SIZE
+                hand = tuple(game[start:start + NUMBER_OF_RESOURCES])
+                options = build_options.get(hand)
+                if options is None:
+                    options = self.find_build_options(hand)
+                if options:
+                    actions = self.get_build_actions(game, start, options)
+                    if len(actions) > 1:
+                        return actions
+                self.end_turn(game)
+                phase = ROLL_PHASE
+            if phase == ROLL_PHASE:
+                self.roll_dice(game, DICE_TOTALS[int(random_number() * 36)])
+                continue
+            if phase == ROBBER_PHASE:
+                return self._robber_actions[game[ROBBER_TILE]]
+            if phase == SETUP_SETTLEMENT_PHASE:
+                actions = self.get_setup_actions(game)
+                if len(actions) > 1:
+                    return actions
+                self.play(game, actions[0])
+                continue
+            if phase == GAME_OVER_PHASE:
+                return []
+            actions = self.legal_actions(game)
+            if len(actions) > 1:
+                return actions
+            self.play(game, actions[0])
+
+    def play(self, game, action, dice_roll=None):
+        """
+        Plays one of the legal actions of the current player, rolling the dice plays dice_roll, the total rolled
+        """
+        phase = game[PHASE]
+        player_index = game[CURRENT_PLAYER]
+        action_type = action[0]
+
+        if phase == BUILD_PHASE:
+            if action_type == END_TURN:
+                self.end_turn(game)
+                return
+            if action_type == BUILD_SETTLEMENT:
+                self.build_settlement(game, player_index, action[1])
+            elif action_type == BUILD_CITY:
+                self.build_city(game, player_index, action[1])
+            elif action_type == BUILD_ROAD:
+                self.build_road(game, player_index, action[1])
+            else:
+                start = PLAYERS_START + player_index * PLAYER_SIZE
+                game[start + RESOURCE_INDEX[action[1]]] -= BANK_TRADE_RATE
+                game[start + RESOURCE_INDEX[action[2]]] += 1
+        elif phase == ROLL_PHASE:
+            self.roll_dice(game, dice_roll)
+        elif phase == ROBBER_PHASE:
+            self.move_robber(game, action[1])
+        elif phase == SETUP_SETTLEMENT_PHASE:
+            self.build_settlement(game, player_index, action[1], setup=True)
+            game[LAST_SETTLEMENT] = action[1]
+            game[PHASE] = SETUP_ROAD_PHASE
+        elif phase == SETUP_ROAD_PHASE:
+            self.build_road(game, player_index, action[1], setup=True)
+            self.advance_setup(game)
+
+    def roll_dice(self, game, dice_roll):
+        """
+        Pays out every building on the tiles with the rolled number, except the tile with the robber on it, or starts
+        moving the robber on a 7
+        """
+        if dice_roll == 7:
+            game[PHASE] = ROBBER_PHASE
+            return
+        robber_tile = game[ROBBER_TILE]
+        if dice_roll == self._tile_numbers[robber_tile]:
+            # only the tiles without the robber pay out, so they are paid one by one
+            for tile in self._number_tiles[dice_roll]:
+                if tile != robber_tile:
+                    for position in game[self._payouts_start + tile]:
+                        game[position] += 1
+        else:
+            for position in game[self._number_payouts_start + dice_roll]:
+                game[position] += 1
+        game[PHASE] = BUILD_PHASE
+
+    def move_robber(self, game, tile):
+        game[ROBBER_TILE] = tile
+        game[PHASE] = BUILD_PHASE
+
+    def end_turn(self, game):
+        game[CURRENT_PLAYER] = self._next_players[game[CURRENT_PLAYER]]
+        game[PHASE] = ROLL_PHASE
+        game[TURNS_PLAYED] += 1
+
+    def advance_setup(self, game):
+        """
+        Moves on to the next player of setup in the same order as GameState.advance_setup
+        """
+        setup_step = game[SETUP_STEP] + 1
+        number_of_players = self._number_of_players
+        game[SETUP_STEP] = setup_step
+        if setup_step >= 2 * number_of_players:
+            game[CURRENT_PLAYER] = 0
+            game[PHASE] = ROLL_PHASE
+            return
+        game[CURRENT_PLAYER] = setup_step if setup_step < number_of_players else 2 * number_of_players - 1 - setup_step
+        game[PHASE] = SETUP_SETTLEMENT_PHASE
+
+    def build_settlement(self, game, player_index, vertex, setup=False):
+        """
+        Builds a settlement for the player, updating the placement masks the same way as
+        GameState.update_settlement_placements
+        """
+        start = PLAYERS_START + player_index * PLAYER_SIZE
+        if not setup:
+            for resource, amount in SETTLEMENT_PRICE:
+                game[start + resource] -= amount
+        bit = 1 << vertex
+        game[start + SETTLEMENT_MASK] |= bit
+        game[OCCUPIED_MASK] |= bit
+        game[start + VICTORY_POINTS] += 1
+        self.add_payouts(game, start, vertex)
+
+        vertex_edges = self._vertex_edge_masks[vertex]
+        game[OPEN_MASK] &= ~(bit | self._vertex_neighbour_masks[vertex])
+        road_mask = game[ROAD_MASK]
+        game[start + BUILDABLE_ROAD_MASK] |= vertex_edges & ~road_mask
+        # the settlement can only cut off another player's edges when one of their roads ends at the vertex
+        if road_mask & ~game[start + PLAYER_ROAD_MASK] & vertex_edges:
+            for other_start in self._player_starts:
+                if other_start == start or not game[other_start + BUILDABLE_ROAD_MASK] & vertex_edges:
+                    continue
+                # an edge at the vertex stays buildable only if the other player can still reach its far end
+                reachable = game[other_start + SETTLEMENT_MASK] | game[other_start + CITY_MASK] | \
+                    (game[other_start + ROAD_END_MASK] & ~game[OCCUPIED_MASK])
+                for edge in mask_to_list(game[other_start + BUILDABLE_ROAD_MASK] & vertex_edges):
+                    vertex1, vertex2 = self._edge_vertices[edge]
+                    if not reachable >> (vertex2 if vertex1 == vertex else vertex1) & 1:
+                        game[other_start + BUILDABLE_ROAD_MASK] &= ~(1 << edge)
+        if game[start + VICTORY_POINTS] >= WINNING_VICTORY_POINTS:
+            game[PHASE] = GAME_OVER_PHASE
+
+    def build_city(self, game, player_index, vertex):
+        start = PLAYERS_START + player_index * PLAYER_SIZE
+        for resource, amount in CITY_PRICE:
+            game[start + resource] -= amount
+        bit = 1 << vertex
+        game[start + SETTLEMENT_MASK] &= ~bit
+        game[start + CITY_MASK] |= bit
+        game[start + VICTORY_POINTS] += 1
+        # a city collects one more of each resource around it than the settlement did
+        self.add_payouts(game, start, vertex)
+        if game[start + VICTORY_POINTS] >= WINNING_VICTORY_POINTS:
+            game[PHASE] = GAME_OVER_PHASE
+
+    def build_road(self, game, player_index, edge, setup=False):
+        """
+        Builds a road for the player, updating the placement masks the same way as GameState.update_road_placements
+        """
+        start = PLAYERS_START + player_index * PLAYER_SIZE
+        if not setup:
+            for resource, amount in ROAD_PRICE:
+                game[start + resource] -= amount
+        bit = 1 << edge
+        not_bit = ~bit
+        road_mask = game[ROAD_MASK] | bit
+        game[ROAD_MASK] = road_mask
+        game[start + PLAYER_ROAD_MASK] |= bit
+        for position in self._buildable_road_positions:
+            game[position] &= not_bit
+
+        # roads lead on from an end of the edge only if it is empty or has one of the player's buildings
+        passable = game[start + SETTLEMENT_MASK] | game[start + CITY_MASK] | ~game[OCCUPIED_MASK]
+        vertex_bit1, vertex_edges1, vertex_bit2, vertex_edges2 = self._edge_ends[edge]
+        game[start + ROAD_END_MASK] |= vertex_bit1 | vertex_bit2
+        buildable = 0
+        if passable & vertex_bit1:
+            buildable = vertex_edges1
+        if passable & vertex_bit2:
+            buildable |= vertex_edges2
+        game[start + BUILDABLE_ROAD_MASK] |= buildable & ~road_mask
+
+    def add_payouts(self, game, start, vertex):
+        """
+        Adds one of each resource around the vertex to the payouts of its tiles and of their numbers, for the player
+        starting at start
+        """
+        for tile_position, number_position, payout in self._vertex_payouts[start][vertex]:
+            game[tile_position] += payout
+            game[number_position] += payout
+        game[start + PRODUCTION] += self._vertex_production[vertex]
+
+    def get_setup_road_edges(self, game):
+        """
+        Returns the list of edges without a road at the settlement that was just placed in setup
+        """
+        road_mask = game[ROAD_MASK]
+        return [edge for edge in self._vertex_edges[game[LAST_SETTLEMENT]] if not road_mask >> edge & 1]
+
+    def finish_setup(self, game, random_number):
+        """
+        Places every setup settlement that is left on a random open vertex, each with a road on a random free edge at
+        it, finishing the road of a settlement that was just placed first, random number is a function returning a
+        float from 0 to 1 like random.random
+        """
+        if game[PHASE] == SETUP_ROAD_PHASE:
+            edges = self.get_setup_road_edges(game)
+            self.build_road(game, game[CURRENT_PLAYER], edges[int(random_number() * len(edges))], setup=True)
+            self.advance_setup(game)
+
+        number_of_vertices = self._number_of_vertices
+        vertex_edges = self._vertex_edges
+        while game[PHASE] == SETUP_SETTLEMENT_PHASE:
+            player_index = game[CURRENT_PLAYER]
+            start = PLAYERS_START + player_index * PLAYER_SIZE
+            # the first open vertex from a random vertex onwards
+            open_mask = game[OPEN_MASK]
+            first_vertex = int(random_number() * number_of_vertices)
+            later = open_mask >> first_vertex
+            if not later:
+                first_vertex = 0
+                later = open_mask
+            vertex = first_vertex + (later & -later).bit_length() - 1
+            edges = vertex_edges[vertex]
+            edge = edges[int(random_number() * len(edges))]
+
+            # the same as build_settlement and build_road, but no road can be at an open vertex during setup, so the
+            # settlement cuts off no one's edges and the road is free, and both ends of the road are empty or the
+            # new settlement, so the road leads on from both
+            bit = 1 << vertex
+            game[start + SETTLEMENT_MASK] |= bit
+            game[OCCUPIED_MASK] |= bit
+            game[OPEN_MASK] = open_mask & ~(bit | self._vertex_neighbour_masks[vertex])
+            game[start + VICTORY_POINTS] += 1
+            self.add_payouts(game, start, vertex)
+            edge_bit = 1 << edge
+            road_mask = game[ROAD_MASK] | edge_bit
+            game[ROAD_MASK] = road_mask
+            game[start + PLAYER_ROAD_MASK] |= edge_bit
+            for position in self._buildable_road_positions:
+                game[position] &= ~edge_bit
+            vertex_bit1, vertex_edges1, vertex_bit2, vertex_edges2 = self._edge_ends[edge]
+            game[start + ROAD_END_MASK] |= vertex_bit1 | vertex_bit2
+            game[start + BUILDABLE_ROAD_MASK] |= (vertex_edges1 | vertex_edges2) & ~road_mask
+            game[LAST_SETTLEMENT] = vertex
+            self.advance_setup(game)
+
+    def get_production(self, game):
+        """
+        Returns a list of the number of resource cards each player is expected to collect per dice roll, the
+        production kept for each player less what the tile with the robber on it would pay them
+        """
+        production = [game[start + PRODUCTION] for start in self._player_starts]
+        position_players = self._position_players
+        robber_tile = game[ROBBER_TILE]
+        probability = self._tile_probabilities[robber_tile]
+        for position in game[self._payouts_start + robber_tile]:
+            production[position_players[position]] -= probability
+        return production
@@ -1,14 +1,17 @@
 # Author: Joanna Getek
-# Last Modified: 01/02/2023
+# Last Modified: 10/18/2026
 # Description: Contains the classes for building a player's roads, settlements and cities
 
 import pygame
 from global_vars import *
+from renderer import get_renderer, STRUCTURE_LAYER
 
 class Settlement:
     """
     Creates a settlement object on a location on the gameboard belonging to one of the players
     """
+    __slots__ = ("_position", "_colour", "_surrounding_tiles", "_victory_points")
+
     def __init__(self, position, colour):
         self._position = position
         self._colour = colour
@@ -23,25 +26,31 @@ class Settlement:
 
     def create_surrounding_tiles(self, game):
         """
-        Adds all tiles surrounding the settlement to self._surrounding_tiles
+        Adds all tiles surrounding the settlement to self._surrounding_tiles, looked up from the location at the
+        settlement position
         """
+        location = game.get_location(self._position)
+        if location is None:
+            return
+
         game_hex_tiles = game.get_hex_tiles()
-        # iterate through each hex tile and get list of coordinates
-        for hex_tile in game_hex_tiles:
-            hex_coordinates = hex_tile.get_coordinates()
-            # if the settlement position is a hex_tile coordinate, append the hex_tile object to surrounding tiles
-            if self._position in hex_coordinates:
-                self._surrounding_tiles.append(hex_tile)
+        for tile in game.get_state().get_board().get_vertex_tiles(location.get_vertex_id()):
+            self._surrounding_tiles.append(game_hex_tiles[tile])
 
     def draw_settlement(self):
         """
-        Draws the settlement to the game screen
+        Draws the settlement onto the structure layer
         """
         x = self._position[0]
         y = self._position[1]
         pentagon_coordinates = [(x - 10, y - 10), (x - 10, y + 10), (x + 10, y + 10), (x + 10, y - 10), (x, y - 20)]
-        pygame.draw.polygon(screen, self._colour, pentagon_coordinates)
-        pygame.display.flip()
+        get_renderer().draw_polygon(STRUCTURE_LAYER, self._colour, pentagon_coordinates)
+
+    def erase_settlement(self):
+        """
+        Clears the settlement from the structure layer, along with the ends of any roads drawn under it
+        """
+        get_renderer().clear_rect(STRUCTURE_LAYER, pygame.Rect(self._position[0] - 10, self._position[1] - 20, 21, 31))
 
 
 class Road:
@@ -51,17 +60,24 @@ class Road:
         colour, a string indicating the colour of the road
     Creates a road object attached to two locations on the gameboard belonging to one of the players
     """
+    __slots__ = ("_colour", "_start_pos", "_end_pos")
+
     def __init__(self, road_coordinates, colour):
         self._colour = colour
         self._start_pos = road_coordinates[0]
         self._end_pos = road_coordinates[1]
 
+    def touches(self, position):
+        """
+        Returns True if one end of the road is at the (x, y) position
+        """
+        return position in (self._start_pos, self._end_pos)
+
     def draw_road(self):
         """
-        Draws a road to the game screen
+        Draws a road onto the structure layer
         """
-        pygame.draw.line(screen, self._colour, self._start_pos, self._end_pos, 8)
-        pygame.display.flip()
+        get_renderer().draw_line(STRUCTURE_LAYER, self._colour, self._start_pos, self._end_pos, 8)
 
 
 class City(Settlement):
@@ -69,9 +85,23 @@ class City(Settlement):
     Creates a city object on a location on the gameboard belonging to one of the players
     Inherits from Settlement class
     """
+    __slots__ = ()
+
     def __init__(self, position, colour):
         super().__init__(position, colour)
         self._victory_points = 2
 
     def get_victory_points(self):
-        return self._victory_points
\ No newline at end of file
+        return self._victory_points
+
+    def draw_settlement(self):
+        """
+        Draws the city onto the structure layer, a wider building than a settlement with a black outline
+        """
+        x = self._position[0]
+        y = self._position[1]
+        city_coordinates = [(x - 15, y - 5), (x - 15, y + 12), (x + 15, y + 12), (x + 15, y - 12), (x + 5, y - 12),
+                            (x + 5, y - 5), (x - 5, y - 15)]
+        renderer = get_renderer()
+        renderer.draw_polygon(STRUCTURE_LAYER, self._colour, city_coordinates)
+        renderer.draw_polygon(STRUCTURE_LAYER, BLACK, city_coordinates, 2)
@@ -0,0 +1,338 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Runs a tournament between computer player configurations without a display. Games are played in a
+# pool of processes, one for each core, and the results are combined into win rates with confidence intervals,
+# average game length and the distribution of final victory points.
+# For example: python tournament.py mcts:time_budget=0.1 mcts:iterations=200 random random --games 20
+# With --fair-boards every game is played on a board from the BoardGenerator, all generated at once for each round.
+
+import argparse
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from actions import *
+from ai_players import AI_PLAYER_TYPES, create_ai_player, get_player_options
+from game_record import GameRecord, GameRecordWriter
+
+# Number of seats at each table
+PLAYERS_PER_GAME = 4
+
+# Games that have not finished after this many turns are counted as draws
+MAX_TURNS = 1000
+
+# z score of the 95% confidence intervals
+CONFIDENCE_Z = 1.96
+
+# Option values that are read as Python values instead of text, written in any case
+OPTION_KEYWORDS = {"true": True, "false": False, "none": None}
+
+ROUND_ROBIN = "round-robin"
+SWISS = "swiss"
+
+
+def parse_player_config(text):
+    """
+    Takes a player configuration written as the player type, optionally followed by a colon and comma separated
+    options, for example "mcts:time_budget=0.1,playout_rounds=3"
+    Returns a tuple of (player type, options dictionary), option values are read as numbers where possible and
+    True, False and None are read as those values, so evaluate_openings=False turns the option off
+    Raises ValueError if the player type is unknown, an option is not written as name=value or the player type does
+    not take an option of that name, so a mistyped option is caught here instead of in a worker process
+    """
+    player_type, separator, option_text = text.partition(":")
+    if player_type not in AI_PLAYER_TYPES:
+        raise ValueError("unknown player type " + player_type + ", choose from " + ", ".join(AI_PLAYER_TYPES))
+
+    options = {}
+    for option in option_text.split(","):
+        if option == "":
+            continue
+        name, equals, value = option.partition("=")
+        if equals == "":
+            raise ValueError("option " + option + " is not written as name=value")
+        if name not in get_player_options(player_type):
+            raise ValueError("unknown option " + name + " for " + player_type + ", choose from " +
+                             ", ".join(get_player_options(player_type)))
+        for number_type in (int, float):
+            try:
+                value = number_type(value)
+                break
+            except ValueError:
+                pass
+        if isinstance(value, str) and value.lower() in OPTION_KEYWORDS:
+            value = OPTION_KEYWORDS[value.lower()]
+        options[name] = value
+    return player_type, options
+
+
+def play_game(task):
+    """
+    Plays one game between computer players, task is a tuple of (game seed, list of player configurations in seat
+    order, whether to record the game, board), where each configuration is a (player type, options) tuple and board
+    is a (tile types, tile numbers) tuple of a board made beforehand, or None to shuffle the board from the seed
+    Runs in a worker process, so it only uses its arguments and returns plain values
+    Returns a dictionary with the seat of the winner (None if the game hit MAX_TURNS), the number of turns played,
+    the final victory points of each seat and the game encoded by GameRecord.to_bytes, None if it was not recorded
+    Raises ValueError if a player chooses an action that is not legal
+    """
+    game_seed, seat_configs, record_game, board = task
+
+    players = []
+    for seat, (player_type, options) in enumerate(seat_configs):
+        player_options = dict(options)
+        # a seed given in the options is combined with the game and seat, so the games of a tournament still differ
+        seat_seed = game_seed * PLAYERS_PER_GAME + seat
+        if player_options.get("seed") is not None:
+            seat_seed = str(player_options["seed"]) + "-" + str(seat_seed)
+        player_options["seed"] = seat_seed
+        players.append(create_ai_player(player_type, **player_options))
+
+    tile_types, tile_numbers = (None, None) if board is None else board
+    state = new_game(["Player " + str(seat + 1) for seat in range(len(seat_configs))], game_seed, tile_types,
+                     tile_numbers)
+    record = GameRecord.from_state(state) if record_game else None
+    while not is_terminal(state) and state.get_turn_number() <= MAX_TURNS:
+        seat = state.get_current_player()
+        action = players[seat].choose_action(state)
+        # an action that is not applied would leave a record that can not be replayed, so the game is stopped
+        if not apply(state, action):
+            raise ValueError("the " + seat_configs[seat][0] + " player in seat " + str(seat) +
+                             " played the illegal action " + str(action))
+        if record is not None:
+            record.add_action(action, state)
+
+    winner = state.get_winner()
+    if record is not None:
+        record.set_result(state)
+    return {"winner": None if winner is None else winner.get_index(),
+            "turns": state.get_turn_number(),
+            "victory_points": [state.get_victory_points(seat) for seat in range(len(seat_configs))],
+            "record": None if record is None else record.to_bytes()}
+
+
+def wilson_interval(wins, games, z=CONFIDENCE_Z):
+    """
+    Returns the (low, high) Wilson score confidence interval of a win rate of wins out of games
+    https://en.wikipedia.org/wiki/Binomial_proportion_confidence_interval#Wilson_score_interval
+    """
+    if games == 0:
+        return 0.0, 1.0
+    rate = wins / games
+    denominator = 1 + z * z / games
+    center = (rate + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class PlayerRecord:
+    """
+    The results of one player configuration over the tournament
+    Name is the configuration as it was written on the command line
+    Games counts the seats it played, so a configuration playing itself is counted once for each seat
+    Wins counts the games it won and victory point counts maps final victory points to how many games ended with them
+    """
+    def __init__(self, name):
+        self._name = name
+        self._games = 0
+        self._wins = 0
+        self._victory_point_counts = {}
+
+    def get_name(self):
+        return self._name
+
+    def get_games(self):
+        return self._games
+
+    def get_wins(self):
+        return self._wins
+
+    def get_victory_point_counts(self):
+        return self._victory_point_counts
+
+    def add_game(self, won, victory_points):
+        self._games += 1
+        if won:
+            self._wins += 1
+        self._victory_point_counts[victory_points] = self._victory_point_counts.get(victory_points, 0) + 1
+
+    def get_win_rate(self):
+        if self._games == 0:
+            return 0.0
+        return self._wins / self._games
+
+    def get_confidence_interval(self):
+        return wilson_interval(self._wins, self._games)
+
+    def get_average_victory_points(self):
+        if self._games == 0:
+            return 0.0
+        total = sum(points * count for points, count in self._victory_point_counts.items())
+        return total / self._games
+
+
+def round_robin_tables(number_of_configs):
+    """
+    Returns the list of tables of a round robin, each table is a tuple of configuration indexes, one for each seat
+    With at least PLAYERS_PER_GAME configurations every group of that size plays, otherwise the configurations are
+    repeated around a single table
+    """
+    if number_of_configs >= PLAYERS_PER_GAME:
+        return list(itertools.combinations(range(number_of_configs), PLAYERS_PER_GAME))
+    return [tuple(seat % number_of_configs for seat in range(PLAYERS_PER_GAME))]
+
+
+def swiss_tables(records):
+    """
+    Returns the tables of the next Swiss round, the configurations are sorted by win rate and each table is filled
+    with configurations next to each other in the standings, a short last table is filled from the top
+    """
+    standings = sorted(range(len(records)), key=lambda index: records[index].get_win_rate(), reverse=True)
+    tables = []
+    for start in range(0, len(standings), PLAYERS_PER_GAME):
+        table = standings[start:start + PLAYERS_PER_GAME]
+        filler = 0
+        while len(table) < PLAYERS_PER_GAME:
+            table.append(standings[filler % len(standings)])
+            filler += 1
+        tables.append(tuple(table))
+    return tables
+
+
+def create_tasks(tables, configs, games_per_table, first_seed, record_games=False, fair_boards=False):
+    """
+    Returns a list of (game seed, seat configurations, record games, board) tasks and a matching list of the
+    configuration index in each seat, every table plays games_per_table games with the seats rotated each game so no
+    configuration always goes first
+    If fair boards is True the boards of every game are generated together by a BoardGenerator seeded with the first
+    seed, otherwise the board is None and each game shuffles its own board from its seed
+    """
+    tasks = []
+    seatings = []
+    game_seed = first_seed
+    boards = [None] * (len(tables) * games_per_table)
+    if fair_boards:
+        # imported here so NumPy is only needed for tournaments on fair boards
+        from board_generator import BoardGenerator, board_tiles
+        tile_resource, tile_number = BoardGenerator(first_seed).generate(len(boards))
+        boards = [board_tiles(tile_resource[game], tile_number[game]) for game in range(len(boards))]
+
+    for table in tables:
+        for game_number in range(games_per_table):
+            rotation = game_number % PLAYERS_PER_GAME
+            seating = table[rotation:] + table[:rotation]
+            tasks.append((game_seed, [configs[index] for index in seating], record_games,
+                          boards[game_seed - first_seed]))
+            seatings.append(seating)
+            game_seed += 1
+    return tasks, seatings
+
+
+def run_tournament(config_names, games_per_table, tournament_format=ROUND_ROBIN, rounds=3, seed=0, workers=None,
+                   record_path=None, fair_boards=False):
+    """
+    Plays a tournament between the player configurations in config_names, written as for parse_player_config
+    Each table plays games_per_table games, a round robin plays one round with every table and a Swiss tournament
+    plays rounds rounds, the games are played by a pool of workers processes, one for each core if it is None
+    If record_path is given every game is appended to that game record file, and if fair_boards is True every game
+    is played on a fair board from the BoardGenerator instead of a shuffled one
+    Returns the list of PlayerRecords in the same order as config_names and the list of game lengths in turns
+    """
+    configs = [parse_player_config(name) for name in config_names]
+    records = []
+    for index, name in enumerate(config_names):
+        # the same configuration can be entered more than once, so repeats are numbered to tell them apart
+        repeats = config_names[:index].count(name)
+        records.append(PlayerRecord(name if repeats == 0 else name + " (" + str(repeats + 1) + ")"))
+    game_lengths = []
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if tournament_format == SWISS:
+        round_tables = [None] * rounds
+    else:
+        round_tables = [round_robin_tables(len(configs))]
+
+    next_seed = seed
+    writer = None if record_path is None else GameRecordWriter(record_path)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for tables in round_tables:
+            if tables is None:
+                tables = swiss_tables(records)
+            tasks, seatings = create_tasks(tables, configs, games_per_table, next_seed, writer is not None,
+                                           fair_boards)
+            next_seed += len(tasks)
+
+            # a few games are sent to each worker at once, so the workers are not waiting on the main process
+            chunk_size = max(1, len(tasks) // (workers * 4))
+            for seating, result in zip(seatings, executor.map(play_game, tasks, chunksize=chunk_size)):
+                game_lengths.append(result["turns"])
+                if writer is not None:
+                    writer.write_game(result["record"])
+                for seat, config_index in enumerate(seating):
+                    records[config_index].add_game(result["winner"] == seat, result["victory_points"][seat])
+
+    if writer is not None:
+        writer.close()
+    return records, game_lengths
+
+
+def print_results(records, game_lengths, elapsed_time):
+    """
+    Prints a table of the tournament results, sorted by win rate
+    """
+    print("{:<40} {:>6} {:>5} {:>7} {:>17} {:>7}".format("player", "games", "wins", "win %", "95% interval",
+                                                         "avg VP"))
+    for record in sorted(records, key=lambda player_record: player_record.get_win_rate(), reverse=True):
+        low, high = record.get_confidence_interval()
+        print("{:<40} {:>6} {:>5} {:>6.1f}% {:>7.1f}% - {:>5.1f}% {:>7.2f}".format(
+            record.get_name(), record.get_games(), record.get_wins(), 100 * record.get_win_rate(), 100 * low,
+            100 * high, record.get_average_victory_points()))
+
+    print()
+    print("victory point distribution")
+    for record in records:
+        counts = record.get_victory_point_counts()
+        line = ", ".join(str(points) + ": " + str(counts[points]) for points in sorted(counts))
+        print("{:<40} {}".format(record.get_name(), line))
+
+    print()
+    if game_lengths:
+        draws = sum(1 for turns in game_lengths if turns > MAX_TURNS)
+        print("games: {}, average length: {:.1f} turns, unfinished: {}, time: {:.1f}s".format(
+            len(game_lengths), sum(game_lengths) / len(game_lengths), draws, elapsed_time))
+
+
+def main(argv=None):
+    """
+    Reads the tournament settings from the command line, runs the tournament and prints the results
+    """
+    parser = argparse.ArgumentParser(description="Run a tournament between computer players")
+    parser.add_argument("players", nargs="+",
+                        help="player configurations, such as random or mcts:time_budget=0.1,playout_rounds=3")
+    parser.add_argument("--games", type=int, default=8, help="games played at each table")
+    parser.add_argument("--format", choices=[ROUND_ROBIN, SWISS], default=ROUND_ROBIN, help="tournament format")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds of a Swiss tournament")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, one for each core by default")
+    parser.add_argument("--record", default=None, help="game record file every game is appended to")
+    parser.add_argument("--fair-boards", action="store_true",
+                        help="play every game on a board with the 6s and 8s apart and the resources spread out")
+    arguments = parser.parse_args(argv)
+
+    try:
+        for name in arguments.players:
+            parse_player_config(name)
+    except ValueError as error:
+        parser.error(str(error))
+
+    start_time = time.perf_counter()
+    records, game_lengths = run_tournament(arguments.players, arguments.games, arguments.format, arguments.rounds,
+                                           arguments.seed, arguments.workers, arguments.record,
+                                           arguments.fair_boards)
+    print_results(records, game_lengths, time.perf_counter() - start_time)
+
+
+if __name__ == '__main__':
+    main()
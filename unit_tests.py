@@ -1,12 +1,39 @@
 # Author: Joanna Getek
-# Last Modified: 01/03/2023
+# Last Modified: 10/18/2026
 # Description: Unit tests for catan project
 
 import unittest
+import random
+import os
+import tempfile
+import pickle
+import asyncio
+import numpy as np
 from global_vars import *
-from gameboard import GameBoard, HexTile, Location
+from gameboard import GameBoard, HexTile, Location, DICE_BUTTON
 from buttons import *
 from structures import *
+from game_state import GameState, Board, SETTLEMENT_COST
+from player import Player, ComputerPlayer
+from renderer import get_renderer, merge_rects, BOARD_LAYER, ROBBER_LAYER, TRANSPARENT
+from assets import AssetManager, get_assets, IMAGE_DIRECTORY
+from game_controller import GameController, ROLL_INPUT, ROBBER_INPUT, ACTION_INPUT, TRADE_INPUT, \
+    PLACE_SETTLEMENT_INPUT, PLACE_ROAD_INPUT
+from actions import *
+from batch_sim import BatchSimulator
+from opening_evaluator import OpeningEvaluator, choose_opening
+from board_generator import BoardGenerator, board_tiles
+from game_server import GameServer, MAX_OPEN_GAMES
+from game_client import GameClient, play_games, play_random_player
+from ai_players import RandomPlayer, MCTSPlayer, create_ai_player, AI_PLAYER_TYPES
+from search_state import SearchRules, PHASE, CURRENT_PLAYER, OPEN_MASK, PLAYERS_START, PLAYER_SIZE, VICTORY_POINTS, \
+    SETTLEMENT_MASK, PLAYER_ROAD_MASK, ROAD_END_MASK, BUILDABLE_ROAD_MASK, DICE_PROBABILITIES
+from tournament import parse_player_config, play_game, wilson_interval, run_tournament
+from game_record import GameRecord, GameRecordWriter, read_game_records, encode_varint, decode_varint
+from replay_corpus import ReplayCorpus, CorpusWriter, build_corpus
+from hit_test import HitTestIndex, VERTEX_TARGET, EDGE_TARGET, BUTTON_TARGET
+from road_network import LONGEST_ROAD_POINTS
+from board_topology import BoardTopology, get_topology, load_topology, NORTH, SOUTH, TOPOLOGY_CACHE_VERSION
 
 class CatanTester(unittest.TestCase):
     """Contains the unit tests for CatanTester"""
@@ -57,8 +84,1137 @@ class CatanTester(unittest.TestCase):
         self.assertEqual(city1.get_victory_points(), 2)
         self.assertEqual(city1.get_surrounding_tiles(), [])
 
+        # a computer player's city replaces its settlement, the same as in the GameState
+        game = GameBoard(4)
+        game.create_hex_tiles()
+        game.create_locations()
+        player_list = [ComputerPlayer("Player " + str(index), PLAYER_COLOUR_LIST[index - 1], RandomPlayer(index))
+                       for index in range(1, 5)]
+        for index, new_player in enumerate(player_list):
+            new_player.set_player_rect(RECT_PLAYER_POSITIONS[index])
+        game.set_player_list(player_list)
+        state = game.get_state()
+        while state.get_phase() != ROLL_PHASE:
+            player_list[state.get_current_player()].play_next_action(game)
+        vertex = state.get_player(0).get_settlements()[0]
+        state.set_current_player(0)
+        state.set_phase(BUILD_PHASE)
+        state.add_resource(0, "wheat", 2)
+        state.add_resource(0, "ore", 3)
+        self.assertTrue(player_list[0].play_action(game, (BUILD_CITY, vertex)))
+        self.assertEqual(len(player_list[0].get_player_settlements()), 1)
+        self.assertEqual([city.get_position() for city in player_list[0].get_player_cities()],
+                         [game.get_locations()[vertex].get_x_y_coords()])
+
+    def test5(self):
+        """Testing the Board topology and GameState settlement and road rules"""
+        board = Board()
+        self.assertEqual(19, board.get_number_of_tiles())
+        self.assertEqual(54, board.get_number_of_vertices())
+        self.assertEqual(72, board.get_number_of_edges())
+
+        state = GameState()
+        state.create_board()
+        player1 = state.add_player("Player 1")
+        state.add_player("Player 2")
+        self.assertEqual(state.get_robber_tile(), state.get_board().get_desert_tile())
+
+        vertex = state.get_board().get_tile_vertices(9)[0]
+        neighbour = state.get_board().get_vertex_neighbours(vertex)[0]
+        self.assertTrue(state.build_settlement(0, vertex, setup=True))
+        self.assertFalse(state.build_settlement(1, neighbour, setup=True))
+        self.assertEqual(player1.get_victory_points(), 1)
+
+        # roads have to be attached to the player's own settlement or road
+        edge = state.get_board().get_edge(vertex, neighbour)
+        self.assertFalse(state.build_road(1, edge, setup=True))
+        self.assertTrue(state.build_road(0, edge, setup=True))
+        self.assertIsNone(state.get_board().get_edge(vertex, vertex))
+
+        # after setup, settlements need resources and a road to attach to
+        far_vertex = [v for v in state.get_board().get_vertex_neighbours(neighbour) if v != vertex][0]
+        for resource, amount in SETTLEMENT_COST.items():
+            player1.add_resource(resource, amount)
+        self.assertFalse(state.build_settlement(0, far_vertex))
+        self.assertTrue(state.build_road(0, state.get_board().get_edge(neighbour, far_vertex), setup=True))
+        self.assertTrue(state.build_settlement(0, far_vertex))
+        self.assertEqual(player1.get_resources()["wheat"], 0)
+
+    def test6(self):
+        """Testing GameState resource collection, the robber, and bank trades"""
+        state = GameState()
+        state.create_board()
+        player1 = state.add_player("Player 1")
+        board = state.get_board()
+        tile = (board.get_desert_tile() + 1) % board.get_number_of_tiles()
+        number = board.get_tile_number(tile)
+        # picking a corner where no other tile has the same number
+        for vertex in board.get_tile_vertices(tile):
+            numbers = [board.get_tile_number(other) for other in board.get_vertex_tiles(vertex) if other != tile]
+            if number not in numbers:
+                break
+        state.build_settlement(0, vertex, setup=True)
+
+        resource = board.get_tile_type(tile)
+        payouts = state.collect_resources(number)
+        self.assertEqual([(0, resource, 1)], list(payouts))
+
+        # the robber stops the tile from producing
+        self.assertTrue(state.move_robber(tile))
+        self.assertFalse(state.move_robber(tile))
+        before = player1.get_resources()[resource]
+        self.assertEqual([], list(state.collect_resources(number)))
+        self.assertEqual(player1.get_resources()[resource], before)
+
+        hand = dict(player1.get_resources())
+        player1.add_resource("ore", 4)
+        self.assertFalse(state.bank_trade(0, "wheat", "ore"))
+        self.assertTrue(state.bank_trade(0, "ore", "wool"))
+        self.assertEqual(player1.get_resources()["ore"], hand["ore"])
+        self.assertEqual(player1.get_resources()["wool"], hand["wool"] + 1)
+
+    def test7(self):
+        """Testing the action interface by playing random games from setup until a player wins"""
+        for game_number in range(3):
+            state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"])
+            self.assertFalse(apply(state, (ROLL_DICE,)))
+            self.assertEqual(state.get_phase(), SETUP_SETTLEMENT_PHASE)
+
+            while not is_terminal(state):
+                actions = legal_actions(state)
+                self.assertTrue(apply(state, random.choice(actions)))
+                if state.get_turn_number() == 1 and state.get_phase() == ROLL_PHASE:
+                    for player in state.get_players():
+                        self.assertEqual(len(player.get_settlements()), 2)
+                        self.assertEqual(len(player.get_roads()), 2)
+
+            self.assertEqual(legal_actions(state), [])
+            self.assertGreaterEqual(state.get_winner().get_victory_points(), 10)
+
+        # actions with a vertex, edge, tile or resource the board does not have are turned away without a change
+        state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], 7)
+        for action in [(BUILD_SETTLEMENT, -1), (BUILD_SETTLEMENT, 54), (BUILD_SETTLEMENT,), (BUILD_ROAD, 72)]:
+            self.assertFalse(apply(state, action))
+        self.assertTrue(apply(state, legal_actions(state)[0]))
+        hash_before = state.get_hash()
+        for action in [(BUILD_ROAD, -1), (BUILD_ROAD, 999)]:
+            self.assertFalse(apply(state, action))
+        state.set_phase(ROBBER_PHASE)
+        robber_tile = state.get_robber_tile()
+        self.assertFalse(apply(state, (MOVE_ROBBER, 99)))
+        self.assertEqual(state.get_robber_tile(), robber_tile)
+        state.set_phase(BUILD_PHASE)
+        self.assertFalse(apply(state, (BANK_TRADE, "gold", "wool")))
+        self.assertFalse(apply(state, (BUILD_CITY, 60)))
+        state.set_phase(SETUP_ROAD_PHASE)
+        self.assertEqual(state.get_hash(), hash_before)
+
+    def test8(self):
+        """Testing the BatchSimulator pays out the same resources as the GameState"""
+        states = []
+        for game_number in range(20):
+            state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"])
+            while state.get_turn_number() < 30 and not is_terminal(state):
+                apply(state, random.choice(legal_actions(state)))
+            states.append(state)
+
+        batch = BatchSimulator.from_states(states, seed=1)
+        dice_rolls = batch.roll_dice()
+        batch.collect_resources(dice_rolls)
+        for game_number, state in enumerate(states):
+            state.collect_resources(int(dice_rolls[game_number]))
+            for player in state.get_players():
+                hand = [player.get_resources()[resource] for resource in ["wheat", "brick", "wood", "wool", "ore"]]
+                self.assertEqual(hand, batch.get_resources()[game_number, player.get_index()].tolist())
+            self.assertEqual(batch.get_victory_points()[game_number].tolist(),
+                             [player.get_victory_points() for player in state.get_players()])
+
+        batch = BatchSimulator(100, seed=2)
+        batch.create_boards()
+        batch.place_random_settlements()
+        self.assertTrue((batch.get_victory_points() == 2).all())
+        batch.run(50)
+        self.assertGreater(batch.get_resources().sum(), 0)
+        self.assertTrue(((batch.get_robber() >= 0) & (batch.get_robber() < 19)).all())
+
+    def test9(self):
+        """Testing the roll payouts index matches a search of every building and tile"""
+        state = new_game(["Player 1", "Player 2", "Player 3"])
+        board = state.get_board()
+        while not is_terminal(state):
+            apply(state, random.choice(legal_actions(state)))
+            for number in range(2, 13):
+                expected = []
+                for vertex in range(board.get_number_of_vertices()):
+                    owner = state.get_vertex_owner(vertex)
+                    for tile in board.get_vertex_tiles(vertex):
+                        if owner is not None and board.get_tile_number(tile) == number and \
+                                tile != state.get_robber_tile():
+                            expected.append((owner, board.get_tile_type(tile), 2 if state.is_city(vertex) else 1))
+                self.assertEqual(sorted(expected), sorted(state.get_roll_payouts(number)))
+
+    def test10(self):
+        """Testing the BoardTopology tables built from axial hex coordinates"""
+        topology = get_topology()
+        self.assertIs(topology, get_topology())
+        self.assertIs(topology, GameState().get_board().get_topology())
+        self.assertEqual((19, 54, 72), (topology.get_number_of_tiles(), topology.get_number_of_vertices(),
+                                        topology.get_number_of_edges()))
+
+        center_tile = topology.get_tile(0, 0)
+        self.assertEqual(center_tile, 9)
+        self.assertEqual(len(topology.get_tile_neighbours(center_tile)), 6)
+        self.assertIsNone(topology.get_tile(3, 0))
+
+        top_vertex = topology.get_vertex(0, 0, NORTH)
+        self.assertEqual(topology.get_tile_vertices(center_tile)[0], top_vertex)
+        self.assertEqual(len(topology.get_vertex_tiles(top_vertex)), 3)
+        for vertex in range(topology.get_number_of_vertices()):
+            self.assertIn(len(topology.get_vertex_neighbours(vertex)), (2, 3))
+            for neighbour in topology.get_vertex_neighbours(vertex):
+                edge = topology.get_edge(vertex, neighbour)
+                self.assertIn(edge, topology.get_vertex_edges(vertex))
+                self.assertEqual(set(topology.get_edge_vertices(edge)), {vertex, neighbour})
+
+        # a board with one ring of tiles around the center tile
+        small_topology = BoardTopology(1)
+        self.assertEqual((7, 24, 30), (small_topology.get_number_of_tiles(), small_topology.get_number_of_vertices(),
+                                       small_topology.get_number_of_edges()))
+        self.assertIsNotNone(small_topology.get_vertex(0, 0, SOUTH))
+
+    def test11(self):
+        """Testing the BoardTopology cache file and the shared board geometry"""
+        topology = BoardTopology()
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "topology.cache")
+            self.assertIsNone(load_topology(cache_path))
+            topology.save(cache_path)
+
+            loaded = load_topology(cache_path)
+            self.assertEqual(loaded.get_tables(), topology.get_tables())
+            self.assertEqual(loaded.get_edge(0, 1), topology.get_edge(0, 1))
+            self.assertEqual(loaded.get_vertex(0, 0, NORTH), topology.get_vertex(0, 0, NORTH))
+            self.assertIsNone(load_topology(cache_path, radius=3))
+
+            with open(cache_path, "wb") as cache_file:
+                cache_file.write(b"not a topology")
+            self.assertIsNone(load_topology(cache_path))
+
+            with open(cache_path, "wb") as cache_file:
+                pickle.dump({"version": TOPOLOGY_CACHE_VERSION, "radius": topology.get_radius()}, cache_file)
+            self.assertIsNone(load_topology(cache_path))
+
+        # every GameBoard shares the same pixel positions and only shuffles the tiles
+        game1 = GameBoard()
+        game2 = GameBoard()
+        game1.create_hex_tiles()
+        game2.create_hex_tiles()
+        self.assertIs(game1.get_hex_tiles()[0].get_coordinates(), game2.get_hex_tiles()[0].get_coordinates())
+        game1.create_locations()
+        self.assertIs(game1.get_location((373, 250)), game1.get_locations()[topology.get_vertex(0, -1, SOUTH)])
+        self.assertIsNone(game1.get_location((0, 0)))
+
+    def test12(self):
+        """Testing that a copied GameState is independent of the original and shares the board"""
+        random.seed(12)
+        state = new_game(["p1", "p2", "p3"])
+        while state.get_phase() in (SETUP_SETTLEMENT_PHASE, SETUP_ROAD_PHASE):
+            apply(state, random.choice(legal_actions(state)))
+
+        copy = state.copy()
+        self.assertIs(copy.get_board(), state.get_board())
+        self.assertEqual(legal_actions(copy), legal_actions(state))
+        self.assertEqual(copy.get_player(1).get_settlements(), state.get_player(1).get_settlements())
+        self.assertFalse(hasattr(copy, "__dict__"))
+
+        # playing on the copy does not change the original
+        resources = list(state.get_resource_counts())
+        roads = state.get_player(0).get_roads()
+        copy.get_player(0).add_resource("brick", 5)
+        copy.get_player(0).add_resource("wood", 5)
+        apply(copy, (ROLL_DICE,))
+        if copy.get_phase() == ROBBER_PHASE:
+            apply(copy, legal_actions(copy)[0])
+        road_actions = [action for action in legal_actions(copy) if action[0] == BUILD_ROAD]
+        self.assertTrue(apply(copy, road_actions[0]))
+        self.assertEqual(state.get_resource_counts(), resources)
+        self.assertEqual(state.get_player(0).get_roads(), roads)
+        self.assertIsNone(state.get_edge_owner(road_actions[0][1]))
+        self.assertEqual(copy.get_edge_owner(road_actions[0][1]), 0)
+        self.assertEqual(state.get_phase(), ROLL_PHASE)
+
+    def test13(self):
+        """Testing that the incrementally updated Zobrist hash matches the hash calculated from scratch"""
+        random.seed(13)
+        state = new_game(["p1", "p2", "p3", "p4"])
+        hashes = set()
+        while not is_terminal(state) and state.get_turn_number() < 200:
+            self.assertTrue(apply(state, random.choice(legal_actions(state))))
+            self.assertEqual(state.get_hash(), state.compute_hash())
+            hashes.add(state.get_hash())
+        self.assertGreater(len(hashes), 100)
+        self.assertEqual(state.copy().get_hash(), state.get_hash())
+
+        # reaching the same position in a different order gives the same hash
+        first = state.copy()
+        second = state.copy()
+        first.add_resource(0, "wheat", 2)
+        first.add_resource(0, "ore", 1)
+        second.add_resource(0, "ore", 1)
+        second.add_resource(0, "wheat", 2)
+        self.assertEqual(first.get_hash(), second.get_hash())
+        second.add_resource(0, "wheat", -1)
+        self.assertNotEqual(first.get_hash(), second.get_hash())
+
+        # the same buildings on a different board hash differently
+        random.seed(13)
+        other = new_game(["p1", "p2", "p3", "p4"])
+        random.seed(14)
+        different = new_game(["p1", "p2", "p3", "p4"])
+        self.assertNotEqual(other.get_hash(), different.get_hash())
+
+    def test14(self):
+        """Testing the random and MCTS computer players"""
+        random.seed(14)
+        state = new_game(["p1", "p2", "p3", "p4"])
+        random_player = RandomPlayer(seed=14)
+        while state.get_phase() != BUILD_PHASE:
+            action = random_player.choose_action(state)
+            self.assertIn(action, legal_actions(state))
+            apply(state, action)
+
+        # the current player wins straight away by upgrading a settlement to a city
+        player_index = state.get_current_player()
+        state.add_victory_points(player_index, WINNING_VICTORY_POINTS - 1 - state.get_victory_points(player_index))
+        state.add_resource(player_index, "wheat", 2)
+        state.add_resource(player_index, "ore", 3)
+        state_hash = state.get_hash()
+
+        mcts_player = MCTSPlayer(time_budget=None, iterations=300, seed=14)
+        action = mcts_player.choose_action(state)
+        self.assertEqual(action[0], BUILD_CITY)
+        self.assertEqual(mcts_player.get_last_iterations(), 300)
+        self.assertEqual(state.get_hash(), state_hash)
+
+        self.assertIsInstance(create_ai_player("mcts", time_budget=0.01), MCTSPlayer)
+        self.assertIsNone(create_ai_player("human"))
+
+    def test15(self):
+        """Testing the tournament runner"""
+        self.assertEqual(parse_player_config("mcts:time_budget=0.5,iterations=None,playout_rounds=3"),
+                         ("mcts", {"time_budget": 0.5, "iterations": None, "playout_rounds": 3}))
+        self.assertEqual(parse_player_config("random"), ("random", {}))
+        self.assertRaises(ValueError, parse_player_config, "alphazero")
+        self.assertRaises(ValueError, parse_player_config, "mcts:foo=1")
+        self.assertRaises(ValueError, parse_player_config, "random:iterations=10")
+        self.assertEqual(parse_player_config("mcts:evaluate_openings=False,seed=7"),
+                         ("mcts", {"evaluate_openings": False, "seed": 7}))
+        self.assertEqual(parse_player_config("random:evaluate_openings=true"), ("random", {"evaluate_openings": True}))
+
+        low, high = wilson_interval(5, 10)
+        self.assertLess(low, 0.5)
+        self.assertGreater(high, 0.5)
+        self.assertAlmostEqual(0.5 - low, high - 0.5)
+        self.assertEqual(wilson_interval(0, 10)[0], 0.0)
+
+        # a game is decided by its seed
+        task = (3, [("random", {})] * 4, False, None)
+        self.assertEqual(play_game(task), play_game(task))
+        # a seed in the options is combined with each game's seed, so it does not make every game the same
+        seeded = [play_game((game_seed, [("random", {"seed": 7})] * 4, True, None))["record"]
+                  for game_seed in (3, 3, 4)]
+        self.assertEqual(seeded[0], seeded[1])
+        self.assertNotEqual(seeded[0], seeded[2])
+        self.assertNotEqual(seeded[0], play_game((3, [("random", {})] * 4, True, None))["record"])
+
+        # a player that chooses an illegal action stops its game instead of leaving a record that can not be replayed
+        class IllegalPlayer(RandomPlayer):
+            def choose_action(self, state):
+                return (END_TURN,)
+
+        AI_PLAYER_TYPES["illegal"] = IllegalPlayer
+        try:
+            self.assertRaises(ValueError, play_game, (3, [("random", {})] * 3 + [("illegal", {})], True, None))
+        finally:
+            del AI_PLAYER_TYPES["illegal"]
+
+        records, game_lengths = run_tournament(["random", "random", "random"], 4, workers=2)
+        self.assertEqual(len(game_lengths), 4)
+        self.assertEqual([record.get_name() for record in records], ["random", "random (2)", "random (3)"])
+        self.assertEqual(sum(record.get_games() for record in records), 16)
+        self.assertEqual(sum(record.get_wins() for record in records), 4)
+
+    def test16(self):
+        """Testing that a game is reproduced exactly from its seed and actions"""
+        def play(seed, actions_to_play):
+            state = new_game(["p1", "p2", "p3", "p4"], seed)
+            player = RandomPlayer(seed)
+            for action_number in range(actions_to_play):
+                if is_terminal(state):
+                    break
+                apply(state, player.choose_action(state))
+            return state
+
+        first = play(21, 600)
+        second = play(21, 600)
+        self.assertEqual(first.get_hash(), second.get_hash())
+        self.assertEqual(first.get_resource_counts(), second.get_resource_counts())
+        self.assertEqual(first.get_seed(), 21)
+
+        # the board and dice are separate streams, so rolling the dice does not change the next board
+        board_types = [first.get_board().get_tile_type(tile) for tile in range(19)]
+        self.assertEqual(board_types, [play(21, 0).get_board().get_tile_type(tile) for tile in range(19)])
+        self.assertNotEqual(board_types, [play(22, 0).get_board().get_tile_type(tile) for tile in range(19)])
+
+        # a copy rolls the same dice as the original without moving the original's dice, unless it shares them
+        copy = first.copy()
+        self.assertIsNot(copy.get_dice_random(), first.get_dice_random())
+        copy_rolls = [copy.roll_dice() for roll in range(10)]
+        self.assertEqual(copy_rolls, [first.roll_dice() for roll in range(10)])
+        self.assertIs(first.copy(share_dice=True).get_dice_random(), first.get_dice_random())
+        own_dice = random.Random(5)
+        copy = first.copy(own_dice)
+        self.assertIs(copy.get_dice_random(), own_dice)
+
+    def test17(self):
+        """Testing that recorded games are written, read back and replayed exactly"""
+        buffer = bytearray()
+        for value in [0, 1, 127, 128, 300, 2 ** 63]:
+            encode_varint(value, buffer)
+        position = 0
+        for value in [0, 1, 127, 128, 300, 2 ** 63]:
+            decoded, position = decode_varint(buffer, position)
+            self.assertEqual(decoded, value)
+
+        with tempfile.TemporaryDirectory() as directory:
+            record_path = os.path.join(directory, "games.rec")
+            final_states = []
+            with GameRecordWriter(record_path) as writer:
+                for seed in range(3):
+                    state = new_game(["p1", "p2", "p3", "p4"], seed)
+                    player = RandomPlayer(seed)
+                    record = GameRecord.from_state(state)
+                    while not is_terminal(state) and state.get_turn_number() < 400:
+                        action = player.choose_action(state)
+                        apply(state, action)
+                        record.add_action(action, state)
+                    record.set_result(state)
+                    writer.write_game(record)
+                    final_states.append(state)
+
+            # a second writer adds to the end of the same file
+            with GameRecordWriter(record_path) as writer:
+                writer.write_game(GameRecord.from_state(new_game(["p1", "p2"], 10)))
+
+            records = list(read_game_records(record_path))
+            self.assertEqual(len(records), 4)
+            for record, state in zip(records, final_states):
+                winner = state.get_winner()
+                self.assertEqual(record.get_winner(), winner.get_index() if winner is not None else None)
+                self.assertEqual(record.get_turns(), state.get_turn_number())
+                for action, replayed in record.replay():
+                    pass
+                self.assertEqual(replayed.get_hash(), state.get_hash())
+                # about one byte for each action
+                self.assertLess(record.get_number_of_action_bytes(), 2 * state.get_turn_number() * 4)
+
+            self.assertEqual(records[3].get_number_of_players(), 2)
+            self.assertEqual(records[3].get_seed(), 10)
+            headers = list(read_game_records(record_path, header_only=True))
+            self.assertEqual(headers[1].get_number_of_action_bytes(), 0)
+            self.assertEqual(headers[1].get_tile_types(), records[1].get_tile_types())
+
+            with open(record_path, "r+b") as record_file:
+                record_file.write(b"JUNK")
+            self.assertRaises(ValueError, list, read_game_records(record_path))
+
+    def test18(self):
+        """Testing random access to games in a memory mapped corpus"""
+        with tempfile.TemporaryDirectory() as directory:
+            record_path = os.path.join(directory, "games.rec")
+            corpus_path = os.path.join(directory, "games.corpus")
+            hashes = []
+            with GameRecordWriter(record_path) as writer:
+                for seed in range(5):
+                    state = new_game(["p1", "p2", "p3", "p4"], seed)
+                    player = RandomPlayer(seed)
+                    record = GameRecord.from_state(state)
+                    for action_number in range(300):
+                        action = player.choose_action(state)
+                        apply(state, action)
+                        record.add_action(action, state)
+                    record.set_result(state)
+                    writer.write_game(record)
+                    hashes.append(state.get_hash())
+            self.assertEqual(build_corpus(record_path, corpus_path), 5)
+
+            with ReplayCorpus(corpus_path) as corpus:
+                self.assertEqual(len(corpus), 5)
+                # reading the games out of order
+                for game in [3, 0, 4, -4]:
+                    for action, state in corpus[game].replay():
+                        pass
+                    self.assertEqual(state.get_hash(), hashes[game])
+                self.assertRaises(IndexError, corpus.get_game_bytes, 5)
+
+                seeds = [header.get_seed() for header in corpus.iter_headers()]
+                self.assertEqual(seeds, [0, 1, 2, 3, 4])
+                desert_in_center = corpus.filter_games(lambda header: header.get_tile_types()[9] == DESERT)
+                self.assertEqual(desert_in_center,
+                                 [game for game in range(5) if corpus[game].get_tile_types()[9] == DESERT])
+
+            # an empty corpus
+            with CorpusWriter(corpus_path) as writer:
+                pass
+            with ReplayCorpus(corpus_path) as corpus:
+                self.assertEqual(len(corpus), 0)
+
+            with open(corpus_path, "wb") as corpus_file:
+                corpus_file.write(b"CTNC" + bytes(30))
+            self.assertRaises(ValueError, ReplayCorpus, corpus_path)
+
+
+
+    def test19(self):
+        """Testing that game snapshots are restored exactly and carry on with the same dice"""
+        state = new_game(["p1", "p2", "p3", "p4"], 19)
+        player = RandomPlayer(19)
+        for action_number in range(400):
+            apply(state, player.choose_action(state))
+
+        snapshot = state.to_bytes()
+        saved = GameState.from_bytes(snapshot)
+        self.assertEqual(saved.get_hash(), state.get_hash())
+        self.assertEqual(saved.get_hash(), saved.compute_hash())
+        self.assertEqual(saved.to_bytes(), snapshot)
+        self.assertEqual(saved.get_seed(), 19)
+        self.assertEqual(saved.get_player_names(), state.get_player_names())
+        self.assertEqual(saved.get_resource_counts(), state.get_resource_counts())
+        self.assertEqual(legal_actions(saved), legal_actions(state))
+
+        # with the dice generator saved, both games roll the same dice from here on
+        restored = GameState.from_bytes(state.to_bytes(include_random=True))
+        for action_number in range(200):
+            action = player.choose_action(state)
+            apply(state, action)
+            apply(restored, action)
+        self.assertEqual(restored.get_hash(), state.get_hash())
+
+        self.assertRaises(ValueError, GameState.from_bytes, b"")
+        self.assertRaises(ValueError, GameState.from_bytes, b"CTNR" + snapshot[4:])
+        self.assertRaises(ValueError, GameState.from_bytes, snapshot[:-3])
+        self.assertRaises(ValueError, GameState.from_bytes, snapshot + b"0")
+        # a phase or robber tile out of range is reported as a damaged snapshot
+        for offset in (6, 11):
+            damaged = bytearray(snapshot)
+            damaged[offset] = 200
+            self.assertRaises(ValueError, GameState.from_bytes, bytes(damaged))
+        # so is a last settlement or longest road player out of range, offsets 9 and 17, or a settlement past the last
+        # vertex, the top bit of the first player's settlement mask at offset 74
+        for offset, value in ((9, 200), (17, 9), (74, snapshot[74] | 0x80)):
+            damaged = bytearray(snapshot)
+            damaged[offset] = value
+            self.assertRaises(ValueError, GameState.from_bytes, bytes(damaged))
+
+        # a GameBoard loaded from a snapshot rebuilds its tiles, locations and the players' structures
+        game = GameBoard()
+        player_list = [Player("Player " + str(index), PLAYER_COLOUR_LIST[index - 1]) for index in range(1, 5)]
+        game.load_snapshot(snapshot, player_list)
+        self.assertEqual(len(game.get_hex_tiles()), 19)
+        self.assertEqual(game.get_robber_tile().get_tile_id(), saved.get_robber_tile())
+        self.assertEqual(game.get_state().get_hash(), saved.get_hash())
+        for index, restored_player in enumerate(player_list):
+            self.assertEqual(restored_player.get_player_index(), index)
+            self.assertEqual(len(restored_player.get_player_settlements()), len(saved.get_player(index).get_settlements()))
+            self.assertEqual(len(restored_player.get_player_roads()), len(saved.get_player(index).get_roads()))
+
+        # a game saved with a different number of players is turned away before anything is changed
+        two_player_snapshot = new_game(["Player 1", "Player 2"], 19).to_bytes()
+        self.assertRaises(ValueError, game.load_snapshot, two_player_snapshot, player_list)
+        self.assertEqual(game.get_state().get_hash(), saved.get_hash())
+        self.assertEqual(player_list[0].get_player_index(), 0)
+
+    def test20(self):
+        """Testing that the renderer only updates the parts of the screen that were drawn on"""
+        merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10), pygame.Rect(100, 100, 5, 5)])
+        self.assertEqual(merged, [pygame.Rect(0, 0, 15, 15), pygame.Rect(100, 100, 5, 5)])
+        many_rects = [pygame.Rect(index * 20, 0, 5, 5) for index in range(30)]
+        self.assertEqual(merge_rects(many_rects, 24), [pygame.Rect(0, 0, 585, 5)])
+
+        renderer = get_renderer()
+        renderer.clear()
+        self.assertEqual(renderer.present(), [screen.get_rect()])
+        self.assertEqual(renderer.present(), [])
+
+        # drawing off the screen leaves nothing to update
+        renderer.draw_rect(BOARD_LAYER, RED, pygame.Rect(-50, -50, 10, 10))
+        self.assertEqual(renderer.present(), [])
+
+        settlement = Settlement((300, 300), BLUE)
+        settlement.draw_settlement()
+        self.assertEqual(renderer.present(), [pygame.Rect(290, 280, 21, 31)])
+        self.assertEqual(screen.get_at((300, 300))[:3], BLUE)
+
+        # clearing part of a layer above the board shows the layers underneath again
+        robber = pygame.Surface((20, 20))
+        robber.fill(BLACK)
+        robber_rect = renderer.blit(ROBBER_LAYER, robber, (295, 295))
+        renderer.present()
+        self.assertEqual(screen.get_at((300, 300))[:3], BLACK)
+        renderer.clear_rect(ROBBER_LAYER, robber_rect)
+        self.assertEqual(renderer.present(), [robber_rect])
+        self.assertEqual(renderer.get_layer(ROBBER_LAYER).get_at((300, 300)), TRANSPARENT)
+        self.assertEqual(screen.get_at((300, 300))[:3], BLUE)
+        renderer.clear()
+
+    def test21(self):
+        """Testing that images are loaded once and rendered text is cached"""
+        assets = get_assets()
+        self.assertIs(get_assets(), assets)
+        for file_name in os.listdir(IMAGE_DIRECTORY):
+            self.assertIn(os.path.splitext(file_name)[0], assets.get_image_names())
+        self.assertIs(assets.get_image("dice7"), assets.get_image("dice7"))
+        self.assertEqual(assets.get_image("dice7").get_size(), (150, 76))
+        self.assertRaises(KeyError, assets.get_image, "dice13")
+
+        # the least recently used text is dropped once the cache is full
+        small_cache = AssetManager(text_cache_size=2)
+        first = small_cache.render_text("VP: 1")
+        self.assertIs(small_cache.render_text("VP: 1"), first)
+        small_cache.render_text("VP: 2")
+        small_cache.render_text("VP: 1")
+        small_cache.render_text("VP: 1", SMALL_FONT)
+        self.assertEqual(small_cache.get_text_cache_size(), 2)
+        self.assertEqual((small_cache.get_text_cache_hits(), small_cache.get_text_cache_misses()), (2, 3))
+        self.assertIs(small_cache.render_text("VP: 1"), first)
+        self.assertIsNot(small_cache.render_text("VP: 1", GAME_FONT, RED), first)
+
+        # moving the robber only clears and redraws the robber layer
+        renderer = get_renderer()
+        game = GameBoard(21)
+        game.create_hex_tiles()
+        game.update_robber_position()
+        old_robber = game.get_robber_tile()
+        renderer.present()
+        new_robber = game.get_hex_tiles()[(old_robber.get_tile_id() + 1) % 19]
+        old_center = old_robber.get_center_coords()
+        game.set_robber_tile(new_robber)
+        game.update_robber_position()
+        self.assertEqual(len(renderer.get_dirty_rects()), 2)
+        renderer.present()
+        self.assertEqual(renderer.get_layer(ROBBER_LAYER).get_at(old_center), TRANSPARENT)
+        self.assertNotEqual(renderer.get_layer(ROBBER_LAYER).get_at(new_robber.get_center_coords()), TRANSPARENT)
+        renderer.clear()
+
+    def test22(self):
+        """Testing that the static board is drawn once and then redrawn with a single blit"""
+        renderer = get_renderer()
+        game = GameBoard(22)
+        game.create_hex_tiles()
+        game.create_locations()
+        game.create_buttons()
+        game.draw_gameboard()
+        board_surface = game.get_board_surface()
+        self.assertEqual(board_surface.get_size(), screen.get_size())
+
+        for hex_tile in game.get_hex_tiles():
+            corner = hex_tile.get_coordinates()[0]
+            colour = TILE_COLOURS[hex_tile.get_type()]
+            self.assertEqual(board_surface.get_at((corner[0], corner[1] + 5))[:3], colour)
+        self.assertEqual(board_surface.get_at((5, 590))[:3], LIGHT_BLUE)
+
+        # drawing the board again reuses the same surface
+        renderer.present()
+        game.draw_gameboard()
+        self.assertIs(game.get_board_surface(), board_surface)
+        self.assertEqual(renderer.get_dirty_rects()[0], screen.get_rect())
+
+        # loading a saved game gets a new surface for its board
+        game.load_snapshot(new_game(["Player 1", "Player 2"], 2).to_bytes(),
+                           [Player("Player 1", PLAYER_COLOUR_LIST[0]), Player("Player 2", PLAYER_COLOUR_LIST[1])])
+        self.assertIsNot(game.get_board_surface(), board_surface)
+        renderer.clear()
+
+    def test23(self):
+        """Testing that the game controller plays a turn from mouse events without waiting in a loop"""
+        state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], 23)
+        player = RandomPlayer(23)
+        while state.get_phase() != ROLL_PHASE:
+            apply(state, player.choose_action(state))
+        state.add_resource(0, "wheat", 4)
+
+        game = GameBoard()
+        player_list = [Player("Player " + str(index), PLAYER_COLOUR_LIST[index - 1]) for index in range(1, 5)]
+        for index, new_player in enumerate(player_list):
+            new_player.set_player_rect(RECT_PLAYER_POSITIONS[index])
+        game.load_snapshot(state.to_bytes(include_random=True), player_list)
+        game.create_buttons()
+        with tempfile.TemporaryDirectory() as directory:
+            save_path = os.path.join(directory, "game.snapshot")
+            controller = GameController(game, save_path)
+            controller.start_turn()
+            self.assertEqual(controller.get_input_state(), ROLL_INPUT)
+
+            def click(position):
+                controller.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=position, button=1))
+
+            # clicking away from the dice does nothing
+            click((10, 10))
+            self.assertEqual(controller.get_input_state(), ROLL_INPUT)
+            click(game.get_dice().get_rect().center)
+            self.assertIn(controller.get_input_state(), [ROBBER_INPUT, ACTION_INPUT])
+            if controller.get_input_state() == ROBBER_INPUT:
+                hex_tile = game.get_hex_tiles()[(game.get_state().get_robber_tile() + 1) % 19]
+                click(hex_tile.get_center_coords())
+                self.assertEqual(game.get_state().get_robber_tile(), hex_tile.get_tile_id())
+            self.assertEqual(controller.get_input_state(), ACTION_INPUT)
+
+            wheat = game.get_state().get_resource(0, "wheat")
+            brick = game.get_state().get_resource(0, "brick")
+            click(game.get_trade_buttons()["wheat"].get_shape().center)
+            self.assertEqual(controller.get_input_state(), TRADE_INPUT)
+            click(game.get_trade_buttons()["brick"].get_shape().center)
+            self.assertEqual(controller.get_input_state(), ACTION_INPUT)
+            self.assertEqual(game.get_state().get_resource(0, "wheat"), wheat - 4)
+            self.assertEqual(game.get_state().get_resource(0, "brick"), brick + 1)
+
+            click(game.get_build_buttons()["end_turn"].get_shape().center)
+            self.assertEqual(game.get_state().get_current_player(), 1)
+            self.assertEqual(controller.get_input_state(), ROLL_INPUT)
+            with open(save_path, "rb") as save_file:
+                self.assertEqual(GameState.from_bytes(save_file.read()).get_hash(), game.get_state().get_hash())
+        get_renderer().clear()
+
+    def test24(self):
+        """Testing that settlements and roads are placed from single clicks, during the setup and during a turn"""
+        game = GameBoard(24)
+        game.create_hex_tiles()
+        game.create_locations()
+        game.create_buttons()
+        player_list = [Player("Player " + str(index), PLAYER_COLOUR_LIST[index - 1]) for index in range(1, 5)]
+        for index, new_player in enumerate(player_list):
+            new_player.set_player_rect(RECT_PLAYER_POSITIONS[index])
+        game.set_player_list(player_list)
+        controller = GameController(game)
+        controller.start_turn()
+        self.assertEqual(controller.get_input_state(), PLACE_SETTLEMENT_INPUT)
+
+        def click(position):
+            controller.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=position, button=1))
+
+        # a click away from every location keeps waiting for the settlement
+        click((5, 5))
+        self.assertEqual(controller.get_input_state(), PLACE_SETTLEMENT_INPUT)
+        self.assertEqual(game.get_state().get_phase(), SETUP_SETTLEMENT_PHASE)
+        click(game.get_locations()[0].get_x_y_coords())
+        self.assertEqual(controller.get_input_state(), PLACE_ROAD_INPUT)
+        self.assertEqual(game.get_state().get_vertex_owner(0), 0)
+
+        edge = [action[1] for action in legal_actions(game.get_state()) if action[0] == BUILD_ROAD][0]
+        first, second = game.get_state().get_board().get_edge_vertices(edge)
+        (x1, y1) = game.get_locations()[first].get_x_y_coords()
+        (x2, y2) = game.get_locations()[second].get_x_y_coords()
+        click(((x1 + x2) // 2, (y1 + y2) // 2))
+        self.assertEqual(game.get_state().get_current_player(), 1)
+        self.assertEqual(controller.get_input_state(), PLACE_SETTLEMENT_INPUT)
+
+        # finish the setup and give the next player the resources for a road
+        random_player = RandomPlayer(24)
+        while game.get_state().get_phase() != ROLL_PHASE:
+            apply(game.get_state(), random_player.choose_action(game.get_state()))
+        apply(game.get_state(), (ROLL_DICE,))
+        if game.get_state().get_phase() == ROBBER_PHASE:
+            apply(game.get_state(), (MOVE_ROBBER, (game.get_state().get_robber_tile() + 1) % 19))
+        current = game.get_state().get_current_player()
+        game.get_state().add_resource(current, "brick", 1)
+        game.get_state().add_resource(current, "wood", 1)
+        controller.start_actions()
+
+        # a click away from the board after choosing to build a road puts it back
+        click(game.get_build_buttons()["road_button"].get_shape().center)
+        self.assertEqual(controller.get_input_state(), PLACE_ROAD_INPUT)
+        click((5, 5))
+        self.assertEqual(controller.get_input_state(), ACTION_INPUT)
+        self.assertEqual(game.get_state().get_resource(current, "brick"), 1)
+        get_renderer().clear()
+
+    def test25(self):
+        """Testing that clicks are found on the nearest location, edge, tile and button through the hit test index"""
+        game = GameBoard(25)
+        game.create_hex_tiles()
+        game.create_locations()
+        game.create_buttons()
+        board = game.get_state().get_board()
+
+        for location in game.get_locations():
+            x_coord, y_coord = location.get_x_y_coords()
+            self.assertIs(game.find_location((x_coord + 3, y_coord - 3)), location)
+        self.assertIsNone(game.find_location((5, 5)))
+
+        for edge in range(board.get_number_of_edges()):
+            vertex1, vertex2 = board.get_edge_vertices(edge)
+            (x1, y1) = game.get_locations()[vertex1].get_x_y_coords()
+            (x2, y2) = game.get_locations()[vertex2].get_x_y_coords()
+            # a click a quarter of the way along the edge is still nearest its midpoint
+            self.assertEqual(game.find_edge(((3 * x1 + x2) // 4, (3 * y1 + y2) // 4)), edge)
+
+        for hex_tile in game.get_hex_tiles():
+            x_coord, y_coord = hex_tile.get_center_coords()
+            self.assertIs(game.find_hex_tile((x_coord + 20, y_coord + 20)), hex_tile)
+        self.assertIsNone(game.find_hex_tile((5, 5)))
+
+        self.assertEqual(game.find_button(game.get_dice().get_rect().center), DICE_BUTTON)
+        for name, button in game.get_trade_buttons().items():
+            self.assertEqual(game.find_button(button.get_shape().center), name)
+        self.assertEqual(game.find_button(game.get_build_buttons()["end_turn"].get_shape().topleft), "end_turn")
+        self.assertIsNone(game.find_button((5, 5)))
+
+        # a target reaching into several cells is found from each of them
+        index = HitTestIndex(10)
+        index.add_point(VERTEX_TARGET, "a", (50, 50), 15)
+        index.add_point(VERTEX_TARGET, "b", (70, 50), 15)
+        self.assertEqual(index.find_point(VERTEX_TARGET, (38, 50)), "a")
+        self.assertEqual(index.find_point(VERTEX_TARGET, (61, 50)), "b")
+        self.assertIsNone(index.find_point(EDGE_TARGET, (50, 50)))
+        index.add_rect(BUTTON_TARGET, "button", pygame.Rect(0, 0, 25, 25))
+        self.assertEqual(index.find_rect(BUTTON_TARGET, (24, 24)), "button")
+        self.assertIsNone(index.find_rect(BUTTON_TARGET, (25, 25)))
+        get_renderer().clear()
+
+    def test26(self):
+        """Testing that the legal settlement and road placements kept up to date on every build match the
+        placements found by searching the whole board"""
+        for seed in range(5):
+            state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], seed)
+            player = RandomPlayer(seed)
+            board = state.get_board()
+            for move in range(400):
+                if is_terminal(state):
+                    break
+                for player_index in range(state.get_number_of_players()):
+                    for setup in (True, False):
+                        vertices = [vertex for vertex in range(board.get_number_of_vertices())
+                                    if state.get_vertex_owner(vertex) is None and
+                                    all(state.get_vertex_owner(neighbour) is None
+                                        for neighbour in board.get_vertex_neighbours(vertex)) and
+                                    (setup or any(state.get_edge_owner(edge) == player_index
+                                                  for edge in board.get_vertex_edges(vertex)))]
+                        self.assertEqual(mask_to_list(state.get_buildable_settlement_mask(player_index, setup)),
+                                         vertices)
+                    self.assertEqual(state.get_buildable_road_mask(player_index),
+                                     state.compute_buildable_road_mask(player_index))
+                # give out extra resources so the players build more often
+                state.add_resource(state.get_current_player(), RESOURCE_TYPES[move % NUMBER_OF_RESOURCES], 1)
+                apply(state, player.choose_action(state))
+
+            loaded = GameState.from_bytes(state.to_bytes())
+            for player_index in range(state.get_number_of_players()):
+                self.assertEqual(loaded.get_buildable_road_mask(player_index),
+                                 state.get_buildable_road_mask(player_index))
+                self.assertEqual(loaded.get_buildable_settlement_mask(player_index),
+                                 state.get_buildable_settlement_mask(player_index))
+
+    def test27(self):
+        """Testing that the longest road is measured as roads are built and cut, and that it is worth two victory
+        points to the only player with a road of five or more"""
+        state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], 27)
+        board = state.get_board()
+
+        # a road of six vertices in a row that never turns back on itself
+        vertices = [0]
+        edges = []
+        while len(edges) < 5:
+            for edge in board.get_vertex_edges(vertices[-1]):
+                next_vertex = [vertex for vertex in board.get_edge_vertices(edge) if vertex != vertices[-1]][0]
+                if next_vertex not in vertices and \
+                        all(next_vertex not in board.get_vertex_neighbours(vertex) for vertex in vertices[:-1]):
+                    vertices.append(next_vertex)
+                    edges.append(edge)
+                    break
+
+        self.assertTrue(state.build_settlement(0, vertices[0], setup=True))
+        for count, edge in enumerate(edges, 1):
+            self.assertTrue(state.build_road(0, edge, setup=True))
+            self.assertEqual(state.get_road_length(0), count)
+        self.assertEqual(state.get_longest_road_player(), 0)
+        self.assertEqual(state.get_victory_points(0), 1 + LONGEST_ROAD_POINTS)
+        self.assertEqual(state.get_hash(), state.compute_hash())
+
+        # another player's settlement in the middle of the road cuts it in two and the award is lost
+        self.assertTrue(state.build_settlement(1, vertices[3], setup=True))
+        self.assertEqual(state.get_road_length(0), 3)
+        self.assertEqual(len(state.get_road_pieces(0)), 2)
+        self.assertIsNone(state.get_longest_road_player())
+        self.assertEqual(state.get_victory_points(0), 1)
+        self.assertEqual(state.get_hash(), state.compute_hash())
+
+        # the incremental lengths match the roads measured from scratch in played games
+        for seed in range(3):
+            state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], seed)
+            player = RandomPlayer(seed)
+            for move in range(1500):
+                if is_terminal(state):
+                    break
+                state.add_resource(state.get_current_player(), RESOURCE_TYPES[move % NUMBER_OF_RESOURCES], 1)
+                apply(state, player.choose_action(state))
+            loaded = GameState.from_bytes(state.to_bytes())
+            self.assertEqual(loaded.get_longest_road_player(), state.get_longest_road_player())
+            self.assertEqual(loaded.get_hash(), state.get_hash())
+            for player_index in range(state.get_number_of_players()):
+                self.assertEqual(loaded.get_road_length(player_index), state.get_road_length(player_index))
+                points = len(loaded.get_player(player_index).get_settlements()) + \
+                    2 * len(loaded.get_player(player_index).get_cities())
+                if state.get_longest_road_player() == player_index:
+                    points += LONGEST_ROAD_POINTS
+                self.assertEqual(state.get_victory_points(player_index), points)
+
+    def test28(self):
+        """Testing that the opening evaluator works out each vertex's expected yield from the number tokens and
+        drafts legal setup settlements on many boards at once"""
+        states = [new_game(["Player 1", "Player 2", "Player 3", "Player 4"], seed) for seed in range(10)]
+        evaluator = OpeningEvaluator.from_states(states)
+        pips = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
+        for game, state in enumerate(states):
+            board = state.get_board()
+            for vertex in range(board.get_number_of_vertices()):
+                expected = dict.fromkeys(RESOURCE_TYPES, 0.0)
+                for tile in board.get_vertex_tiles(vertex):
+                    if board.get_tile_number(tile) is not None:
+                        expected[board.get_tile_type(tile)] += pips[board.get_tile_number(tile)] / 36
+                for resource_index, resource in enumerate(RESOURCE_TYPES):
+                    self.assertAlmostEqual(evaluator.get_vertex_yield()[game, vertex, resource_index],
+                                           expected[resource])
+                self.assertEqual(evaluator.get_vertex_diversity()[game, vertex],
+                                 len([amount for amount in expected.values() if amount > 0]))
+
+        # the greedy draft only picks legal vertices and the first pick is the top ranked vertex of the empty board
+        picks, player_yield = evaluator.play_snake_draft()
+        legal = evaluator.get_legal_vertices(np.zeros((len(states), 54), dtype=bool))
+        self.assertEqual(picks[:, 0].tolist(), evaluator.rank_placements(legal)[:, 0].tolist())
+        for game, state in enumerate(states):
+            for pick in picks[game]:
+                self.assertTrue(state.can_build_settlement(0, int(pick), setup=True))
+                state.build_settlement(0, int(pick), setup=True)
+        self.assertTrue((player_yield > 0).all())
+
+        # the opening chosen for a GameState is one of its legal setup settlements
+        state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], 28)
+        while state.get_phase() != ROLL_PHASE:
+            if state.get_phase() == SETUP_SETTLEMENT_PHASE:
+                action = (BUILD_SETTLEMENT, choose_opening(state))
+                self.assertIn(action, legal_actions(state))
+            else:
+                action = legal_actions(state)[0]
+            apply(state, action)
+
+        # computer players can place their setup settlements with the evaluator
+        self.assertEqual(parse_player_config("mcts:evaluate_openings=1"), ("mcts", {"evaluate_openings": 1}))
+        for player in (RandomPlayer(28, evaluate_openings=True), MCTSPlayer(iterations=10, evaluate_openings=True)):
+            state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], 28)
+            self.assertEqual(player.choose_action(state), (BUILD_SETTLEMENT, choose_opening(state)))
+
+        # thousands of shuffled boards are scored together
+        batch = BatchSimulator(2000, seed=28)
+        batch.create_boards()
+        picks, player_yield = OpeningEvaluator.from_batch(batch).play_snake_draft()
+        self.assertEqual(picks.shape, (2000, 8))
+        self.assertEqual(player_yield.shape, (2000, 4))
+
+    def test29(self):
+        """Testing that the board generator only makes boards with the 6s and 8s apart, no resource over the pip limit
+        and no tile next to more than one tile of its own resource"""
+        generator = BoardGenerator(seed=29)
+        tile_resource, tile_number = generator.generate(5000)
+        self.assertTrue(generator.check_boards(tile_resource, tile_number).all())
+        # repairs only move tiles around, so every board still has the tiles of a normal board
+        self.assertTrue(((tile_resource == -1) == (tile_number == 0)).all())
+        for resource_index, tile_type in enumerate(RESOURCE_TYPES):
+            self.assertTrue(((tile_resource == resource_index).sum(axis=1) == TILE_TYPES.count(tile_type)).all())
+        self.assertEqual(sorted(tile_number[0].tolist()), sorted(NUMBER_TOKENS + [0]))
+
+        pips = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
+        topology = get_topology()
+        for game in range(50):
+            tile_types, tile_numbers = board_tiles(tile_resource[game], tile_number[game])
+            state = new_game(["Player 1", "Player 2", "Player 3", "Player 4"], game, tile_types, tile_numbers)
+            board = state.get_board()
+            self.assertEqual(board.get_tile_type(state.get_robber_tile()), DESERT)
+            for resource in RESOURCE_TYPES:
+                self.assertLessEqual(sum(pips[board.get_tile_number(tile)] for tile in range(19)
+                                         if board.get_tile_type(tile) == resource), 15)
+            for tile in range(19):
+                neighbours = topology.get_tile_neighbours(tile)
+                if board.get_tile_number(tile) in (6, 8):
+                    self.assertNotIn(6, [board.get_tile_number(neighbour) for neighbour in neighbours])
+                    self.assertNotIn(8, [board.get_tile_number(neighbour) for neighbour in neighbours])
+                if board.get_tile_type(tile) != DESERT:
+                    self.assertLessEqual([board.get_tile_type(neighbour) for neighbour in neighbours]
+                                         .count(board.get_tile_type(tile)), 1)
+
+        # the same seed generates the same boards and a rule can be turned off
+        self.assertEqual(BoardGenerator(seed=3).create_tiles(), BoardGenerator(seed=3).create_tiles())
+        unlimited = BoardGenerator(seed=29, max_resource_pips=None, max_same_neighbours=None)
+        tile_resource, tile_number = unlimited.generate(1000)
+        self.assertFalse(generator.check_boards(tile_resource, tile_number).all())
+        self.assertRaises(ValueError, BoardGenerator, max_resource_pips=5)
+
+        batch = BatchSimulator(1000, seed=29)
+        batch.set_boards(tile_resource, tile_number)
+        self.assertEqual(batch.get_tile_resource()[np.arange(1000), batch.get_robber()].tolist(), [-1] * 1000)
+
+    def test30(self):
+        """Testing that the game server plays several games at once over TCP, turns away actions that are not allowed
+        and plays for a player who does not act before the turn timeout"""
+        async def play_on_server():
+            server = GameServer(port=0, seed=30)
+            await server.start()
+            try:
+                results = await play_games(port=server.get_port(), number_of_games=3, number_of_players=4, seed=30)
+                self.assertEqual(len(results), 3)
+                for result in results:
+                    self.assertEqual(result["phase"], GAME_OVER_PHASE)
+                    self.assertGreaterEqual(result["victory_points"][result["winner"]], 10)
+                self.assertEqual(server.get_finished_games(), 3)
+                self.assertEqual(server.get_games(), {})
+
+                client = await GameClient.connect(port=server.get_port())
+                await client.send({"command": "create", "players": 7})
+                self.assertEqual((await client.receive_type("error"))["reason"], "a game has 2 to 4 players")
+                await client.send({"command": "create", "players": True})
+                self.assertEqual((await client.receive_type("error"))["reason"], "a game has 2 to 4 players")
+                game_id = await client.create_game(2)
+                self.assertEqual(await client.join_game(game_id, "player"), 0)
+                await client.play_action(game_id, ["roll_dice"])
+                self.assertEqual((await client.receive_type("error"))["reason"], "the game has not started")
+                self.assertEqual(await client.list_games(), [{"game": game_id, "free_seats": 1}])
+                self.assertEqual(await client.join_game(game_id, "player"), 1)
+                await client.play_action(game_id, ["roll_dice"])
+                self.assertEqual((await client.receive_type("error"))["reason"], "that action is not allowed")
+
+                # a malformed message is answered with an error and the client keeps its seats
+                await client.send({"command": "action", "game": [1]})
+                self.assertEqual((await client.receive_type("error"))["reason"], "no such game")
+                await client.send({"command": "action", "game": game_id, "action": [["build_road"], {}]})
+                self.assertEqual((await client.receive_type("error"))["reason"], "that action is not allowed")
+                await client.send({"command": "action", "game": game_id, "action": ["build_road", True]})
+                self.assertEqual((await client.receive_type("error"))["reason"],
+                                 "an action is a list starting with the action type")
+                await client.request_state(game_id)
+                self.assertEqual((await client.receive_type("state"))["game"], game_id)
+                self.assertEqual(await client.list_games(), [])
+                await client.close()
+            finally:
+                await server.close()
+
+        async def play_with_silent_player():
+            # the silent player never acts, so the turn timeout plays every one of their turns
+            server = GameServer(port=0, seed=30, turn_timeout=0.001)
+            await server.start()
+            try:
+                client = await GameClient.connect(port=server.get_port())
+                game_id = await client.create_game(2)
+                self.assertEqual(await client.join_game(game_id, "silent"), 0)
+                result = await play_random_player("127.0.0.1", server.get_port(), game_id, "random", 30)
+                self.assertEqual(result["phase"], GAME_OVER_PHASE)
+                self.assertEqual(server.get_finished_games(), 1)
+                await client.close()
+            finally:
+                await server.close()
+
+        async def leave_games_unstarted():
+            # games that are never started are closed after the join timeout, and a connection can not keep creating
+            # games without them being played
+            server = GameServer(port=0, seed=30, join_timeout=1.0)
+            await server.start()
+            try:
+                client = await GameClient.connect(port=server.get_port())
+                game_ids = [await client.create_game(2) for game in range(MAX_OPEN_GAMES)]
+                await client.send({"command": "create", "players": 2})
+                self.assertEqual((await client.receive_type("error"))["reason"],
+                                 "you already have " + str(MAX_OPEN_GAMES) + " games waiting for players")
+                # true is not read as game 1
+                await client.send({"command": "join", "game": True, "name": "player"})
+                self.assertEqual((await client.receive_type("error"))["reason"], "no such game")
+                self.assertEqual(await client.join_game(game_ids[0], "player"), 0)
+                self.assertEqual(await client.receive_type("closed"), {"type": "closed", "game": game_ids[0]})
+                self.assertNotIn(game_ids[0], server.get_games())
+                self.assertEqual(server.get_finished_games(), 0)
+                self.assertEqual(await client.create_game(2), MAX_OPEN_GAMES + 1)
+                await client.close()
+            finally:
+                await server.close()
+
+        asyncio.run(play_on_server())
+        asyncio.run(play_with_silent_player())
+        asyncio.run(leave_games_unstarted())
+
+    def test31(self):
+        """Testing that a search game from SearchRules lists the same legal actions as the GameState and keeps the same
+        placement masks, resources and production through whole random games"""
+        for seed in range(3):
+            state = new_game(["p1", "p2", "p3", "p4"], seed=seed)
+            rules = SearchRules(state)
+            game = rules.create_game(state)
+            random_player = RandomPlayer(seed=seed)
+            board = state.get_board()
+            while not is_terminal(state):
+                self.assertEqual(rules.legal_actions(game), legal_actions(state))
+                for player_index in range(4):
+                    start = PLAYERS_START + player_index * PLAYER_SIZE
+                    self.assertEqual(game[start:start + NUMBER_OF_RESOURCES],
+                                     state.get_resource_counts()[player_index * NUMBER_OF_RESOURCES:
+                                                                 (player_index + 1) * NUMBER_OF_RESOURCES])
+                    # the search game leaves the longest road award with the player who held it when it was made
+                    longest_road_points = LONGEST_ROAD_POINTS if state.get_player(player_index).has_longest_road() \
+                        else 0
+                    self.assertEqual(game[start + VICTORY_POINTS],
+                                     state.get_victory_points(player_index) - longest_road_points)
+                    self.assertEqual(game[start + BUILDABLE_ROAD_MASK], state.get_buildable_road_mask(player_index))
+                    self.assertEqual(game[start + ROAD_END_MASK], state.get_road_vertex_mask(player_index))
+                    production = 0.0
+                    for vertex in mask_to_list(state.get_settlement_mask(player_index)) + \
+                            2 * mask_to_list(state.get_city_mask(player_index)):
+                        for tile in board.get_vertex_tiles(vertex):
+                            if tile != state.get_robber_tile() and board.get_tile_number(tile):
+                                production += DICE_PROBABILITIES[board.get_tile_number(tile)]
+                    self.assertAlmostEqual(rules.get_production(game)[player_index], production)
+                self.assertEqual(game[OPEN_MASK], state.get_open_mask())
 
+                action = random_player.choose_action(state)
+                self.assertTrue(apply(state, action))
+                rules.play(game, action, state.get_last_roll())
+            # the winner may only have reached the winning points with the longest road award
+            winner_start = PLAYERS_START + state.get_current_player() * PLAYER_SIZE
+            self.assertEqual(rules.legal_actions(game) == [],
+                             game[winner_start + VICTORY_POINTS] >= WINNING_VICTORY_POINTS)
 
+        # the playouts finish setup with a settlement and a road for every player, which keep the same masks as the
+        # GameState when they are placed with apply
+        for seed in range(4):
+            state = new_game(["p1", "p2", "p3", "p4"], seed=seed)
+            rules = SearchRules(state)
+            game = rules.create_game(state)
+            rules.finish_setup(game, random.Random(seed).random)
+            self.assertEqual(game[PHASE], ROLL_PHASE)
+            self.assertEqual(game[CURRENT_PLAYER], 0)
+            board = state.get_board()
+            settlements = [mask_to_list(game[PLAYERS_START + player_index * PLAYER_SIZE + SETTLEMENT_MASK])
+                           for player_index in range(4)]
+            roads = [mask_to_list(game[PLAYERS_START + player_index * PLAYER_SIZE + PLAYER_ROAD_MASK])
+                     for player_index in range(4)]
+            for player_index in [0, 1, 2, 3, 3, 2, 1, 0]:
+                vertex = settlements[player_index].pop()
+                self.assertTrue(apply(state, (BUILD_SETTLEMENT, vertex)))
+                edge = [edge for edge in roads[player_index] if vertex in board.get_edge_vertices(edge)][0]
+                self.assertTrue(apply(state, (BUILD_ROAD, edge)))
+            self.assertEqual(state.get_phase(), ROLL_PHASE)
+            self.assertEqual(game[OPEN_MASK], state.get_open_mask())
+            for player_index in range(4):
+                start = PLAYERS_START + player_index * PLAYER_SIZE
+                self.assertEqual(game[start + VICTORY_POINTS], state.get_victory_points(player_index))
+                self.assertEqual(game[start + ROAD_END_MASK], state.get_road_vertex_mask(player_index))
+                self.assertEqual(game[start + BUILDABLE_ROAD_MASK], state.get_buildable_road_mask(player_index))
+            self.assertEqual(rules.get_production(game), rules.get_production(rules.create_game(state)))
 
 if __name__ == '__main__':
     unittest()
\ No newline at end of file
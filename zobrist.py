@@ -0,0 +1,130 @@
+# Author: Joanna Getek
+# Last Modified: 10/18/2026
+# Description: Random 64-bit keys for Zobrist hashing of a GameState. The hash of a position is the XOR of the keys
+# of everything in it, so when one thing changes the GameState updates its hash by XOR-ing out the old key and XOR-ing
+# in the new one instead of hashing the whole game again.
+# Zobrist hashing: https://en.wikipedia.org/wiki/Zobrist_hashing
+
+import random
+from board_topology import get_topology
+
+# The keys are drawn from a fixed seed so the same position has the same hash in every process and every run
+ZOBRIST_SEED = 0x5EED
+
+# Most players a game can have keys for
+MAX_PLAYERS = 8
+
+# Resource counts have keys from 0 to RESOURCE_COUNT_KEYS - 1, larger counts wrap around and reuse the same keys
+RESOURCE_COUNT_KEYS = 256
+
+# Phases and tile types the keys are made for, kept here so this module does not import game_state
+PHASE_NAMES = ["setup_settlement", "setup_road", "roll", "robber", "build", "game_over"]
+TILE_TYPE_NAMES = ["wheat", "brick", "wood", "wool", "ore", "desert"]
+NUMBER_OF_RESOURCES = 5
+
+
+class ZobristKeys:
+    """
+    The random keys for every part of a game that goes into its hash
+
+    Settlement keys, city keys and road keys hold a list of keys for each player, with one key for each vertex or edge
+    Robber keys hold a key for each tile and last settlement keys hold a key for each vertex
+    Resource keys hold RESOURCE_COUNT_KEYS keys for each player and resource, in the same flat order as the
+    GameState resources list, so the key for a count is resource_keys[player * 5 + resource][count]
+    Player keys hold a key for each current player and phase keys hold a key for each phase name
+    Tile type keys and tile number keys hold a key for each tile type or number on each tile, so games on different
+    boards hash differently
+    Longest road keys hold a key for each player holding the longest road
+    """
+    def __init__(self, topology=None, seed=ZOBRIST_SEED):
+        if topology is None:
+            topology = get_topology()
+        generator = random.Random(seed)
+
+        def new_keys(count):
+            return tuple(generator.getrandbits(64) for index in range(count))
+
+        number_of_tiles = topology.get_number_of_tiles()
+        number_of_vertices = topology.get_number_of_vertices()
+        number_of_edges = topology.get_number_of_edges()
+
+        self._settlement_keys = tuple(new_keys(number_of_vertices) for player in range(MAX_PLAYERS))
+        self._city_keys = tuple(new_keys(number_of_vertices) for player in range(MAX_PLAYERS))
+        self._road_keys = tuple(new_keys(number_of_edges) for player in range(MAX_PLAYERS))
+        self._robber_keys = new_keys(number_of_tiles)
+        self._last_settlement_keys = new_keys(number_of_vertices)
+        self._resource_keys = tuple(new_keys(RESOURCE_COUNT_KEYS) for slot in range(MAX_PLAYERS * NUMBER_OF_RESOURCES))
+        self._player_keys = new_keys(MAX_PLAYERS)
+        self._phase_keys = dict(zip(PHASE_NAMES, new_keys(len(PHASE_NAMES))))
+        self._tile_type_keys = {tile_type: new_keys(number_of_tiles) for tile_type in TILE_TYPE_NAMES}
+        self._tile_number_keys = tuple(new_keys(number_of_tiles) for number in range(13))
+        # drawn last so adding them did not change any of the other keys
+        self._longest_road_keys = new_keys(MAX_PLAYERS)
+
+    def get_settlement_key(self, player_index, vertex):
+        return self._settlement_keys[player_index][vertex]
+
+    def get_city_key(self, player_index, vertex):
+        return self._city_keys[player_index][vertex]
+
+    def get_road_key(self, player_index, edge):
+        return self._road_keys[player_index][edge]
+
+    def get_robber_key(self, tile):
+        """
+        Returns the key of the tile the robber is on, 0 before the robber is placed
+        """
+        if tile is None:
+            return 0
+        return self._robber_keys[tile]
+
+    def get_last_settlement_key(self, vertex):
+        """
+        Returns the key of the vertex of the last setup settlement, 0 when there is none
+        """
+        if vertex is None:
+            return 0
+        return self._last_settlement_keys[vertex]
+
+    def get_resource_key(self, slot, count):
+        """
+        Returns the key for holding count of a resource, slot is the position in the GameState resources list
+        """
+        return self._resource_keys[slot][count % RESOURCE_COUNT_KEYS]
+
+    def get_player_key(self, player_index):
+        return self._player_keys[player_index]
+
+    def get_phase_key(self, phase):
+        return self._phase_keys[phase]
+
+    def get_longest_road_key(self, player_index):
+        """
+        Returns the key of the player holding the longest road, 0 when no one holds it
+        """
+        if player_index is None:
+            return 0
+        return self._longest_road_keys[player_index]
+
+    def get_tile_key(self, tile, tile_type, number):
+        """
+        Returns the key of a tile with the given type and number token, the desert has no number
+        """
+        key = self._tile_type_keys[tile_type][tile]
+        if number is not None:
+            key ^= self._tile_number_keys[number][tile]
+        return key
+
+
+# The keys are the same for every game, so they are only created once
+_zobrist_keys = None
+
+
+def get_zobrist_keys():
+    """
+    Returns the ZobristKeys of the standard board, every game in the process shares the same object
+    """
+    global _zobrist_keys
+    if _zobrist_keys is None:
+        _zobrist_keys = ZobristKeys()
+    return _zobrist_keys